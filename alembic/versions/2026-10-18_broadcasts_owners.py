@@ -0,0 +1,28 @@
+"""broadcasts_owners
+
+Revision ID: b5d3f9a1c7e2
+Revises: 8f1d2a6c4e37
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d3f9a1c7e2'
+down_revision: Union[str, None] = '8f1d2a6c4e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('broadcasts', sa.Column('owner', sa.String(), nullable=True))
+    op.add_column('broadcasts', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('broadcasts', 'heartbeat_at')
+    op.drop_column('broadcasts', 'owner')
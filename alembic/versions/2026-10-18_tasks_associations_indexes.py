@@ -0,0 +1,53 @@
+"""tasks_associations_indexes
+
+Revision ID: 3c9e1b7d5a24
+Revises: f2f477c10da8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1b7d5a24'
+down_revision: Union[str, None] = 'f2f477c10da8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Predicate of active tasks associations, frozen as it was compiled from ORM at the moment of this revision:
+POSTGRESQL_ACTIVE_PREDICATE: str = 'NOT task_completed AND NOT task_archived'
+SQLITE_ACTIVE_PREDICATE: str = 'task_completed = 0 AND task_archived = 0'
+
+
+def upgrade() -> None:
+    # Removing possible duplicates of (user_id, task_id) pairs, which would break unique index creation:
+    op.execute(
+        'DELETE FROM tasks_associations WHERE id NOT IN '
+        '(SELECT MIN(id) FROM tasks_associations GROUP BY user_id, task_id)'
+    )
+
+    op.create_index(
+        'ix_tasks_associations_user_id_task_id',
+        'tasks_associations',
+        ['user_id', 'task_id'],
+        unique=True
+    )
+    op.create_index('ix_tasks_associations_task_id', 'tasks_associations', ['task_id'], unique=False)
+
+    op.create_index(
+        'ix_tasks_associations_active_user_id',
+        'tasks_associations',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text(POSTGRESQL_ACTIVE_PREDICATE),
+        sqlite_where=sa.text(SQLITE_ACTIVE_PREDICATE)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_associations_active_user_id', table_name='tasks_associations')
+    op.drop_index('ix_tasks_associations_task_id', table_name='tasks_associations')
+    op.drop_index('ix_tasks_associations_user_id_task_id', table_name='tasks_associations')
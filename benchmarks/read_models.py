@@ -0,0 +1,198 @@
+"""
+Benchmark of read requests: ORM entities, built by repositories, against rows, returned by read models.
+
+Dataset is created in in-memory SQLite database and contains USERS_COUNT * TASKS_COUNT tasks associations.
+Run from project's root directory:
+
+    python -m benchmarks.read_models
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Sequence
+from dotenv import load_dotenv
+from sqlalchemy import insert
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+
+# Database config is required by src modules on import, so test environments are used:
+load_dotenv('.env.test')
+
+USERS_COUNT: int = 1_000
+TASKS_COUNT: int = 100
+CHUNK_SIZE: int = 10_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds
+
+
+async def fill_database(engine: AsyncEngine) -> None:
+    from src.core.database.metadata import metadata
+    from src.tasks.adapters.orm import tasks_table, tasks_associations_table
+    from src.users.adapters.orm import users_table
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(
+            insert(users_table),
+            [
+                {
+                    'id': user_id,
+                    'is_bot': False,
+                    'first_name': f'first_name_{user_id}',
+                    'full_name': f'full_name_{user_id}',
+                    'url': f'https://t.me/username_{user_id}',
+                    'role': 'default'
+                } for user_id in range(1, USERS_COUNT + 1)
+            ]
+        )
+        await conn.execute(
+            insert(tasks_table),
+            [{'id': task_id, 'description': f'task_{task_id}'} for task_id in range(1, TASKS_COUNT + 1)]
+        )
+
+        tasks_associations: List[Dict[str, int]] = [
+            {
+                'user_id': user_id,
+                'task_id': task_id
+            } for user_id in range(1, USERS_COUNT + 1) for task_id in range(1, TASKS_COUNT + 1)
+        ]
+        for start in range(0, len(tasks_associations), CHUNK_SIZE):
+            await conn.execute(insert(tasks_associations_table), tasks_associations[start: start + CHUNK_SIZE])
+
+
+async def orm_user_tasks_statistics(session: AsyncSession, user_id: int) -> int:
+    from src.tasks.adapters.repositories import SQLAlchemyTasksRepository, SQLAlchemyTasksAssociationsRepository
+    from src.tasks.domain.models import TaskModel, TaskAssociationModel
+
+    tasks: Dict[int, TaskModel] = {task.id: task for task in await SQLAlchemyTasksRepository(session=session).list()}
+    tasks_associations: List[TaskAssociationModel] = await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).get_tasks_associations_by_user_id(
+        user_id=user_id
+    )
+
+    return len(
+        [
+            (tasks[task_association.task_id].description, task_association.task_completed)
+            for task_association in tasks_associations if not task_association.task_archived
+        ]
+    )
+
+
+async def read_model_user_tasks_statistics(session: AsyncSession, user_id: int) -> int:
+    from src.tasks.adapters.read_models import SQLAlchemyTasksReadModel
+
+    return len(await SQLAlchemyTasksReadModel(session=session).get_user_tasks_statistics(user_id=user_id))
+
+
+async def orm_user_active_tasks(session: AsyncSession, user_id: int) -> int:
+    from src.tasks.adapters.repositories import SQLAlchemyTasksRepository, SQLAlchemyTasksAssociationsRepository
+    from src.tasks.domain.models import TaskModel, TaskAssociationModel
+
+    tasks: Dict[int, TaskModel] = {task.id: task for task in await SQLAlchemyTasksRepository(session=session).list()}
+    tasks_associations: List[TaskAssociationModel] = await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).get_tasks_associations_by_user_id(
+        user_id=user_id
+    )
+
+    return len(
+        [
+            (task_association.id, tasks[task_association.task_id].description)
+            for task_association in tasks_associations if
+            not (task_association.task_archived or task_association.task_completed)
+        ]
+    )
+
+
+async def read_model_user_active_tasks(session: AsyncSession, user_id: int) -> int:
+    from src.tasks.adapters.read_models import SQLAlchemyTasksReadModel
+
+    return len(await SQLAlchemyTasksReadModel(session=session).get_user_active_tasks(user_id=user_id))
+
+
+async def orm_all_users(session: AsyncSession, user_id: int) -> int:
+    from src.users.adapters.repositories import SQLAlchemyUsersRepository
+
+    return len(await SQLAlchemyUsersRepository(session=session).list())
+
+
+async def read_model_all_users(session: AsyncSession, user_id: int) -> int:
+    from src.users.adapters.read_models import SQLAlchemyUsersReadModel
+
+    return len(await SQLAlchemyUsersReadModel(session=session).get_all_users())
+
+
+async def measure(
+        name: str,
+        session_factory: async_sessionmaker,
+        read: Callable[[AsyncSession, int], Awaitable[int]],
+        users_ids: Sequence[int]
+) -> BenchmarkResult:
+    """
+    Every read is performed in its own session, as it happens upon read request of user.
+    """
+
+    rows: int = 0
+    start: float = time.perf_counter()
+    for user_id in users_ids:
+        async with session_factory() as session:
+            rows += await read(session, user_id)
+
+    return BenchmarkResult(name=name, rows=rows, seconds=time.perf_counter() - start)
+
+
+async def main() -> None:
+    from src.tasks.adapters.orm import start_mappers as start_tasks_mappers
+    from src.users.adapters.orm import start_mappers as start_users_mappers
+
+    try:
+        start_users_mappers()
+        start_tasks_mappers()
+    except ArgumentError:
+        pass
+
+    engine: AsyncEngine = create_async_engine('sqlite+aiosqlite://')
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    await fill_database(engine=engine)
+
+    all_users_ids: List[int] = list(range(1, USERS_COUNT + 1))
+    users_list_reads: List[int] = all_users_ids[:100]
+    benchmarks: List[List[BenchmarkResult]] = [
+        [
+            await measure('stats, orm', session_factory, orm_user_tasks_statistics, all_users_ids),
+            await measure('stats, read model', session_factory, read_model_user_tasks_statistics, all_users_ids),
+        ],
+        [
+            await measure('active tasks, orm', session_factory, orm_user_active_tasks, all_users_ids),
+            await measure('active tasks, read model', session_factory, read_model_user_active_tasks, all_users_ids),
+        ],
+        [
+            await measure('users list, orm', session_factory, orm_all_users, users_list_reads),
+            await measure('users list, read model', session_factory, read_model_all_users, users_list_reads),
+        ]
+    ]
+
+    await engine.dispose()
+
+    print(f'{"benchmark":<28}{"rows":>10}{"seconds":>10}{"rows/sec":>14}')
+    for before, after in benchmarks:
+        for result in (before, after):
+            print(f'{result.name:<28}{result.rows:>10}{result.seconds:>10.2f}{result.rows_per_second:>14.0f}')
+
+        print(f'{"speed-up":<28}{after.rows_per_second / before.rows_per_second:>34.2f}x')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
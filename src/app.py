@@ -1,12 +1,17 @@
 from aiogram import Dispatcher
 
 from src.help.entrypoints.router import help_router
+from src.lifespan import on_dispatcher_startup, on_dispatcher_shutdown
+from src.middlewares import UnitOfWorkMiddleware
 from src.tasks.entrypoints.router import tasks_router
 from src.users.entrypoints.router import users_router
 from src.clean.entrypoints.router import clean_router
 
 
 dispatcher: Dispatcher = Dispatcher()
+dispatcher.update.outer_middleware(UnitOfWorkMiddleware())
+dispatcher.startup.register(on_dispatcher_startup)
+dispatcher.shutdown.register(on_dispatcher_shutdown)
 dispatcher.include_router(users_router)
 dispatcher.include_router(tasks_router)
 dispatcher.include_router(help_router)
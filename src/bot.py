@@ -4,8 +4,17 @@ from aiogram.enums import ParseMode
 from aiogram.methods import GetUpdates, GetMe
 
 from src.config import bot_config
-from src.middlewares import RequestLoggingMiddleware
+from src.middlewares import RateLimiterMiddleware, RequestLoggingMiddleware
 
 # Initialize Bot instance with default bot properties which will be passed to all API calls
 TopvisorBot: Bot = Bot(token=bot_config.TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
 TopvisorBot.session.middleware(RequestLoggingMiddleware(ignore_methods=[GetUpdates, GetMe]))
+TopvisorBot.session.middleware(
+    RateLimiterMiddleware(
+        global_rate=bot_config.RATE_LIMIT_GLOBAL,
+        chat_rate=bot_config.RATE_LIMIT_PER_CHAT,
+        chat_burst=bot_config.RATE_LIMIT_PER_CHAT_BURST,
+        max_retries=bot_config.RATE_LIMIT_MAX_RETRIES,
+        background_rate_share=bot_config.RATE_LIMIT_BACKGROUND_SHARE
+    )
+)
@@ -0,0 +1,41 @@
+from sqlalchemy import Table, Column, String, DateTime, Integer, BigInteger
+from datetime import datetime, timezone
+
+from src.broadcasts.constants import BroadcastStatuses
+from src.core.database.metadata import mapper_registry
+
+
+broadcasts_table = Table(
+    'broadcasts',
+    mapper_registry.metadata,
+    Column('id', Integer, autoincrement=True, primary_key=True, nullable=False, unique=True),
+    Column('text', String, nullable=False),
+    Column('admin_id', BigInteger, nullable=False),
+    Column('status', String, nullable=False, default=BroadcastStatuses.IN_PROGRESS, index=True),
+    Column('last_user_id', BigInteger, nullable=True),
+    Column('delivered', Integer, nullable=False, default=0),
+    Column('failed', Integer, nullable=False, default=0),
+    Column('blocked', Integer, nullable=False, default=0),
+    Column('owner', String, nullable=True),
+    Column('heartbeat_at', DateTime(timezone=True), nullable=True),
+    Column('created_at', DateTime(timezone=True), nullable=False, default=datetime.now(tz=timezone.utc)),
+    Column(
+        'updated_at',
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.now(tz=timezone.utc),
+        onupdate=datetime.now(tz=timezone.utc)
+    )
+)
+
+
+def start_mappers():
+    """
+    Map all domain models to ORM models, for purpose of using domain models directly during work with the database,
+    according to DDD.
+    """
+
+    # Imports here not to ruin alembic logics. Also, only for mappers they needed:
+    from src.broadcasts.domain.models import BroadcastModel
+
+    mapper_registry.map_imperatively(class_=BroadcastModel, local_table=broadcasts_table)
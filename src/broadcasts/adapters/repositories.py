@@ -0,0 +1,134 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Any
+from sqlalchemy import insert, select, delete, update, or_, Result, RowMapping, Row, Select
+
+from src.broadcasts.adapters.orm import broadcasts_table
+from src.broadcasts.constants import BroadcastStatuses
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.interfaces.repositories import BroadcastsRepository
+from src.core.database.interfaces.repositories import SQLAlchemyAbstractRepository
+from src.core.interfaces import AbstractModel
+
+
+class SQLAlchemyBroadcastsRepository(SQLAlchemyAbstractRepository, BroadcastsRepository):
+
+    async def get(self, id: int) -> Optional[BroadcastModel]:
+        result: Result = await self._session.execute(select(BroadcastModel).filter_by(id=id))
+        return result.scalar_one_or_none()
+
+    async def add(self, model: AbstractModel) -> BroadcastModel:
+        result: Result = await self._session.execute(
+            insert(BroadcastModel).values(**await model.to_dict(exclude={'id'})).returning(BroadcastModel)
+        )
+
+        return result.scalar_one()
+
+    async def update(self, id: int, model: AbstractModel) -> BroadcastModel:
+        result: Result = await self._session.execute(
+            update(BroadcastModel).filter_by(id=id).values(**await model.to_dict(exclude={'id'})).returning(
+                BroadcastModel
+            )
+        )
+
+        return result.scalar_one()
+
+    async def delete(self, id: int) -> None:
+        await self._session.execute(delete(BroadcastModel).filter_by(id=id))
+
+    async def list(self) -> List[BroadcastModel]:
+        result: Result = await self._session.execute(select(BroadcastModel))
+        broadcasts: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(broadcasts, List)
+        for broadcast in broadcasts:
+            assert isinstance(broadcast, BroadcastModel)
+
+        return broadcasts
+
+    async def stream(self) -> AsyncIterator[BroadcastModel]:
+        """
+        Fetches broadcasts from database by batches. Should not be used within read only units of work.
+        """
+
+        async for broadcast in self._stream_scalars(query=select(BroadcastModel).order_by(broadcasts_table.c.id)):
+            assert isinstance(broadcast, BroadcastModel)
+            yield broadcast
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[BroadcastModel]:
+        query: Select = select(BroadcastModel).order_by(broadcasts_table.c.id).limit(limit)
+        if after_id is not None:
+            query = query.where(broadcasts_table.c.id > after_id)
+
+        result: Result = await self._session.execute(query)
+        broadcasts: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(broadcasts, List)
+        for broadcast in broadcasts:
+            assert isinstance(broadcast, BroadcastModel)
+
+        return broadcasts
+
+    async def list_unfinished(self) -> List[BroadcastModel]:
+        result: Result = await self._session.execute(
+            select(
+                BroadcastModel
+            ).where(
+                broadcasts_table.c.status == BroadcastStatuses.IN_PROGRESS
+            ).order_by(
+                broadcasts_table.c.id
+            )
+        )
+        broadcasts: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(broadcasts, List)
+        for broadcast in broadcasts:
+            assert isinstance(broadcast, BroadcastModel)
+
+        return broadcasts
+
+    async def claim_unfinished(
+            self,
+            owner: str,
+            heartbeat_at: datetime,
+            stale_before: datetime
+    ) -> List[BroadcastModel]:
+
+        result: Result = await self._session.execute(
+            update(
+                BroadcastModel
+            ).where(
+                broadcasts_table.c.status == BroadcastStatuses.IN_PROGRESS,
+                or_(broadcasts_table.c.owner.is_(None), broadcasts_table.c.heartbeat_at < stale_before)
+            ).values(
+                owner=owner,
+                heartbeat_at=heartbeat_at
+            ).returning(
+                BroadcastModel
+            ).execution_options(
+                synchronize_session=False
+            )
+        )
+        broadcasts: List[BroadcastModel] = []
+        for broadcast in result.scalars().all():
+            assert isinstance(broadcast, BroadcastModel)
+            broadcasts.append(broadcast)
+
+        return sorted(broadcasts, key=lambda broadcast: broadcast.id)
+
+    async def update_owned(self, id: int, model: AbstractModel, owner: str) -> Optional[BroadcastModel]:
+        result: Result = await self._session.execute(
+            update(
+                BroadcastModel
+            ).where(
+                broadcasts_table.c.id == id,
+                broadcasts_table.c.owner == owner
+            ).values(
+                **await model.to_dict(exclude={'id'})
+            ).returning(
+                BroadcastModel
+            ).execution_options(
+                synchronize_session=False
+            )
+        )
+
+        return result.scalar_one_or_none()
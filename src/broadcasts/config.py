@@ -0,0 +1,20 @@
+from pydantic_settings import BaseSettings
+
+
+class BroadcastsConfig(BaseSettings):
+
+    # Users are read by pages, progress of broadcast is saved after every page:
+    BROADCASTS_PAGE_SIZE: int = 500
+
+    # Maximum number of messages, which are sent concurrently:
+    BROADCASTS_WORKERS: int = 10
+
+    # Broadcast, whose owner has not saved checkpoint for this number of seconds, is considered abandoned and can be
+    # claimed by another bot instance, so it should be much greater than time of delivery of one page:
+    BROADCASTS_LEASE_TIMEOUT: int = 600
+
+    # Interval in seconds between searches of abandoned broadcasts:
+    BROADCASTS_CLAIM_INTERVAL: int = 60
+
+
+broadcasts_config: BroadcastsConfig = BroadcastsConfig()
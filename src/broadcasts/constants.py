@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BroadcastStatuses:
+    IN_PROGRESS: str = 'in_progress'
+    FINISHED: str = 'finished'
+
+
+@dataclass(frozen=True)
+class DeliveryResults:
+    """
+    Results of delivery of broadcast message to one user. Blocked means, that user has blocked bot or deleted
+    account, so message can not be delivered to user at all.
+    """
+
+    DELIVERED: str = 'delivered'
+    FAILED: str = 'failed'
+    BLOCKED: str = 'blocked'
+
+
+@dataclass(frozen=True)
+class ErrorDetails:
+    """
+    Broadcasts error messages for custom exceptions.
+    """
+
+    BROADCAST_LEASE_LOST: str = 'Broadcast was claimed by another bot instance'
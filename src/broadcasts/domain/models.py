@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.broadcasts.constants import BroadcastStatuses
+from src.core.interfaces import AbstractModel
+
+
+@dataclass
+class BroadcastModel(AbstractModel):
+    """
+    Message, which is sent to all users, with its progress. Users are processed in order of their ids, so last_user_id
+    is a checkpoint, after which broadcast should be continued.
+
+    Broadcast is run by bot instance, which owns it. Owner refreshes heartbeat with every checkpoint, so broadcast
+    of stopped instance can be claimed by another one, when its heartbeat becomes stale.
+    """
+
+    text: str
+    admin_id: int
+    status: str = BroadcastStatuses.IN_PROGRESS
+    last_user_id: Optional[int] = None
+    delivered: int = 0
+    failed: int = 0
+    blocked: int = 0
+    owner: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
+    id: int = 0
@@ -0,0 +1,8 @@
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.service_layer.service import BroadcastsService
+from src.units_of_work import UpdateUnitOfWork
+
+
+async def create_broadcast(text: str, admin_id: int, uow: UpdateUnitOfWork) -> BroadcastModel:
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow.broadcasts_uow)
+    return await broadcasts_service.create_broadcast(text=text, admin_id=admin_id)
@@ -0,0 +1,13 @@
+from src.broadcasts.domain.models import BroadcastModel
+
+
+class TemplateCreator:
+
+    @staticmethod
+    async def broadcast_finished_message(broadcast: BroadcastModel) -> str:
+        return (
+            'Broadcast was finished!\n'
+            f'Delivered: {broadcast.delivered}, '
+            f'failed: {broadcast.failed}, '
+            f'blocked: {broadcast.blocked}.'
+        )
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Set
+from aiogram import Bot, loggers
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError
+
+from src.broadcasts.config import broadcasts_config
+from src.broadcasts.constants import DeliveryResults
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.entrypoints.templates import TemplateCreator
+from src.broadcasts.exceptions import BroadcastLeaseLostError
+from src.broadcasts.interfaces import BroadcastsUnitOfWork
+from src.broadcasts.service_layer.service import BroadcastsService
+from src.broadcasts.service_layer.units_of_work import SQLAlchemyBroadcastsUnitOfWork
+from src.middlewares import background_requests
+
+
+# Broadcasts are run in background, so references to their tasks are kept by ids of broadcasts till they are done:
+running_broadcasts: Dict[int, asyncio.Task] = {}
+
+# Watchers of abandoned broadcasts are run in background till shutdown:
+broadcasts_watchers: Set[asyncio.Task] = set()
+
+
+async def deliver_message(bot: Bot, user_id: int, text: str) -> str:
+    """
+    Requests are paced by rate limiter of bot session, which also retries requests after "retry after" answers,
+    so errors here are final.
+    """
+
+    try:
+        await bot.send_message(chat_id=user_id, text=text)
+    except TelegramForbiddenError:
+        return DeliveryResults.BLOCKED
+    except TelegramAPIError as e:
+        loggers.event.warning('Failed to deliver broadcast message to user with id=%s: %s', user_id, e)
+        return DeliveryResults.FAILED
+
+    return DeliveryResults.DELIVERED
+
+
+async def run_broadcast(
+        bot: Bot,
+        broadcast: BroadcastModel,
+        uow_factory: Callable[[], BroadcastsUnitOfWork] = SQLAlchemyBroadcastsUnitOfWork
+) -> Optional[BroadcastModel]:
+
+    """
+    Delivers broadcast to all users and reports results to admin, who started broadcast. Errors are logged, because
+    broadcast is run in background, and broadcast is continued from its last checkpoint after restart.
+
+    Requests of broadcast are marked as background ones, so rate limiter gives them only a share of global rate.
+    """
+
+    background_requests_token = background_requests.set(True)
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow_factory())
+    try:
+        broadcast = await broadcasts_service.run_broadcast(
+            broadcast=broadcast,
+            deliver=lambda user_id, text: deliver_message(bot=bot, user_id=user_id, text=text)
+        )
+        await bot.send_message(
+            chat_id=broadcast.admin_id,
+            text=await TemplateCreator.broadcast_finished_message(broadcast=broadcast)
+        )
+        return broadcast
+    except BroadcastLeaseLostError:
+        loggers.event.warning('Broadcast with id=%s was claimed by another bot instance', broadcast.id)
+        return None
+    except Exception:
+        loggers.event.exception('Broadcast with id=%s failed', broadcast.id)
+        return None
+    finally:
+        background_requests.reset(background_requests_token)
+
+
+def start_broadcast(
+        bot: Bot,
+        broadcast: BroadcastModel,
+        uow_factory: Callable[[], BroadcastsUnitOfWork] = SQLAlchemyBroadcastsUnitOfWork
+) -> asyncio.Task:
+
+    # Broadcast, which was claimed again by the same instance, because of stale heartbeat, is not run twice:
+    task: Optional[asyncio.Task] = running_broadcasts.get(broadcast.id)
+    if task is not None:
+        return task
+
+    task = asyncio.create_task(run_broadcast(bot=bot, broadcast=broadcast, uow_factory=uow_factory))
+    running_broadcasts[broadcast.id] = task
+    task.add_done_callback(lambda _: running_broadcasts.pop(broadcast.id, None))
+    return task
+
+
+async def resume_broadcasts(
+        bot: Bot,
+        uow_factory: Callable[[], BroadcastsUnitOfWork] = SQLAlchemyBroadcastsUnitOfWork
+) -> List[asyncio.Task]:
+
+    """
+    Claims unfinished broadcasts, which are not run by other bot instances, and runs them.
+    """
+
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow_factory())
+    return [
+        start_broadcast(bot=bot, broadcast=broadcast, uow_factory=uow_factory)
+        for broadcast in await broadcasts_service.claim_unfinished_broadcasts()
+    ]
+
+
+async def watch_broadcasts(
+        bot: Bot,
+        uow_factory: Callable[[], BroadcastsUnitOfWork] = SQLAlchemyBroadcastsUnitOfWork,
+        interval: float = broadcasts_config.BROADCASTS_CLAIM_INTERVAL
+) -> None:
+
+    """
+    Periodically resumes broadcasts, interrupted by shutdown or failure of any bot instance.
+    """
+
+    while True:
+        try:
+            await resume_broadcasts(bot=bot, uow_factory=uow_factory)
+        except Exception:
+            loggers.event.exception('Failed to resume broadcasts')
+
+        await asyncio.sleep(interval)
+
+
+def start_broadcasts_watcher(
+        bot: Bot,
+        uow_factory: Callable[[], BroadcastsUnitOfWork] = SQLAlchemyBroadcastsUnitOfWork
+) -> asyncio.Task:
+
+    task: asyncio.Task = asyncio.create_task(watch_broadcasts(bot=bot, uow_factory=uow_factory))
+    broadcasts_watchers.add(task)
+    task.add_done_callback(broadcasts_watchers.discard)
+    return task
+
+
+async def stop_broadcasts() -> None:
+    """
+    Cancels watchers and running broadcasts. Progress of every broadcast is kept in its last checkpoint.
+    """
+
+    tasks: List[asyncio.Task] = [*broadcasts_watchers, *running_broadcasts.values()]
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
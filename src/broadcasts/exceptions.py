@@ -0,0 +1,6 @@
+from src.broadcasts.constants import ErrorDetails
+from src.core.exceptions import DetailedException
+
+
+class BroadcastLeaseLostError(DetailedException):
+    DETAIL = ErrorDetails.BROADCAST_LEASE_LOST
@@ -0,0 +1,2 @@
+from src.broadcasts.interfaces.units_of_work import BroadcastsUnitOfWork
+from src.broadcasts.interfaces.repositories import BroadcastsRepository
@@ -0,0 +1,65 @@
+from typing import AsyncIterator, Optional, List
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.broadcasts.domain.models import BroadcastModel
+from src.core.interfaces import AbstractRepository, AbstractModel
+
+
+class BroadcastsRepository(AbstractRepository, ABC):
+    """
+    An interface for work with broadcasts, that is used by broadcasts unit of work.
+    The main goal is that implementations of this interface can be easily replaced in broadcasts unit of work
+    using dependency injection without disrupting its functionality.
+    """
+
+    @abstractmethod
+    async def add(self, model: AbstractModel) -> BroadcastModel:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, id: int) -> Optional[BroadcastModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, id: int, model: AbstractModel) -> BroadcastModel:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list(self) -> List[BroadcastModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self) -> AsyncIterator[BroadcastModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[BroadcastModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_unfinished(self) -> List[BroadcastModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_unfinished(
+            self,
+            owner: str,
+            heartbeat_at: datetime,
+            stale_before: datetime
+    ) -> List[BroadcastModel]:
+
+        """
+        Atomically takes ownership of unfinished broadcasts, which have no owner or whose heartbeat is older than
+        stale_before, and returns them.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_owned(self, id: int, model: AbstractModel, owner: str) -> Optional[BroadcastModel]:
+        """
+        Updates broadcast only if it is still owned by provided owner, otherwise returns None.
+        """
+
+        raise NotImplementedError
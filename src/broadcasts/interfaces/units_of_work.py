@@ -0,0 +1,18 @@
+from abc import ABC
+
+from src.broadcasts.interfaces.repositories import BroadcastsRepository
+from src.core.interfaces import AbstractUnitOfWork
+from src.users.interfaces.read_models import UsersReadModel
+
+
+class BroadcastsUnitOfWork(AbstractUnitOfWork, ABC):
+    """
+    An interface for work with broadcasts, that is used by service layer of broadcasts module.
+    The main goal is that implementations of this interface can be easily replaced in the service layer
+    using dependency injection without disrupting its functionality.
+
+    Exposes users read model, because recipients of broadcasts are read by pages of users ids.
+    """
+
+    broadcasts: BroadcastsRepository
+    users_read_model: UsersReadModel
@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterator, List
+from uuid import uuid4
+from aiogram import loggers
+
+from src.broadcasts.config import broadcasts_config
+from src.broadcasts.constants import BroadcastStatuses, DeliveryResults
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.exceptions import BroadcastLeaseLostError
+from src.broadcasts.interfaces.units_of_work import BroadcastsUnitOfWork
+
+
+# Delivers text to user with provided id and returns one of DeliveryResults:
+DeliverMessage = Callable[[int, str], Awaitable[str]]
+
+# Identifies current bot instance as owner of broadcasts, which it runs:
+instance_id: str = uuid4().hex
+
+
+class BroadcastsService:
+    """
+    Service layer core according to DDD, which using a unit of work, will perform operations on the domain model.
+
+    Broadcasts are owned by bot instance, which created or claimed them, so every broadcast is run by one instance.
+    """
+
+    def __init__(
+            self,
+            uow: BroadcastsUnitOfWork,
+            page_size: int = broadcasts_config.BROADCASTS_PAGE_SIZE,
+            workers: int = broadcasts_config.BROADCASTS_WORKERS,
+            owner: str = instance_id,
+            lease_timeout: int = broadcasts_config.BROADCASTS_LEASE_TIMEOUT
+    ) -> None:
+
+        self._uow: BroadcastsUnitOfWork = uow
+        self._page_size: int = page_size
+        self._workers: int = workers
+        self._owner: str = owner
+        self._lease_timeout: int = lease_timeout
+
+    async def create_broadcast(self, text: str, admin_id: int) -> BroadcastModel:
+        async with self._uow as uow:
+            broadcast: BroadcastModel = await uow.broadcasts.add(
+                model=BroadcastModel(
+                    text=text,
+                    admin_id=admin_id,
+                    owner=self._owner,
+                    heartbeat_at=datetime.now(tz=timezone.utc)
+                )
+            )
+            await uow.commit()
+            return broadcast
+
+    async def get_unfinished_broadcasts(self) -> List[BroadcastModel]:
+        async with self._uow as uow:
+            broadcasts: List[BroadcastModel] = await uow.broadcasts.list_unfinished()
+            return broadcasts
+
+    async def claim_unfinished_broadcasts(self) -> List[BroadcastModel]:
+        """
+        Takes ownership of unfinished broadcasts, which have no owner or were abandoned by their owners.
+        """
+
+        now: datetime = datetime.now(tz=timezone.utc)
+        async with self._uow as uow:
+            broadcasts: List[BroadcastModel] = await uow.broadcasts.claim_unfinished(
+                owner=self._owner,
+                heartbeat_at=now,
+                stale_before=now - timedelta(seconds=self._lease_timeout)
+            )
+            await uow.commit()
+            return broadcasts
+
+    async def run_broadcast(self, broadcast: BroadcastModel, deliver: DeliverMessage) -> BroadcastModel:
+        """
+        Delivers text of broadcast to all users, starting after last user of saved checkpoint. Users ids are read by
+        pages, every page is delivered by bounded pool of workers and then checkpoint is saved, so only one page of
+        ids is kept in memory and, after restart, message can be delivered twice only to users of unfinished page.
+
+        Raises BroadcastLeaseLostError, if broadcast was claimed by another bot instance.
+        """
+
+        broadcast = BroadcastModel(**await broadcast.to_dict())
+        while True:
+            async with self._uow as uow:
+                users_ids: List[int] = await uow.users_read_model.get_users_ids_page(
+                    after_id=broadcast.last_user_id,
+                    limit=self._page_size
+                )
+
+            if not users_ids:
+                break
+
+            results: Dict[str, int] = await self._deliver_page(
+                users_ids=users_ids,
+                text=broadcast.text,
+                deliver=deliver
+            )
+            broadcast.delivered += results[DeliveryResults.DELIVERED]
+            broadcast.failed += results[DeliveryResults.FAILED]
+            broadcast.blocked += results[DeliveryResults.BLOCKED]
+            broadcast.last_user_id = users_ids[-1]
+            await self._save_checkpoint(broadcast=broadcast)
+
+        broadcast.status = BroadcastStatuses.FINISHED
+        await self._save_checkpoint(broadcast=broadcast)
+        return broadcast
+
+    async def _deliver_page(self, users_ids: List[int], text: str, deliver: DeliverMessage) -> Dict[str, int]:
+        results: Dict[str, int] = {
+            DeliveryResults.DELIVERED: 0,
+            DeliveryResults.FAILED: 0,
+            DeliveryResults.BLOCKED: 0
+        }
+
+        # Workers share one iterator, so every user id is taken by only one of them:
+        users_ids_iterator: Iterator[int] = iter(users_ids)
+
+        async def worker() -> None:
+            for user_id in users_ids_iterator:
+                try:
+                    results[await deliver(user_id, text)] += 1
+                except Exception as e:
+                    loggers.event.warning('Failed to deliver broadcast message to user with id=%s: %s', user_id, e)
+                    results[DeliveryResults.FAILED] += 1
+
+        await asyncio.gather(*(worker() for _ in range(min(self._workers, len(users_ids)))))
+        return results
+
+    async def _save_checkpoint(self, broadcast: BroadcastModel) -> None:
+        broadcast.heartbeat_at = datetime.now(tz=timezone.utc)
+        async with self._uow as uow:
+            if not await uow.broadcasts.update_owned(id=broadcast.id, model=broadcast, owner=self._owner):
+                raise BroadcastLeaseLostError
+
+            await uow.commit()
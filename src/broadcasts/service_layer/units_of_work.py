@@ -0,0 +1,17 @@
+from typing import Self
+
+from src.broadcasts.adapters.repositories import SQLAlchemyBroadcastsRepository
+from src.broadcasts.interfaces.repositories import BroadcastsRepository
+from src.broadcasts.interfaces.units_of_work import BroadcastsUnitOfWork
+from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
+from src.users.adapters.read_models import SQLAlchemyUsersReadModel
+from src.users.interfaces.read_models import UsersReadModel
+
+
+class SQLAlchemyBroadcastsUnitOfWork(SQLAlchemyAbstractUnitOfWork, BroadcastsUnitOfWork):
+
+    async def __aenter__(self) -> Self:
+        uow = await super().__aenter__()
+        self.broadcasts: BroadcastsRepository = SQLAlchemyBroadcastsRepository(session=self._session)
+        self.users_read_model: UsersReadModel = SQLAlchemyUsersReadModel(session=self._session)
+        return uow
@@ -1,8 +1,30 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
+from src.constants import LaunchModes
+
 
 class BotConfig(BaseSettings):
     TOKEN: str
+    LAUNCH_MODE: LaunchModes = LaunchModes.POLLING
+
+    # Limits of sending messages by Telegram API per second:
+    RATE_LIMIT_GLOBAL: float = 30
+    RATE_LIMIT_PER_CHAT: float = 1
+    RATE_LIMIT_PER_CHAT_BURST: int = 1
+    RATE_LIMIT_MAX_RETRIES: int = 3
+
+    # Share of global rate, which is available for background requests, for example, for broadcasts:
+    RATE_LIMIT_BACKGROUND_SHARE: float = 0.5
+
+    # Webhook settings. Telegram sends updates to WEBHOOK_URL + WEBHOOK_PATH, which should be proxied to server,
+    # listening on WEBHOOK_HOST:WEBHOOK_PORT. Secret is sent by Telegram in every request to verify its origin,
+    # so it is required in webhook launch mode:
+    WEBHOOK_URL: Optional[str] = None
+    WEBHOOK_PATH: str = '/webhook'
+    WEBHOOK_SECRET: Optional[str] = None
+    WEBHOOK_HOST: str = '0.0.0.0'
+    WEBHOOK_PORT: int = 8080
 
 
 bot_config: BotConfig = BotConfig()
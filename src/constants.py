@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class LaunchModes(str, Enum):
+    """
+    Modes of receiving updates from Telegram.
+
+    POLLING: bot requests updates from Telegram by long polling.
+    WEBHOOK: Telegram sends updates to HTTP server of bot, which answers immediately and handles updates in background.
+    """
+
+    POLLING = 'polling'
+    WEBHOOK = 'webhook'
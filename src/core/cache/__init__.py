@@ -0,0 +1,2 @@
+from src.core.cache.backends import LRUCache, InMemoryCache, RedisCache, NamespacedCache, CacheStats
+from src.core.cache.factory import create_cache
@@ -0,0 +1,301 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar, Union
+
+from src.core.exceptions import CacheBackendError
+from src.core.interfaces.cache import AbstractCache
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Hits and misses of cache since its creation.
+    """
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        requests: int = self.hits + self.misses
+        return self.hits / requests if requests else 0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    In memory cache with bounded size and time to live of every value.
+
+    If cache is full, least recently used value is evicted. Expired values are evicted on access.
+    Counts hits and misses for monitoring of cache efficiency.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._values: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: K) -> Optional[V]:
+        item: Optional[Tuple[float, V]] = self._values.get(key)
+        if item is None or item[0] < time.monotonic():
+            self._values.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._values.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses)
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        self._values[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+        self._values.move_to_end(key)
+        while len(self._values) > self._max_size:
+            self._values.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._values.pop(key, None)
+
+    def expires_in(self, key: K) -> Optional[float]:
+        item: Optional[Tuple[float, V]] = self._values.get(key)
+        if item is None or item[0] < time.monotonic():
+            return None
+
+        return item[0] - time.monotonic()
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class InMemoryCache(AbstractCache):
+    """
+    Cache, which keeps values in memory of current process. Values are kept serialized, same as in other backends,
+    so cached value can not be changed by changing returned object.
+    """
+
+    def __init__(self, max_size: int, default_ttl: float) -> None:
+        self._values: LRUCache[str, str] = LRUCache(max_size=max_size, ttl=default_ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value: Optional[str] = self._values.get(key=key)
+        return None if value is None else json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._values.set(key=key, value=json.dumps(value), ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._values.delete(key=key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for key in keys:
+            value: Optional[Any] = await self.get(key=key)
+            if value is not None:
+                values[key] = value
+
+        return values
+
+    async def ttl(self, key: str) -> Optional[float]:
+        return self._values.expires_in(key=key)
+
+
+RedisArgument = Union[str, bytes, int, float]
+
+
+class RedisCache(AbstractCache):
+    """
+    Cache, which speaks Redis serialization protocol (RESP) over one TCP connection, so it works with Redis and any
+    compatible server without additional dependencies.
+
+    Commands are sent one by one under lock, because responses are read from the same connection in order of
+    commands. Connection is opened on first command and is reopened after connection errors.
+    """
+
+    def __init__(
+            self,
+            host: str = 'localhost',
+            port: int = 6379,
+            db: int = 0,
+            password: Optional[str] = None,
+            default_ttl: Optional[float] = None
+    ) -> None:
+
+        self._host: str = host
+        self._port: int = port
+        self._db: int = db
+        self._password: Optional[str] = password
+        self._default_ttl: Optional[float] = default_ttl
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        value: Optional[bytes] = await self.execute('GET', key)
+        return None if value is None else json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self._default_ttl if ttl is None else ttl
+        if ttl is None:
+            await self.execute('SET', key, json.dumps(value))
+        else:
+            await self.execute('SET', key, json.dumps(value), 'PX', int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self.execute('DEL', key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+
+        values: List[Optional[bytes]] = await self.execute('MGET', *keys)
+        return {key: json.loads(value) for key, value in zip(keys, values) if value is not None}
+
+    async def ttl(self, key: str) -> Optional[float]:
+        # Negative values mean, that key does not exist or does not expire:
+        milliseconds: int = await self.execute('PTTL', key)
+        return None if milliseconds < 0 else milliseconds / 1000
+
+    async def execute(self, *args: RedisArgument) -> Any:
+        """
+        If command is cancelled or fails before whole response is read, connection is dropped, because the rest of
+        response would be read by next command instead of its own response.
+        """
+
+        async with self._lock:
+            try:
+                if self._writer is None or self._writer.is_closing():
+                    await self._connect()
+
+                return await self._send(*args)
+            except BaseException:
+                self._drop_connection()
+                raise
+
+    async def close(self) -> None:
+        writer: Optional[asyncio.StreamWriter] = self._writer
+        self._drop_connection()
+        if writer is not None:
+            await writer.wait_closed()
+
+    def _drop_connection(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        self._reader = None
+        self._writer = None
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(host=self._host, port=self._port)
+        if self._password:
+            await self._send('AUTH', self._password)
+
+        if self._db:
+            await self._send('SELECT', self._db)
+
+    async def _send(self, *args: RedisArgument) -> Any:
+        assert self._reader is not None and self._writer is not None
+        self._writer.write(self._encode(args))
+        await self._writer.drain()
+        return await self._read(self._reader)
+
+    @staticmethod
+    def _encode(args: Tuple[RedisArgument, ...]) -> bytes:
+        command: List[bytes] = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            data: bytes = arg if isinstance(arg, bytes) else str(arg).encode()
+            command.append(f'${len(data)}\r\n'.encode() + data + b'\r\n')
+
+        return b''.join(command)
+
+    @classmethod
+    async def _read(cls, reader: asyncio.StreamReader) -> Any:
+        line: bytes = await reader.readuntil(b'\r\n')
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b'+':
+            return body.decode()
+        elif prefix == b'-':
+            raise CacheBackendError(body.decode())
+        elif prefix == b':':
+            return int(body)
+        elif prefix == b'$':
+            length: int = int(body)
+            if length < 0:
+                return None
+
+            return (await reader.readexactly(length + 2))[:-2]
+        elif prefix == b'*':
+            count: int = int(body)
+            if count < 0:
+                return None
+
+            return [await cls._read(reader) for _ in range(count)]
+
+        raise CacheBackendError(f'Unknown response: {line!r}')
+
+
+class NamespacedCache(AbstractCache):
+    """
+    Decorator for any cache, which prefixes keys by namespace and version, so several namespaces can share one
+    backend. Version should be increased, when format of cached values is changed, so old values are not read.
+
+    Counts hits and misses of namespace for monitoring of cache efficiency.
+
+    Namespace can be cleared in current process without scanning of backend: generation of keys is changed, so values
+    of previous generation are not read anymore and are evicted by backend, when their time to live expires.
+    """
+
+    def __init__(self, cache: AbstractCache, namespace: str, version: int = 1) -> None:
+        self._cache: AbstractCache = cache
+        self._prefix: str = f'{namespace}:v{version}:'
+        self._generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def make_key(self, key: Any) -> str:
+        if self._generation:
+            return f'{self._prefix}g{self._generation}:{key}'
+
+        return f'{self._prefix}{key}'
+
+    def clear(self) -> None:
+        self._generation += 1
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses)
+
+    async def get(self, key: Any) -> Optional[Any]:
+        value: Optional[Any] = await self._cache.get(key=self.make_key(key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        await self._cache.set(key=self.make_key(key), value=value, ttl=ttl)
+
+    async def delete(self, key: Any) -> None:
+        await self._cache.delete(key=self.make_key(key))
+
+    async def get_many(self, keys: List[Any]) -> Dict[str, Any]:
+        values: Dict[str, Any] = await self._cache.get_many(keys=[self.make_key(key) for key in keys])
+        self.hits += len(values)
+        self.misses += len(keys) - len(values)
+        return {str(key): values[self.make_key(key)] for key in keys if self.make_key(key) in values}
+
+    async def ttl(self, key: Any) -> Optional[float]:
+        return await self._cache.ttl(key=self.make_key(key))
@@ -0,0 +1,21 @@
+from typing import Optional
+from pydantic_settings import BaseSettings
+
+from src.core.cache.constants import CacheBackends
+
+
+class CacheConfig(BaseSettings):
+    CACHE_BACKEND: str = CacheBackends.MEMORY
+
+    # In memory backend settings, time to live is set in seconds:
+    CACHE_MAX_SIZE: int = 1024
+    CACHE_DEFAULT_TTL: float = 300
+
+    # Redis backend settings:
+    CACHE_REDIS_HOST: str = 'localhost'
+    CACHE_REDIS_PORT: int = 6379
+    CACHE_REDIS_DB: int = 0
+    CACHE_REDIS_PASSWORD: Optional[str] = None
+
+
+cache_config: CacheConfig = CacheConfig()
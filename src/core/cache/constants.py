@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheBackends:
+    """
+    MEMORY: values are kept in memory of current process, so they are not shared between bot instances.
+    REDIS: values are kept by Redis or any other server, which speaks Redis protocol.
+    """
+
+    MEMORY: str = 'memory'
+    REDIS: str = 'redis'
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from src.core.cache.backends import InMemoryCache, RedisCache
+from src.core.cache.config import CacheConfig, cache_config
+from src.core.cache.constants import CacheBackends
+from src.core.interfaces.cache import AbstractCache
+
+
+def create_cache(
+        config: CacheConfig = cache_config,
+        max_size: Optional[int] = None,
+        default_ttl: Optional[float] = None
+) -> AbstractCache:
+
+    """
+    Creates cache backend, which is selected by config. Max size and default time to live can be overridden
+    for caches of separate modules.
+    """
+
+    if config.CACHE_BACKEND == CacheBackends.REDIS:
+        return RedisCache(
+            host=config.CACHE_REDIS_HOST,
+            port=config.CACHE_REDIS_PORT,
+            db=config.CACHE_REDIS_DB,
+            password=config.CACHE_REDIS_PASSWORD,
+            default_ttl=config.CACHE_DEFAULT_TTL if default_ttl is None else default_ttl
+        )
+
+    return InMemoryCache(
+        max_size=config.CACHE_MAX_SIZE if max_size is None else max_size,
+        default_ttl=config.CACHE_DEFAULT_TTL if default_ttl is None else default_ttl
+    )
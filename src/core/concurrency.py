@@ -0,0 +1,100 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+
+class SingleFlight(Generic[K, T]):
+    """
+    Coalesces concurrent calls with the same key, so only the first call is executed and all concurrent callers
+    get its result or its exception. Next call with the same key after the first call is finished is executed again.
+
+    Result is shared between callers, so it should not be bound to resources of the first caller, for example, to its
+    database session, and should not be changed by callers. The first call is shielded, so cancellation of one
+    caller does not cancel the call for others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[K, asyncio.Future[T]] = {}
+
+    async def do(self, key: K, function: Callable[[], Awaitable[T]]) -> T:
+        call: asyncio.Future[T]
+        if key in self._calls:
+            call = self._calls[key]
+        else:
+            call = asyncio.ensure_future(function())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._forget(key=key, call=call))
+
+        return await asyncio.shield(call)
+
+    def _forget(self, key: K, call: asyncio.Future[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class TokenBucket:
+    """
+    Limits rate of operations: every operation takes one token, tokens are refilled with provided rate per second
+    up to capacity, so bursts up to capacity are allowed.
+
+    Waiter reserves token at once, so tokens can go into debt, and sleeps till its token is refilled, so waiters are
+    served in order of their arrival and none of them holds bucket while sleeping.
+
+    Bucket can be paused, for example, when external service asks to retry after some time. Pause drops debts,
+    so waiters, which were woken during pause, reserve tokens again.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate: float = rate
+        self._capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated_at: float = time.monotonic()
+        self._paused_until: float = 0
+
+    async def acquire(self) -> float:
+        """
+        Waits for token and returns waiting time in seconds.
+        """
+
+        started_at: float = time.monotonic()
+        while True:
+            wait_time: float = self._reserve(now=time.monotonic())
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            if time.monotonic() >= self._paused_until:
+                return time.monotonic() - started_at
+
+    def _reserve(self, now: float) -> float:
+        """
+        Takes token and returns time in seconds, after which token is refilled.
+        """
+
+        self._refill(now=now)
+        self._tokens -= 1
+        return max(self._updated_at - now, 0) + max(-self._tokens, 0) / self._rate
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+        self._updated_at = self._paused_until
+
+    def is_full(self) -> bool:
+        now: float = time.monotonic()
+        if now < self._paused_until:
+            return False
+
+        self._refill(now=now)
+        return self._tokens >= self._capacity
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
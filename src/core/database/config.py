@@ -1,5 +1,8 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
+from src.core.database.constants import DatabasePoolModes
+
 
 class DatabaseConfig(BaseSettings):
     DATABASE_DIALECT: str
@@ -15,5 +18,29 @@ class DatabaseConfig(BaseSettings):
     DATABASE_AUTO_FLUSH: bool
     DATABASE_EXPIRE_ON_COMMIT: bool
 
+    # Pool settings:
+    DATABASE_POOL_MODE: str = DatabasePoolModes.SESSION
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_WARM_UP: bool = True
+
+    # Read replica settings. Read only units of work are routed to replica, if its url is provided. Reads of user
+    # are routed to primary during read your writes window (in seconds) after his last commit:
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DATABASE_READ_YOUR_WRITES_WINDOW: float = 5
+
+    # Direct url to database for LISTEN of cache invalidations, which is required, if PgBouncer is used in
+    # transaction pool mode. Otherwise, main database url is used:
+    DATABASE_LISTEN_URL: Optional[str] = None
+
+    # Count of rows, fetched from database per one round trip, while streaming results of repositories:
+    DATABASE_STREAM_BATCH_SIZE: int = 1000
+
+    # asyncpg settings, which are used only with "asyncpg" driver:
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_COMMAND_TIMEOUT: Optional[float] = None
+
 
 database_config: DatabaseConfig = DatabaseConfig()
@@ -1,39 +1,134 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+import asyncio
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection, async_sessionmaker
 
-from src.core.database.config import database_config
+from src.core.database.config import database_config, DatabaseConfig
+from src.core.database.constants import DatabasePoolModes
 
 
-"""
-Due to the fact, that sqlite is serverless and has no host, port and so on, there is a need to create
-database url in different patterns.
-"""
-DATABASE_URL: str
-if database_config.DATABASE_DIALECT == 'sqlite':
-    DATABASE_URL = '{}+{}:///{}'.format(
-        database_config.DATABASE_DIALECT,
-        database_config.DATABASE_DRIVER,
-        database_config.DATABASE_NAME,
+def get_database_url(config: DatabaseConfig) -> str:
+    """
+    Due to the fact, that sqlite is serverless and has no host, port and so on, there is a need to create
+    database url in different patterns.
+    """
+
+    if config.DATABASE_DIALECT == 'sqlite':
+        return '{}+{}:///{}'.format(
+            config.DATABASE_DIALECT,
+            config.DATABASE_DRIVER,
+            config.DATABASE_NAME,
+        )
+
+    return '{}+{}://{}:{}@{}:{}/{}'.format(
+        config.DATABASE_DIALECT,
+        config.DATABASE_DRIVER,
+        config.DATABASE_USER,
+        config.DATABASE_PASSWORD,
+        config.DATABASE_HOST,
+        config.DATABASE_PORT,
+        config.DATABASE_NAME
+    )
+
+
+DATABASE_URL: str = get_database_url(config=database_config)
+
+
+def get_pool_arguments(config: DatabaseConfig) -> Dict[str, Any]:
+    """
+    Async sqlite driver uses NullPool, which does not accept pool sizing arguments, so they are provided only to
+    server databases.
+
+    In transaction pool mode PgBouncer is the pool, so connections are not kept locally and every checkout
+    connects to PgBouncer, which is cheap.
+    """
+
+    if config.DATABASE_DIALECT == 'sqlite':
+        return {}
+
+    if config.DATABASE_POOL_MODE == DatabasePoolModes.TRANSACTION:
+        return {'poolclass': NullPool}
+
+    return {
+        'pool_size': config.DATABASE_POOL_SIZE,
+        'max_overflow': config.DATABASE_MAX_OVERFLOW,
+        'pool_timeout': config.DATABASE_POOL_TIMEOUT,
+    }
+
+
+def get_connect_arguments(config: DatabaseConfig) -> Dict[str, Any]:
+    """
+    Statements caches and command timeout are arguments of asyncpg connection, so other drivers would fail on them.
+
+    In transaction pool mode prepared statements, created on one server connection, do not exist on another one,
+    so statements caches are disabled and every prepared statement gets unique name instead of asyncpg's sequential
+    one, which can collide with name of statement, prepared by another client on the same server connection.
+    """
+
+    if config.DATABASE_DRIVER != 'asyncpg':
+        return {}
+
+    if config.DATABASE_POOL_MODE == DatabasePoolModes.TRANSACTION:
+        return {
+            'statement_cache_size': 0,
+            'prepared_statement_cache_size': 0,
+            'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            'command_timeout': config.DATABASE_COMMAND_TIMEOUT,
+        }
+
+    return {
+        'statement_cache_size': config.DATABASE_STATEMENT_CACHE_SIZE,
+        'prepared_statement_cache_size': config.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+        'command_timeout': config.DATABASE_COMMAND_TIMEOUT,
+    }
+
+
+def create_engine(url: str, config: DatabaseConfig) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+        echo=config.DATABASE_ECHO,
+        connect_args=get_connect_arguments(config=config),
+        **get_pool_arguments(config=config)
     )
-else:
-    DATABASE_URL = '{}+{}://{}:{}@{}:{}/{}'.format(
-        database_config.DATABASE_DIALECT,
-        database_config.DATABASE_DRIVER,
-        database_config.DATABASE_USER,
-        database_config.DATABASE_PASSWORD,
-        database_config.DATABASE_HOST,
-        database_config.DATABASE_PORT,
-        database_config.DATABASE_NAME
+
+
+def create_session_factory(engine: AsyncEngine, config: DatabaseConfig) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=config.DATABASE_AUTO_FLUSH,
+        expire_on_commit=config.DATABASE_EXPIRE_ON_COMMIT
     )
 
-engine: AsyncEngine = create_async_engine(
-    url=DATABASE_URL,
-    pool_pre_ping=database_config.DATABASE_POOL_PRE_PING,
-    pool_recycle=database_config.DATABASE_POOL_RECYCLE,
-    echo=database_config.DATABASE_ECHO,
-)
-
-session_factory: async_sessionmaker = async_sessionmaker(
-    bind=engine,
-    autoflush=database_config.DATABASE_AUTO_FLUSH,
-    expire_on_commit=database_config.DATABASE_EXPIRE_ON_COMMIT
-)
+
+engine: AsyncEngine = create_engine(url=DATABASE_URL, config=database_config)
+session_factory: async_sessionmaker = create_session_factory(engine=engine, config=database_config)
+
+
+"""
+Replica has the same dialect and driver as primary database, so it is configured by the same settings.
+If replica url is not provided, all requests are executed on primary database.
+"""
+replica_engine: Optional[AsyncEngine] = None
+replica_session_factory: Optional[async_sessionmaker] = None
+if database_config.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(url=database_config.DATABASE_REPLICA_URL, config=database_config)
+    replica_session_factory = create_session_factory(engine=replica_engine, config=database_config)
+
+
+async def warm_up_pool(
+        engine: AsyncEngine = engine,
+        connections_count: int = database_config.DATABASE_POOL_SIZE
+) -> None:
+    """
+    Establishes provided count of connections concurrently and returns them to pool, so first updates after launch
+    reuse already established connections instead of connecting to database.
+
+    Connections count should not exceed pool size, because overflow connections are closed on return to pool.
+    """
+
+    connections: List[AsyncConnection] = await asyncio.gather(*[engine.connect() for _ in range(connections_count)])
+    for connection in connections:
+        await connection.close()
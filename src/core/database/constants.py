@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DatabasePoolModes:
+    """
+    Modes of pooling of database connections.
+
+    SESSION: application connects directly to database or to PgBouncer in session mode and keeps connections
+    in its own pool.
+    TRANSACTION: application connects to PgBouncer in transaction mode, where every transaction can be executed
+    on different server connection, so neither local pool nor named prepared statements are used.
+    """
+
+    SESSION: str = 'session'
+    TRANSACTION: str = 'transaction'
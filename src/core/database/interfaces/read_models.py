@@ -0,0 +1,14 @@
+from abc import ABC
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.interfaces import AbstractReadModel
+
+
+class SQLAlchemyAbstractReadModel(AbstractReadModel, ABC):
+    """
+    Read model interface for SQLAlchemy, from which should be inherited all other read models,
+    which would be based on SQLAlchemy Core logics.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: AsyncSession = session
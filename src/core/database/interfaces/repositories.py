@@ -1,6 +1,9 @@
 from abc import ABC
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Any
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection, AsyncScalarResult
 
+from src.core.database.config import database_config
 from src.core.interfaces import AbstractRepository
 
 
@@ -12,3 +15,25 @@ class SQLAlchemyAbstractRepository(AbstractRepository, ABC):
 
     def __init__(self, session: AsyncSession) -> None:
         self._session: AsyncSession = session
+
+    async def _stream_scalars(self, query: Select) -> AsyncIterator[Any]:
+        """
+        Fetches query results from database by batches through server side cursor, so only one batch is kept
+        in memory at once.
+
+        asyncpg opens server side cursors only within transaction, which is begun by session on first query, but
+        read only units of work with their own sessions work in autocommit mode, where no transaction is begun.
+        So streaming should be used only within units of work, which change data, or within shared session.
+        """
+
+        connection: AsyncConnection = await self._session.connection()
+        assert connection.sync_connection is not None  # Check for mypy
+        assert connection.sync_connection.get_execution_options().get('isolation_level') != 'AUTOCOMMIT', (
+            'Streaming is not supported by read only units of work, which work in autocommit mode'
+        )
+
+        result: AsyncScalarResult = await self._session.stream_scalars(
+            query.execution_options(yield_per=database_config.DATABASE_STREAM_BATCH_SIZE)
+        )
+        async for model in result:
+            yield model
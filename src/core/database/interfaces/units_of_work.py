@@ -1,30 +1,130 @@
-from typing import Self
-from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from typing import Iterable, Self, Optional, Set
+from weakref import WeakKeyDictionary
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
 
 from src.core.interfaces import AbstractUnitOfWork
-from src.core.database.connection import session_factory as default_session_factory
+from src.core.database.connection import (
+    session_factory as default_session_factory,
+    replica_session_factory as default_replica_session_factory
+)
+from src.core.database.routing import ReadYourWritesTracker, read_your_writes_tracker as default_tracker
+
+
+# Autocommit engines share pools of their engines, so they are created once per engine:
+autocommit_engines: WeakKeyDictionary[AsyncEngine, AsyncEngine] = WeakKeyDictionary()
+
+
+def get_autocommit_engine(engine: AsyncEngine) -> AsyncEngine:
+    if engine not in autocommit_engines:
+        autocommit_engines[engine] = engine.execution_options(isolation_level='AUTOCOMMIT')
+
+    return autocommit_engines[engine]
 
 
 class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
     """
     Unit of work interface for SQLAlchemy, from which should be inherited all other units of work,
     which would be based on SQLAlchemy logics.
+
+    If session is provided, unit of work works within it and does not close it, because session is owned
+    by the one, who provided it. Otherwise, new session is created for every entering unit of work.
+
+    Read only unit of work with its own session works in autocommit mode, so neither BEGIN nor ROLLBACK are sent
+    to database and nothing is rolled back on exit, if no exception was raised. Within provided session transaction,
+    started by reads, is ended on exit, so it is not left idle in transaction till owner of the session closes it.
+
+    If replica session factory is provided, read only unit of work works with its own replica session, unless
+    the user, on whose behalf unit of work works, has committed changes within read your writes window.
+    Units of work, which change data, always work with primary database. On commit writes are registered both for
+    the user, on whose behalf unit of work works, and for all users, registered as affected by the transaction.
     """
 
-    def __init__(self, session_factory: async_sessionmaker = default_session_factory) -> None:
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = default_session_factory,
+            session: Optional[AsyncSession] = None,
+            read_only: bool = False,
+            replica_session_factory: Optional[async_sessionmaker] = default_replica_session_factory,
+            user_id: Optional[int] = None,
+            tracker: ReadYourWritesTracker = default_tracker
+    ) -> None:
+
         super().__init__()
         self._session_factory: async_sessionmaker = session_factory
+        self._shared_session: Optional[AsyncSession] = session
+        self._read_only: bool = read_only
+        self._replica_session_factory: Optional[async_sessionmaker] = replica_session_factory
+        self._user_id: Optional[int] = user_id
+        self._tracker: ReadYourWritesTracker = tracker
+        self._owns_session: bool = False
+        self._affected_users_ids: Set[int] = set()
 
     async def __aenter__(self) -> Self:
-        self._session: AsyncSession = self._session_factory()
+        if self._should_use_replica():
+            assert self._replica_session_factory is not None
+            self._session: AsyncSession = self._create_session(session_factory=self._replica_session_factory)
+            self._owns_session = True
+        elif self._shared_session:
+            self._session = self._shared_session
+            self._owns_session = False
+        else:
+            self._session = self._create_session(session_factory=self._session_factory)
+            self._owns_session = True
+
+        self._affected_users_ids.clear()
         return await super().__aenter__()
 
+    def _create_session(self, session_factory: async_sessionmaker) -> AsyncSession:
+        """
+        Read only session is bound to autocommit engine, which shares pool with engine of session factory, so
+        isolation level is set, when connection is checked out on first statement, and units of work, which do not
+        execute statements, for example, because of cache hits, do not check out connections at all.
+        """
+
+        bind: Optional[AsyncEngine] = session_factory.kw.get('bind')
+        if not self._read_only or bind is None:
+            return session_factory()
+
+        return session_factory(bind=get_autocommit_engine(engine=bind))
+
     async def __aexit__(self, *args, **kwargs) -> None:
-        await super().__aexit__(*args, **kwargs)
-        await self._session.close()
+        exception_raised: bool = bool(args and args[0])
+        if not (self._read_only and self._owns_session) or exception_raised:
+            await super().__aexit__(*args, **kwargs)
+
+        if self._owns_session:
+            await self._session.close()
 
     async def commit(self) -> None:
         await self._session.commit()
+        if self._user_id is not None:
+            self._affected_users_ids.add(self._user_id)
+
+        for user_id in self._affected_users_ids:
+            self._tracker.register_write(user_id=user_id)
+
+        self._affected_users_ids.clear()
+
+    def register_affected_users(self, users_ids: Iterable[int]) -> None:
+        self._affected_users_ids.update(users_ids)
+
+    def detach(self) -> Self:
+        return type(self)(
+            session_factory=self._session_factory,
+            read_only=self._read_only,
+            replica_session_factory=self._replica_session_factory,
+            user_id=self._user_id,
+            tracker=self._tracker
+        )
+
+    def uses_replica(self) -> bool:
+        return self._should_use_replica()
+
+    def _should_use_replica(self) -> bool:
+        if not self._read_only or self._replica_session_factory is None:
+            return False
+
+        return not self._tracker.has_recent_writes(user_id=self._user_id)
 
     async def rollback(self) -> None:
         """
@@ -36,7 +136,11 @@ class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
         attributes.
 
         https://pythonhint.com/post/1123713161982291/how-does-a-sqlalchemy-object-get-detached
+
+        If there is no transaction, for example after commit, there is nothing to rollback, so no ROLLBACK is sent.
         """
 
+        self._affected_users_ids.clear()
         self._session.expunge_all()
-        await self._session.rollback()
+        if self._session.in_transaction():
+            await self._session.rollback()
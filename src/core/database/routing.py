@@ -0,0 +1,51 @@
+import time
+from typing import Dict, List, Optional
+
+from src.core.database.config import database_config
+
+
+class ReadYourWritesTracker:
+    """
+    Remembers time of last commit of every user, so reads of user, who has just changed data, are routed to primary
+    database instead of replica, which can lag behind primary.
+
+    Commits are tracked in memory of current process. Dict keeps users in order of their last commits, so expired
+    entries are evicted from its beginning on every registered write and memory is bounded by users, who have
+    committed within window.
+    """
+
+    def __init__(self, window: float = database_config.DATABASE_READ_YOUR_WRITES_WINDOW) -> None:
+        self._window: float = window
+        self._last_writes: Dict[int, float] = {}
+
+    def register_write(self, user_id: int) -> None:
+        now: float = time.monotonic()
+        self._evict_expired(now=now)
+
+        # Reinserting moves user to the end of dict:
+        self._last_writes.pop(user_id, None)
+        self._last_writes[user_id] = now
+
+    def has_recent_writes(self, user_id: Optional[int]) -> bool:
+        if user_id is None or user_id not in self._last_writes:
+            return False
+
+        if time.monotonic() - self._last_writes[user_id] < self._window:
+            return True
+
+        del self._last_writes[user_id]
+        return False
+
+    def _evict_expired(self, now: float) -> None:
+        expired_users_ids: List[int] = []
+        for user_id, written_at in self._last_writes.items():
+            if now - written_at < self._window:
+                break
+
+            expired_users_ids.append(user_id)
+
+        for user_id in expired_users_ids:
+            del self._last_writes[user_id]
+
+
+read_your_writes_tracker: ReadYourWritesTracker = ReadYourWritesTracker()
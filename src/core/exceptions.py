@@ -3,3 +3,11 @@ class DetailedException(Exception):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(self.DETAIL, *args, **kwargs)
+
+
+class CacheBackendError(DetailedException):
+    DETAIL: str = 'Cache backend returned an error'
+
+
+class DatabaseListenUrlRequiredError(DetailedException):
+    DETAIL: str = 'DATABASE_LISTEN_URL is required for cache invalidation in transaction pool mode'
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from src.core.interfaces.models import AbstractModel
+
+
+M = TypeVar('M', bound=AbstractModel)
+
+
+class IdentityMap:
+    """
+    Memo of models, which were already read during handling of one update, by their types and ids, so repeated
+    reads of the same model within update do not go to database.
+
+    Models are kept as copies, which are not bound to any session, so they are not expired by commits of units of work.
+    Models, which are changed within update, should be discarded by the one, who changes them.
+    """
+
+    def __init__(self) -> None:
+        self._models: Dict[Tuple[Type[AbstractModel], Any], AbstractModel] = {}
+
+    def get(self, model_type: Type[M], id: Any) -> Optional[M]:
+        model: Optional[AbstractModel] = self._models.get((model_type, id))
+        assert model is None or isinstance(model, model_type)
+        return model
+
+    async def add(self, id: Any, model: M) -> M:
+        model_copy: M = type(model)(**await model.to_dict())
+        self._models[(type(model), id)] = model_copy
+        return model_copy
+
+    def discard(self, model_type: Type[AbstractModel], id: Any) -> None:
+        self._models.pop((model_type, id), None)
+
+    def clear(self, model_type: Optional[Type[AbstractModel]] = None) -> None:
+        """
+        Discards all models of provided type or all models at all, if type is not provided.
+        """
+
+        if model_type is None:
+            self._models.clear()
+            return
+
+        for key in [key for key in self._models if key[0] is model_type]:
+            del self._models[key]
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -1,3 +1,5 @@
 from src.core.interfaces.units_of_work import AbstractUnitOfWork
 from src.core.interfaces.repositories import AbstractRepository
 from src.core.interfaces.models import AbstractModel
+from src.core.interfaces.read_models import AbstractReadModel
+from src.core.interfaces.cache import AbstractCache
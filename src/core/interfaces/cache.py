@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class AbstractCache(ABC):
+    """
+    Interface for any cache, which would be injected into repositories and views, which should cache their results.
+
+    Values should be serializable to JSON, so they can be stored by any backend. Time to live is set in seconds,
+    if it is not provided, default time to live of backend is used.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Returns values only for existing keys.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ttl(self, key: str) -> Optional[float]:
+        """
+        Returns remaining time to live of key or None, if key does not exist or does not expire.
+        """
+
+        raise NotImplementedError
@@ -0,0 +1,10 @@
+from abc import ABC
+
+
+class AbstractReadModel(ABC):
+    """
+    Interface for any read model, which would be used by views to retrieve data upon read requests.
+
+    Main purpose is to return raw rows, which are needed by views, directly from data storage without building
+    domain models, due to the fact that read requests do not change domain models state.
+    """
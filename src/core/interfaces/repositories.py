@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.core.interfaces.models import AbstractModel
 
@@ -10,6 +10,10 @@ class AbstractRepository(ABC):
 
     Main purpose is to encapsulate internal logic that is associated with the use of one or another data
     storage scheme, for example, ORM.
+
+    For large amount of data "stream" and "list_page" should be used instead of "list", because they do not load
+    all models to memory at once. Pages are selected by id of last model of previous page (keyset pagination),
+    so models are ordered by id.
     """
 
     @abstractmethod
@@ -31,3 +35,11 @@ class AbstractRepository(ABC):
     @abstractmethod
     async def list(self) -> List[AbstractModel]:
         raise NotImplementedError
+
+    @abstractmethod
+    def stream(self) -> AsyncIterator[AbstractModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[AbstractModel]:
+        raise NotImplementedError
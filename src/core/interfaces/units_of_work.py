@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Self
+from typing import Iterable, Self
 
 
 class AbstractUnitOfWork(ABC):
@@ -13,6 +13,26 @@ class AbstractUnitOfWork(ABC):
     async def __aexit__(self, *args, **kwargs) -> None:
         await self.rollback()
 
+    def detach(self) -> Self:
+        """
+        Returns unit of work with the same settings, which works within its own session, so it can be used by tasks,
+        which can outlive the owner of session of current unit of work.
+        Units of work, which have no sessions, return themselves.
+        """
+
+        return self
+
+    def uses_replica(self) -> bool:
+        return False
+
+    def register_affected_users(self, users_ids: Iterable[int]) -> None:
+        """
+        Registers users, whose data is changed by current transaction on behalf of other user, for example by admin,
+        so their next reads see changes after commit. Units of work without read routing ignore them.
+        """
+
+        pass
+
     @abstractmethod
     async def commit(self) -> None:
         raise NotImplementedError
@@ -0,0 +1,210 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from aiogram import loggers
+from sqlalchemy import func, select, NullPool
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from src.core.database.config import DatabaseConfig, database_config
+from src.core.database.constants import DatabasePoolModes
+from src.core.database.connection import engine as default_engine, get_database_url
+from src.core.exceptions import DatabaseListenUrlRequiredError
+
+
+InvalidationHandler = Callable[[Optional[str]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class InvalidationTopics:
+    USERS: str = 'users'
+    TASKS_CATALOG: str = 'tasks_catalog'
+
+
+class AbstractInvalidationBus(ABC):
+    """
+    Bus, which delivers cache invalidation events from writers to all subscribers of all bot instances.
+
+    Event consists of topic and optional key of changed entry. Subscribers should drop or reload cached entries
+    by provided key or all entries of topic, if key is not provided. Writer receives its own events too, so
+    handlers should be idempotent.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+
+    def subscribe(self, topic: str, handler: InvalidationHandler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    @abstractmethod
+    async def publish(self, topic: str, key: Optional[Any] = None) -> None:
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def _dispatch(self, topic: str, key: Optional[str]) -> None:
+        for handler in self._handlers.get(topic, []):
+            try:
+                await handler(key)
+            except Exception as e:
+                loggers.event.exception('Failed to handle invalidation of topic=%s, key=%s: %r', topic, key, e)
+
+
+class InProcessInvalidationBus(AbstractInvalidationBus):
+    """
+    Delivers events only to subscribers of current process. Is used, when there is only one bot instance
+    or database does not support notifications, for example, SQLite.
+    """
+
+    async def publish(self, topic: str, key: Optional[Any] = None) -> None:
+        await self._dispatch(topic=topic, key=None if key is None else str(key))
+
+
+class PostgresInvalidationBus(AbstractInvalidationBus):
+    """
+    Delivers events to all bot instances by PostgreSQL NOTIFY. Every instance LISTENs on dedicated connection,
+    which is held for the whole bot lifetime, so it should be opened directly to database, not through PgBouncer
+    in transaction mode. Notifications are sent through default engine, because NOTIFY works in any pool mode.
+
+    If listening connection is lost, it is opened again with exponential backoff. Events, published while connection
+    was lost, are not delivered, so all subscribers are notified without key after reconnect to drop all entries.
+    Publishing happens after commit of changes, so failed publishing is logged and does not fail the writer.
+    """
+
+    CHANNEL: str = 'cache_invalidation'
+    RECONNECT_MIN_DELAY: float = 1
+    RECONNECT_MAX_DELAY: float = 60
+
+    def __init__(self, engine: AsyncEngine = default_engine, listen_engine: Optional[AsyncEngine] = None) -> None:
+        super().__init__()
+        self._engine: AsyncEngine = engine
+        self._listen_engine: AsyncEngine = listen_engine or engine
+        self._connection: Optional[AsyncConnection] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._reconnecting: Optional[asyncio.Task] = None
+        self._stopped: bool = True
+
+    async def publish(self, topic: str, key: Optional[Any] = None) -> None:
+        payload: str = json.dumps({'topic': topic, 'key': None if key is None else str(key)})
+        try:
+            async with self._engine.connect() as connection:
+                await connection.execute(select(func.pg_notify(self.CHANNEL, payload)))
+                await connection.commit()
+        except Exception as e:
+            loggers.event.exception('Failed to publish invalidation of topic=%s, key=%s: %r', topic, key, e)
+
+    async def start(self) -> None:
+        self._stopped = False
+        await self._listen()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+            self._reconnecting = None
+
+        if self._connection is None:
+            return
+
+        connection: AsyncConnection = self._connection
+        self._connection = None
+        raw_connection: Any = await connection.get_raw_connection()
+        raw_connection.driver_connection.remove_termination_listener(self._on_termination)
+        await raw_connection.driver_connection.remove_listener(self.CHANNEL, self._on_notification)
+        await connection.close()
+
+    async def _listen(self) -> None:
+        connection: AsyncConnection = await self._listen_engine.connect()
+        try:
+            raw_connection: Any = await connection.get_raw_connection()
+            await raw_connection.driver_connection.add_listener(self.CHANNEL, self._on_notification)
+            raw_connection.driver_connection.add_termination_listener(self._on_termination)
+        except BaseException:
+            await connection.invalidate()
+            raise
+
+        self._connection = connection
+
+    def _on_termination(self, connection: Any) -> None:
+        """
+        Termination callback of asyncpg, which is called synchronously, when listening connection is closed.
+        """
+
+        if self._stopped or self._reconnecting is not None:
+            return
+
+        loggers.event.warning('Connection, listening for cache invalidations, was lost')
+        self._reconnecting = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        if self._connection is not None:
+            broken_connection: AsyncConnection = self._connection
+            self._connection = None
+            try:
+                await broken_connection.invalidate()
+            except Exception as e:
+                loggers.event.warning('Failed to invalidate lost listening connection: %r', e)
+
+        delay: float = self.RECONNECT_MIN_DELAY
+        try:
+            while not self._stopped:
+                try:
+                    await self._listen()
+                except Exception as e:
+                    loggers.event.warning('Failed to listen for cache invalidations, retry in %s seconds: %r', delay, e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+                    continue
+
+                await self._flush()
+                return
+        finally:
+            self._reconnecting = None
+
+    async def _flush(self) -> None:
+        for topic in list(self._handlers):
+            await self._dispatch(topic=topic, key=None)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """
+        Listener callback of asyncpg, which is called synchronously, so events are dispatched by separate tasks.
+        References to tasks are kept until they are done not to be garbage collected.
+        """
+
+        event: Dict[str, Optional[str]] = json.loads(payload)
+        topic: Optional[str] = event.get('topic')
+        if topic is None:
+            return
+
+        task: asyncio.Task = asyncio.create_task(self._dispatch(topic=topic, key=event.get('key')))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def create_invalidation_bus(config: DatabaseConfig = database_config) -> AbstractInvalidationBus:
+    """
+    LISTEN does not work through PgBouncer in transaction mode, so direct url to database is required in this mode.
+
+    Listening connection is held for the whole lifetime of bus, so it is opened by own engine without pool
+    instead of taking one of connections of main pool from requests.
+    """
+
+    if config.DATABASE_DIALECT != 'postgresql' or config.DATABASE_DRIVER != 'asyncpg':
+        return InProcessInvalidationBus()
+
+    if not config.DATABASE_LISTEN_URL and config.DATABASE_POOL_MODE == DatabasePoolModes.TRANSACTION:
+        raise DatabaseListenUrlRequiredError
+
+    listen_engine: AsyncEngine = create_async_engine(
+        config.DATABASE_LISTEN_URL or get_database_url(config=config),
+        poolclass=NullPool
+    )
+    return PostgresInvalidationBus(listen_engine=listen_engine)
+
+
+invalidation_bus: AbstractInvalidationBus = create_invalidation_bus()
@@ -5,6 +5,7 @@ from aiogram.types import Message, FSInputFile
 from src.help.constants import CommandNames
 from src.help.entrypoints.templates import TemplateCreator
 from src.logging_system.config import LOG_FILE
+from src.units_of_work import UpdateUnitOfWork
 from src.users.entrypoints.dependencies import check_if_user_is_admin
 from src.users.exceptions import UserHasNoPermissionsError
 
@@ -18,12 +19,12 @@ async def help_handler(message: Message) -> None:
 
 
 @help_router.message(Command(CommandNames.LOGS))
-async def logs_handler(message: Message) -> None:
+async def logs_handler(message: Message, uow: UpdateUnitOfWork) -> None:
     """
     Message, which request logs-command should not be deleted for appropriate work of @message.reply_document function.
     """
 
-    if not await check_if_user_is_admin(message=message):
+    if not await check_if_user_is_admin(message=message, uow=uow):
         raise UserHasNoPermissionsError
 
     logs: FSInputFile = FSInputFile(LOG_FILE)
@@ -1,12 +1,66 @@
+from typing import Optional
+from aiogram import Bot, loggers
 from sqlalchemy.orm import clear_mappers
 
+from src.broadcasts.adapters.orm import start_mappers as start_broadcasts_mappers
+from src.broadcasts.entrypoints.utils import start_broadcasts_watcher, stop_broadcasts
+from src.core.cache import CacheStats
+from src.core.database.config import database_config
+from src.core.database.constants import DatabasePoolModes
+from src.core.database.connection import warm_up_pool
+from src.core.invalidation import InvalidationTopics, invalidation_bus
 from src.users.adapters.orm import start_mappers as start_users_mappers
 from src.tasks.adapters.orm import start_mappers as start_tasks_mappers
+from src.tasks.service_layer.catalog import tasks_catalog
+from src.tasks.service_layer.units_of_work import SQLAlchemyTasksUnitOfWork
+from src.users.adapters.repositories import users_cache
 
 
 def on_startup() -> None:
     start_users_mappers()
     start_tasks_mappers()
+    start_broadcasts_mappers()
+
+
+async def on_dispatcher_startup(bot: Bot) -> None:
+    # Connections are not kept locally in transaction pool mode, so there is nothing to warm up:
+    if database_config.DATABASE_POOL_WARM_UP and database_config.DATABASE_POOL_MODE == DatabasePoolModes.SESSION:
+        await warm_up_pool()
+
+    await tasks_catalog.load(uow=SQLAlchemyTasksUnitOfWork(read_only=True))
+
+    invalidation_bus.subscribe(topic=InvalidationTopics.USERS, handler=invalidate_user)
+    invalidation_bus.subscribe(topic=InvalidationTopics.TASKS_CATALOG, handler=invalidate_tasks_catalog)
+    await invalidation_bus.start()
+
+    # Broadcasts, interrupted by shutdown or failure of any instance, are continued from their checkpoints:
+    start_broadcasts_watcher(bot=bot)
+
+
+async def on_dispatcher_shutdown() -> None:
+    await stop_broadcasts()
+    await invalidation_bus.stop()
+
+    users_cache_stats: CacheStats = users_cache.stats()
+    loggers.dispatcher.info(
+        'Users cache: %s hits, %s misses, hit ratio %.2f',
+        users_cache_stats.hits,
+        users_cache_stats.misses,
+        users_cache_stats.hit_ratio
+    )
+
+
+async def invalidate_user(key: Optional[str]) -> None:
+    # Users are published with their ids, all users are invalidated after lost invalidations:
+    if key is None:
+        users_cache.clear()
+    else:
+        await users_cache.delete(key=key)
+
+
+async def invalidate_tasks_catalog(key: Optional[str]) -> None:
+    # Snapshot is loaded again on next read:
+    tasks_catalog.clear()
 
 
 def on_shutdown() -> None:
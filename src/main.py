@@ -4,12 +4,45 @@ from aiogram import Bot
 
 from src.app import dispatcher
 from src.bot import TopvisorBot
+from src.config import bot_config
+from src.constants import LaunchModes
 from src.lifespan import on_startup, on_shutdown
 from src.logging_system.config import LOGGING_CONFIG
+from src.webhook import create_webhook_application, run_webhook_application
 
 
 async def launch_bot(bot: Bot) -> None:
-    await dispatcher.start_polling(bot)
+    if bot_config.LAUNCH_MODE == LaunchModes.WEBHOOK:
+        await launch_webhook(bot=bot)
+    elif bot_config.LAUNCH_MODE == LaunchModes.POLLING:
+        # Telegram does not give updates by polling, while webhook is set:
+        await bot.delete_webhook()
+        await dispatcher.start_polling(bot)
+
+
+async def launch_webhook(bot: Bot) -> None:
+    if not bot_config.WEBHOOK_URL:
+        raise ValueError('WEBHOOK_URL is required in webhook launch mode')
+
+    # Without secret anyone, who knows url of webhook, could send fake updates to bot:
+    if not bot_config.WEBHOOK_SECRET:
+        raise ValueError('WEBHOOK_SECRET is required in webhook launch mode')
+
+    await bot.set_webhook(
+        url=f'{bot_config.WEBHOOK_URL}{bot_config.WEBHOOK_PATH}',
+        secret_token=bot_config.WEBHOOK_SECRET,
+        allowed_updates=dispatcher.resolve_used_update_types()
+    )
+    await run_webhook_application(
+        application=create_webhook_application(
+            dispatcher=dispatcher,
+            bot=bot,
+            path=bot_config.WEBHOOK_PATH,
+            secret_token=bot_config.WEBHOOK_SECRET
+        ),
+        host=bot_config.WEBHOOK_HOST,
+        port=bot_config.WEBHOOK_PORT
+    )
 
 
 if __name__ == '__main__':
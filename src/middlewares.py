@@ -1,8 +1,67 @@
-from aiogram import loggers, Bot
-from aiogram.client.session.middlewares.base import NextRequestMiddlewareType
-from aiogram.methods import TelegramMethod
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, Union
+from aiogram import loggers, Bot, BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    TelegramMethod,
+    CopyMessage,
+    CopyMessages,
+    ForwardMessage,
+    ForwardMessages,
+    SendAnimation,
+    SendAudio,
+    SendContact,
+    SendDice,
+    SendDocument,
+    SendGame,
+    SendInvoice,
+    SendLocation,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+    SendPoll,
+    SendSticker,
+    SendVenue,
+    SendVideo,
+    SendVideoNote,
+    SendVoice
+)
 from aiogram.methods.base import TelegramType, Response
 from aiogram.client.session.middlewares.request_logging import RequestLogging
+from aiogram.types import TelegramObject, User
+
+from src.core.concurrency import TokenBucket
+from src.units_of_work import UpdateUnitOfWork, SQLAlchemyUpdateUnitOfWork
+
+
+# Requests, which are made, while it is set, are background ones, for example, requests of broadcasts:
+background_requests: ContextVar[bool] = ContextVar('background_requests', default=False)
+
+# Methods, which send messages to chat, so they are limited by global and per chat limits of Telegram:
+SEND_METHODS: Tuple[Type[TelegramMethod[Any]], ...] = (
+    CopyMessage,
+    CopyMessages,
+    ForwardMessage,
+    ForwardMessages,
+    SendAnimation,
+    SendAudio,
+    SendContact,
+    SendDice,
+    SendDocument,
+    SendGame,
+    SendInvoice,
+    SendLocation,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+    SendPoll,
+    SendSticker,
+    SendVenue,
+    SendVideo,
+    SendVideoNote,
+    SendVoice
+)
 
 
 class RequestLoggingMiddleware(RequestLogging):
@@ -21,3 +80,141 @@ class RequestLoggingMiddleware(RequestLogging):
             )
 
         return await make_request(bot=bot, method=method)
+
+
+class RateLimiterMiddleware(BaseRequestMiddleware):
+    """
+    Request middleware, which keeps bot within Telegram limits on sending messages: one global token bucket for all
+    chats and one token bucket per chat. Limits of Telegram apply only to sending of messages, so other methods,
+    for example, deleting messages or answering callback queries, are made without waiting for turn.
+
+    If Telegram still answers with "retry after", global bucket and bucket of chat are paused for requested time and
+    request is queued again, until retries are exhausted.
+
+    Background requests additionally pass through own token bucket, which has only a share of global rate, so they
+    never take all global rate and do not delay answers to users.
+
+    Exposes depth of queue of waiting requests and time, which requests have spent in queue, for monitoring,
+    and logs them, when request has waited for its turn longer than slow_wait_time seconds.
+    """
+
+    def __init__(
+            self,
+            global_rate: float = 30,
+            chat_rate: float = 1,
+            chat_burst: int = 1,
+            max_retries: int = 3,
+            max_chats_buckets: int = 10000,
+            background_rate_share: float = 0.5,
+            slow_wait_time: float = 1,
+            limited_methods: Tuple[Type[TelegramMethod[Any]], ...] = SEND_METHODS
+    ) -> None:
+
+        self._global_bucket: TokenBucket = TokenBucket(rate=global_rate, capacity=global_rate)
+        self._background_bucket: TokenBucket = TokenBucket(rate=global_rate * background_rate_share, capacity=1)
+        self._chats_buckets: Dict[Union[int, str], TokenBucket] = {}
+        self._chat_rate: float = chat_rate
+        self._chat_burst: int = chat_burst
+        self._max_retries: int = max_retries
+        self._max_chats_buckets: int = max_chats_buckets
+        self._slow_wait_time: float = slow_wait_time
+        self._limited_methods: Tuple[Type[TelegramMethod[Any]], ...] = limited_methods
+        self.queue_depth: int = 0
+        self.requests_count: int = 0
+        self.total_wait_time: float = 0
+        self.last_wait_time: float = 0
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+
+        if not isinstance(method, self._limited_methods):
+            return await make_request(bot, method)
+
+        chat_id: Union[int, str] = getattr(method, 'chat_id')
+        retries: int = 0
+        while True:
+            await self._wait_for_turn(chat_id=chat_id)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if retries >= self._max_retries:
+                    raise
+
+                retries += 1
+                loggers.middlewares.warning(
+                    msg=f'Method={type(method).__name__} will be retried after {e.retry_after} seconds, '
+                        f'retry {retries} of {self._max_retries}'
+                )
+
+                self._global_bucket.pause(seconds=e.retry_after)
+                self._get_chat_bucket(chat_id).pause(seconds=e.retry_after)
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.requests_count if self.requests_count else 0
+
+    async def _wait_for_turn(self, chat_id: Union[int, str]) -> None:
+        self.queue_depth += 1
+        try:
+            wait_time: float = await self._background_bucket.acquire() if background_requests.get() else 0
+
+            # Waits for chat's turn first, so requests to slow chat do not hold tokens of global bucket:
+            wait_time += await self._get_chat_bucket(chat_id).acquire()
+            wait_time += await self._global_bucket.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        self.requests_count += 1
+        self.total_wait_time += wait_time
+        self.last_wait_time = wait_time
+        if wait_time >= self._slow_wait_time:
+            loggers.middlewares.warning(
+                'Request has waited for its turn %.2f seconds, queue depth=%s, average wait time=%.2f seconds',
+                wait_time,
+                self.queue_depth,
+                self.average_wait_time
+            )
+
+    def _get_chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        bucket: Optional[TokenBucket] = self._chats_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chats_buckets) >= self._max_chats_buckets:
+                # Full buckets of idle chats are equal to new ones, so they can be dropped:
+                self._chats_buckets = {key: value for key, value in self._chats_buckets.items() if not value.is_full()}
+
+            bucket = TokenBucket(rate=self._chat_rate, capacity=self._chat_burst)
+            self._chats_buckets[chat_id] = bucket
+
+        return bucket
+
+
+class UnitOfWorkMiddleware(BaseMiddleware):
+    """
+    Outer middleware, which provides one unit of work per update to handlers by "uow" keyword argument.
+
+    Unit of work is created with id of user, from whom update came, which is resolved by aiogram's
+    UserContextMiddleware, registered before all other outer middlewares.
+    """
+
+    def __init__(
+            self,
+            uow_factory: Callable[[Optional[int]], UpdateUnitOfWork] = SQLAlchemyUpdateUnitOfWork
+    ) -> None:
+
+        self._uow_factory: Callable[[Optional[int]], UpdateUnitOfWork] = uow_factory
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+
+        user: Optional[User] = data.get('event_from_user')
+        async with self._uow_factory(user.id if user else None) as uow:
+            data['uow'] = uow
+            return await handler(event, data)
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from sqlalchemy import select, Result, Row
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.selectable import NamedFromClause
+
+from src.core.database.interfaces import SQLAlchemyAbstractReadModel
+from src.core.interfaces import AbstractReadModel
+from src.tasks.adapters.orm import tasks_table, tasks_associations_table
+from src.tasks.domain.models import TaskAssociationModel, TaskModel
+from src.users.adapters.orm import users_table
+from src.users.domain.models import UserModel
+
+
+ConfirmationRow = Tuple[TaskAssociationModel, TaskModel, UserModel, Optional[UserModel]]
+
+
+class ConfirmationsReadModel(AbstractReadModel, ABC):
+    """
+    An interface for reading data of task completeness confirmation, which is spread between tasks and users modules,
+    so it lives on composition layer near update unit of work instead of repositories of any module.
+    """
+
+    @abstractmethod
+    async def get_confirmation_row(self, task_association_id: int, admin_id: int) -> Optional[ConfirmationRow]:
+        """
+        Returns (task association, task, user, admin) row, where admin is None, if there is no user with provided id.
+        """
+
+        raise NotImplementedError
+
+
+class SQLAlchemyConfirmationsReadModel(SQLAlchemyAbstractReadModel, ConfirmationsReadModel):
+
+    async def get_confirmation_row(self, task_association_id: int, admin_id: int) -> Optional[ConfirmationRow]:
+        user_table: NamedFromClause = users_table.alias('user')
+        admin_table: NamedFromClause = users_table.alias('admin')
+        result: Result = await self._session.execute(
+            select(
+                TaskAssociationModel,
+                TaskModel,
+                aliased(UserModel, user_table),
+                aliased(UserModel, admin_table)
+            ).join_from(
+                TaskAssociationModel,
+                TaskModel,
+                tasks_associations_table.c.task_id == tasks_table.c.id
+            ).join(
+                user_table,
+                tasks_associations_table.c.user_id == user_table.c.id
+            ).outerjoin(
+                admin_table,
+                admin_table.c.id == admin_id
+            ).where(
+                tasks_associations_table.c.id == task_association_id
+            )
+        )
+
+        row: Optional[Row] = result.one_or_none()
+        if not row:
+            return None
+
+        task_association, task, user, admin = row
+        return task_association, task, user, admin
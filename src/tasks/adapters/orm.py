@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, String, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import Table, Column, String, DateTime, Boolean, Integer, ForeignKey, Index, not_, and_
 from datetime import datetime, timezone
 
 from src.core.database.metadata import mapper_registry
@@ -31,6 +31,28 @@ tasks_associations_table = Table(
     Column('task_archived', Boolean, nullable=False, default=False)
 )
 
+Index(
+    'ix_tasks_associations_user_id_task_id',
+    tasks_associations_table.c.user_id,
+    tasks_associations_table.c.task_id,
+    unique=True
+)
+
+Index('ix_tasks_associations_task_id', tasks_associations_table.c.task_id)
+
+# Partial index for user's active tasks lookups. Queries should use the same predicate to be able to use this index:
+TASKS_ASSOCIATIONS_ACTIVE_PREDICATE = and_(
+    not_(tasks_associations_table.c.task_completed),
+    not_(tasks_associations_table.c.task_archived)
+)
+
+Index(
+    'ix_tasks_associations_active_user_id',
+    tasks_associations_table.c.user_id,
+    postgresql_where=TASKS_ASSOCIATIONS_ACTIVE_PREDICATE,
+    sqlite_where=TASKS_ASSOCIATIONS_ACTIVE_PREDICATE
+)
+
 
 def start_mappers():
     """
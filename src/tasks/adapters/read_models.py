@@ -0,0 +1,47 @@
+from typing import List, Tuple
+from sqlalchemy import select, Result
+
+from src.core.database.interfaces import SQLAlchemyAbstractReadModel
+from src.tasks.adapters.orm import tasks_table, tasks_associations_table, TASKS_ASSOCIATIONS_ACTIVE_PREDICATE
+from src.tasks.interfaces.read_models import TasksReadModel
+
+
+class SQLAlchemyTasksReadModel(SQLAlchemyAbstractReadModel, TasksReadModel):
+
+    async def get_user_tasks_statistics(self, user_id: int) -> List[Tuple[str, bool]]:
+        result: Result = await self._session.execute(
+            select(
+                tasks_table.c.description,
+                tasks_associations_table.c.task_completed
+            ).join_from(
+                tasks_associations_table,
+                tasks_table,
+                tasks_associations_table.c.task_id == tasks_table.c.id
+            ).where(
+                tasks_associations_table.c.user_id == user_id,
+                tasks_associations_table.c.task_archived.is_(False)
+            ).order_by(
+                tasks_associations_table.c.id
+            )
+        )
+
+        return [(description, task_completed) for description, task_completed in result.tuples()]
+
+    async def get_user_active_tasks(self, user_id: int) -> List[Tuple[int, str]]:
+        result: Result = await self._session.execute(
+            select(
+                tasks_associations_table.c.id,
+                tasks_table.c.description
+            ).join_from(
+                tasks_associations_table,
+                tasks_table,
+                tasks_associations_table.c.task_id == tasks_table.c.id
+            ).where(
+                tasks_associations_table.c.user_id == user_id,
+                TASKS_ASSOCIATIONS_ACTIVE_PREDICATE
+            ).order_by(
+                tasks_associations_table.c.id
+            )
+        )
+
+        return [(task_association_id, description) for task_association_id, description in result.tuples()]
@@ -1,6 +1,7 @@
-from typing import List, Optional, Sequence, Any
-from sqlalchemy import insert, select, delete, update, Result, RowMapping, Row
+from typing import AsyncIterator, List, Optional, Sequence, Any, Set
+from sqlalchemy import insert, select, delete, update, Result, RowMapping, Row, Select
 
+from src.tasks.adapters.orm import tasks_table, tasks_associations_table
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
 from src.tasks.domain.models import TaskModel, TaskAssociationModel
 from src.core.database.interfaces.repositories import SQLAlchemyAbstractRepository
@@ -24,6 +25,28 @@ class SQLAlchemyTasksRepository(SQLAlchemyAbstractRepository, TasksRepository):
 
         return result.scalar_one()
 
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskModel]:
+        """
+        Inserts all provided models by one multi-row INSERT statement instead of one INSERT per model.
+
+        Checking by asserts, that expected return type is equal to fact return type.
+        """
+
+        if not models:
+            return []
+
+        result: Result = await self._session.execute(
+            insert(TaskModel).returning(TaskModel),
+            [await model.to_dict(exclude={'id'}) for model in models]
+        )
+        tasks: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(tasks, List)
+        for task in tasks:
+            assert isinstance(task, TaskModel)
+
+        return tasks
+
     async def update(self, id: int, model: AbstractModel) -> TaskModel:
         result: Result = await self._session.execute(
             update(TaskModel).filter_by(id=id).values(**await model.to_dict(exclude={'id'})).returning(TaskModel)
@@ -52,6 +75,64 @@ class SQLAlchemyTasksRepository(SQLAlchemyAbstractRepository, TasksRepository):
 
         return tasks
 
+    async def stream(self) -> AsyncIterator[TaskModel]:
+        """
+        Fetches tasks from database by batches. Should not be used within read only units of work.
+        """
+
+        async for task in self._stream_scalars(query=select(TaskModel).order_by(tasks_table.c.id)):
+            assert isinstance(task, TaskModel)
+            yield task
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskModel]:
+        query: Select = select(TaskModel).order_by(tasks_table.c.id).limit(limit)
+        if after_id is not None:
+            query = query.where(tasks_table.c.id > after_id)
+
+        result: Result = await self._session.execute(query)
+        tasks: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(tasks, List)
+        for task in tasks:
+            assert isinstance(task, TaskModel)
+
+        return tasks
+
+    async def archive_tasks_except(self, descriptions: Set[str]) -> List[int]:
+        """
+        Archives all not archived tasks, which descriptions are not in provided descriptions, by one UPDATE statement.
+        Returns ids of archived tasks.
+        """
+
+        result: Result = await self._session.execute(
+            update(
+                TaskModel
+            ).where(
+                tasks_table.c.is_archived.is_(False),
+                tasks_table.c.description.not_in(descriptions)
+            ).values(
+                is_archived=True
+            ).returning(
+                tasks_table.c.id
+            )
+        )
+
+        return list(result.scalars().all())
+
+    async def set_archived_status_by_ids(self, ids: List[int], is_archived: bool) -> None:
+        if not ids:
+            return
+
+        await self._session.execute(
+            update(
+                TaskModel
+            ).where(
+                tasks_table.c.id.in_(ids)
+            ).values(
+                is_archived=is_archived
+            )
+        )
+
 
 class SQLAlchemyTasksAssociationsRepository(SQLAlchemyAbstractRepository, TasksAssociationsRepository):
 
@@ -66,6 +147,28 @@ class SQLAlchemyTasksAssociationsRepository(SQLAlchemyAbstractRepository, TasksA
 
         return result.scalar_one()
 
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskAssociationModel]:
+        """
+        Inserts all provided models by one multi-row INSERT statement instead of one INSERT per model.
+
+        Checking by asserts, that expected return type is equal to fact return type.
+        """
+
+        if not models:
+            return []
+
+        result: Result = await self._session.execute(
+            insert(TaskAssociationModel).returning(TaskAssociationModel),
+            [await model.to_dict(exclude={'id'}) for model in models]
+        )
+        task_associations: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(task_associations, List)
+        for task_association in task_associations:
+            assert isinstance(task_association, TaskAssociationModel)
+
+        return task_associations
+
     async def update(self, id: int, model: AbstractModel) -> TaskAssociationModel:
         result: Result = await self._session.execute(
             update(
@@ -102,6 +205,30 @@ class SQLAlchemyTasksAssociationsRepository(SQLAlchemyAbstractRepository, TasksA
 
         return task_associations
 
+    async def stream(self) -> AsyncIterator[TaskAssociationModel]:
+        """
+        Fetches task_associations from database by batches. Should not be used within read only units of work.
+        """
+
+        query: Select = select(TaskAssociationModel).order_by(tasks_associations_table.c.id)
+        async for task_association in self._stream_scalars(query=query):
+            assert isinstance(task_association, TaskAssociationModel)
+            yield task_association
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskAssociationModel]:
+        query: Select = select(TaskAssociationModel).order_by(tasks_associations_table.c.id).limit(limit)
+        if after_id is not None:
+            query = query.where(tasks_associations_table.c.id > after_id)
+
+        result: Result = await self._session.execute(query)
+        task_associations: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(task_associations, List)
+        for task_association in task_associations:
+            assert isinstance(task_association, TaskAssociationModel)
+
+        return task_associations
+
     async def get_task_associations_by_task_id(self, task_id: int) -> List[TaskAssociationModel]:
         result: Result = await self._session.execute(select(TaskAssociationModel).filter_by(task_id=task_id))
         task_associations: Sequence[Row | RowMapping | Any] = result.scalars().all()
@@ -121,3 +248,42 @@ class SQLAlchemyTasksAssociationsRepository(SQLAlchemyAbstractRepository, TasksA
             assert isinstance(task_association, TaskAssociationModel)
 
         return task_associations
+
+    async def set_archived_status_by_task_ids(self, task_ids: List[int], task_archived: bool) -> None:
+        if not task_ids:
+            return
+
+        await self._session.execute(
+            update(
+                TaskAssociationModel
+            ).where(
+                tasks_associations_table.c.task_id.in_(task_ids)
+            ).values(
+                task_archived=task_archived
+            )
+        )
+
+    async def set_completed_status_if_active(self, id: int) -> Optional[TaskAssociationModel]:
+        """
+        Compare-and-set of task association completed status by one UPDATE statement.
+
+        Task association is marked as completed only if it is neither completed nor archived. Returns updated task
+        association, if current call has changed the status, and None, if task association was already completed,
+        archived or does not exist.
+        """
+
+        result: Result = await self._session.execute(
+            update(
+                TaskAssociationModel
+            ).where(
+                tasks_associations_table.c.id == id,
+                tasks_associations_table.c.task_completed.is_(False),
+                tasks_associations_table.c.task_archived.is_(False)
+            ).values(
+                task_completed=True
+            ).returning(
+                TaskAssociationModel
+            )
+        )
+
+        return result.scalar_one_or_none()
@@ -54,4 +54,5 @@ class MessageFileTypes:
 
 
 MARKUP_MAX_LENGTH: int = 1
+ADMINS_NOTIFICATION_CONCURRENCY: int = 5
 UPDATE_TASKS_DOCUMENT_APPROPRIATE_EXTENSIONS: Tuple[str, ...] = ('.yaml', '.yml')
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Tuple
 
 from src.core.interfaces import AbstractModel
+from src.users.domain.models import UserModel
 
 
 @dataclass
@@ -30,3 +31,45 @@ class TaskAssociationModel(AbstractModel):
 
     def __eq__(self, other: Any) -> bool:
         return hash(self) == hash(other)
+
+
+@dataclass(frozen=True)
+class TasksCatalogDiff:
+    """
+    Report of tasks catalog synchronization, which describes what happened with every task during synchronization.
+
+    actual: all not archived tasks after synchronization in order of their appearance in provided tasks.
+    """
+
+    added: List[TaskModel] = field(default_factory=list)
+    archived: List[TaskModel] = field(default_factory=list)
+    reopened: List[TaskModel] = field(default_factory=list)
+    unchanged: List[TaskModel] = field(default_factory=list)
+    actual: List[TaskModel] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ConfirmationContext:
+    """
+    All data, which is needed by admin to confirm or reject task completeness of user.
+    """
+
+    task_association: TaskAssociationModel
+    task: TaskModel
+    user: UserModel
+    admin: UserModel
+
+
+@dataclass(frozen=True)
+class TasksCatalogSnapshot:
+    """
+    Immutable state of tasks catalog at some moment.
+
+    version: number of snapshot, which is increased by every reload of catalog.
+    tasks: all tasks, including archived, by their ids.
+    actual: all not archived tasks ordered by id.
+    """
+
+    version: int
+    tasks: Mapping[int, TaskModel]
+    actual: Tuple[TaskModel, ...]
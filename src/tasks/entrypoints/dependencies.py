@@ -1,84 +1,155 @@
-from typing import List, Dict
+from dataclasses import replace
+from typing import List, Optional
 from aiogram.types import Message
 
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
+from src.tasks.domain.models import TaskModel, TaskAssociationModel, TasksCatalogDiff, ConfirmationContext
 from src.tasks.entrypoints.views import TasksViews
-from src.tasks.service_layer.service import TasksService
-from src.tasks.service_layer.units_of_work import SQLAlchemyTasksUnitOfWork
-from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme
+from src.tasks.exceptions import TaskAssociationNotFoundError
+from src.tasks.service_layer.catalog import tasks_catalog
+from src.tasks.service_layer.service import TasksService, TasksCatalogSync
+from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme, ActualTaskScheme
+from src.read_models import ConfirmationRow
+from src.units_of_work import UpdateUnitOfWork
 from src.users.domain.models import UserModel
-from src.users.entrypoints.dependencies import get_all_users, get_user_by_id
+from src.users.exceptions import AdminNotFoundError
+from src.users.entrypoints.dependencies import get_all_users_ids, get_user_by_id
 
 
-async def get_user_tasks_statistics(message: Message) -> List[UserTaskStatisticsResponseScheme]:
+async def get_user_tasks_statistics(message: Message, uow: UpdateUnitOfWork) -> List[UserTaskStatisticsResponseScheme]:
     assert message.from_user is not None  # Check for mypy. Also register should work only with private messages
 
-    tasks_views: TasksViews = TasksViews(uow=SQLAlchemyTasksUnitOfWork())
+    tasks_views: TasksViews = TasksViews(uow=uow.tasks_read_only_uow)
     return await tasks_views.get_user_tasks_statistics(user_id=message.from_user.id)
 
 
-async def get_actual_tasks() -> List[TaskModel]:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    return [task for task in await tasks_service.get_all_tasks() if not task.is_archived]
+async def get_actual_tasks(uow: UpdateUnitOfWork) -> List[ActualTaskScheme]:
+    tasks_views: TasksViews = TasksViews(uow=uow.tasks_read_only_uow)
+    return await tasks_views.get_all_tasks()
 
 
-async def update_tasks(tasks: List[TaskModel]) -> List[TaskModel]:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    await tasks_service.archive_old_tasks(new_tasks=tasks)
+async def update_tasks(tasks: List[TaskModel], uow: UpdateUnitOfWork) -> TasksCatalogDiff:
+    tasks_catalog_sync: TasksCatalogSync = TasksCatalogSync(uow=uow.tasks_uow)
+    users_ids: List[int] = await get_all_users_ids(uow=uow)
+    tasks_catalog_diff: TasksCatalogDiff = await tasks_catalog_sync.sync(tasks=tasks, users_ids=users_ids)
 
-    users: List[UserModel] = await get_all_users()
-    for task in tasks:
-        if not await tasks_service.check_task_existence(description=task.description):
-            await tasks_service.create_task(
-                task=task,
-                users=users
-            )
-        else:
-            task = await tasks_service.get_task_by_description(description=task.description)
-            if task.is_archived:
-                await tasks_service.reopen_task(id=task.id)
+    # Catalog is reloaded from primary database after commit of changes:
+    await tasks_catalog.load(uow=uow.tasks_uow)
+    uow.identity_map.clear(TaskModel)
+    uow.identity_map.clear(TaskAssociationModel)
+    return tasks_catalog_diff
 
-    return await get_actual_tasks()
 
-
-async def get_user_active_tasks(message: Message) -> List[UserActiveTaskScheme]:
+async def get_user_active_tasks(message: Message, uow: UpdateUnitOfWork) -> List[UserActiveTaskScheme]:
     assert message.from_user is not None
 
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    user_active_task_associations: List[TaskAssociationModel] = [
-        task_association for task_association in await tasks_service.get_user_tasks_associations(
-            user_id=message.from_user.id
-        ) if not (task_association.task_archived or task_association.task_completed)
-    ]
+    tasks_views: TasksViews = TasksViews(uow=uow.tasks_read_only_uow)
+    return await tasks_views.get_user_active_tasks(user_id=message.from_user.id)
+
 
-    tasks_storage: Dict[int, TaskModel] = {task.id: task for task in await tasks_service.get_all_tasks()}
-    return [
-        UserActiveTaskScheme(
-            description=tasks_storage[task_association.task_id].description,
-            task_association_id=task_association.id
-        ) for task_association in user_active_task_associations
-    ]
+async def get_task_by_association_id(task_association_id: int, uow: UpdateUnitOfWork) -> TaskModel:
+    task_association: TaskAssociationModel = await get_task_association_by_id(
+        task_association_id=task_association_id,
+        uow=uow
+    )
 
+    task: Optional[TaskModel] = uow.identity_map.get(TaskModel, task_association.task_id)
+    if task:
+        return task
 
-async def get_task_by_association_id(task_association_id: int) -> TaskModel:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    return await tasks_service.get_task_by_association_id(task_association_id=task_association_id)
+    tasks_service: TasksService = TasksService(uow=uow.tasks_read_only_uow)
+    return await uow.identity_map.add(
+        id=task_association.task_id,
+        model=await tasks_service.get_catalog_task(id=task_association.task_id)
+    )
 
 
-async def get_user_by_association_id(task_association_id: int) -> UserModel:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    task_association: TaskAssociationModel = await tasks_service.get_task_association_by_id(
-        task_association_id=task_association_id
+async def get_user_by_association_id(task_association_id: int, uow: UpdateUnitOfWork) -> UserModel:
+    task_association: TaskAssociationModel = await get_task_association_by_id(
+        task_association_id=task_association_id,
+        uow=uow
     )
 
-    return await get_user_by_id(id=task_association.user_id)
+    return await get_user_by_id(id=task_association.user_id, uow=uow)
+
 
+async def get_task_association_by_id(task_association_id: int, uow: UpdateUnitOfWork) -> TaskAssociationModel:
+    task_association: Optional[TaskAssociationModel] = uow.identity_map.get(TaskAssociationModel, task_association_id)
+    if task_association:
+        return task_association
 
-async def get_task_association_by_id(task_association_id: int) -> TaskAssociationModel:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
-    return await tasks_service.get_task_association_by_id(task_association_id=task_association_id)
+    tasks_service: TasksService = TasksService(uow=uow.tasks_read_only_uow)
+    return await uow.identity_map.add(
+        id=task_association_id,
+        model=await tasks_service.get_task_association_by_id(task_association_id=task_association_id)
+    )
 
 
-async def set_task_competed_for_user(task_association_id: int) -> None:
-    tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
+async def set_task_competed_for_user(task_association_id: int, uow: UpdateUnitOfWork) -> None:
+    uow.identity_map.discard(TaskAssociationModel, task_association_id)
+    tasks_service: TasksService = TasksService(uow=uow.tasks_uow)
     await tasks_service.set_task_association_completed_status(task_association_id=task_association_id)
+
+
+async def get_confirmation_context(
+        task_association_id: int,
+        admin_id: int,
+        uow: UpdateUnitOfWork
+) -> ConfirmationContext:
+
+    # Confirmation flow is checked right before changing task status, so it is read from primary database:
+    async with uow.tasks_uow:
+        return await _load_confirmation_context(task_association_id=task_association_id, admin_id=admin_id, uow=uow)
+
+
+async def confirm_task_completeness(
+        task_association_id: int,
+        admin_id: int,
+        uow: UpdateUnitOfWork
+) -> Optional[ConfirmationContext]:
+    """
+    Loads confirmation context and sets task association completed status by compare-and-set in one transaction.
+
+    Returns confirmation context, only if task completeness was confirmed by current call, so concurrent admins'
+    confirmations notify user exactly once. If task association was already completed or archived, returns None.
+    """
+
+    uow.identity_map.discard(TaskAssociationModel, task_association_id)
+    async with uow.tasks_uow as tasks_uow:
+        confirmation_context: ConfirmationContext = await _load_confirmation_context(
+            task_association_id=task_association_id,
+            admin_id=admin_id,
+            uow=uow
+        )
+
+        task_association: Optional[TaskAssociationModel] = (
+            await tasks_uow.tasks_associations.set_completed_status_if_active(id=task_association_id)
+        )
+        if not task_association:
+            return None
+
+        # Admin confirms task on behalf of its owner, so owner should read completed status from primary database:
+        tasks_uow.register_affected_users(users_ids=[task_association.user_id])
+        await tasks_uow.commit()
+
+    return replace(confirmation_context, task_association=task_association)
+
+
+async def _load_confirmation_context(
+        task_association_id: int,
+        admin_id: int,
+        uow: UpdateUnitOfWork
+) -> ConfirmationContext:
+
+    confirmation_row: Optional[ConfirmationRow] = await uow.confirmations.get_confirmation_row(
+        task_association_id=task_association_id,
+        admin_id=admin_id
+    )
+
+    if not confirmation_row:
+        raise TaskAssociationNotFoundError
+
+    task_association, task, user, admin = confirmation_row
+    if not admin:
+        raise AdminNotFoundError
+
+    return ConfirmationContext(task_association=task_association, task=task, user=user, admin=admin)
@@ -1,19 +1,21 @@
-from aiogram import Router, F, Bot
+from aiogram import Router, F, Bot, loggers
 from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery
-from typing import List
+from typing import Dict, List, Optional
 
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.entrypoints.dependencies import create_broadcast
+from src.broadcasts.entrypoints.utils import start_broadcast
 from src.core.utils import get_substring_after_chars
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
+from src.tasks.domain.models import TaskModel, TasksCatalogDiff, ConfirmationContext
 from src.tasks.entrypoints.callback_data import CompleteTaskCallbackData, ConfirmTaskCompletenessCallbackData
 from src.tasks.entrypoints.dependencies import (
     get_user_tasks_statistics,
     update_tasks,
     get_user_active_tasks,
     get_task_by_association_id,
-    set_task_competed_for_user,
-    get_user_by_association_id,
-    get_task_association_by_id
+    get_confirmation_context,
+    confirm_task_completeness
 )
 from src.tasks.constants import CommandNames, ConfirmTaskCompletenessData, CallbackDataActions, MessageFileTypes
 from src.tasks.entrypoints.schemas import (
@@ -23,16 +25,16 @@ from src.tasks.entrypoints.schemas import (
 from src.tasks.entrypoints.templates import TemplateCreator
 from src.tasks.entrypoints.markups import MarkupCreator
 from src.tasks.entrypoints.utils import get_new_tasks_from_message, send_task_on_confirmation
-from src.users.domain.models import UserModel
-from src.users.entrypoints.dependencies import get_user_by_id
+from src.units_of_work import UpdateUnitOfWork
+from src.users.constants import AdminsIds
 
 tasks_router: Router = Router()
 
 
 @tasks_router.message(Command(CommandNames.USER_TASKS_STATISTICS))
-async def user_tasks_statistics_handler(message: Message) -> None:
+async def user_tasks_statistics_handler(message: Message, uow: UpdateUnitOfWork) -> None:
     await message.delete()
-    tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(message=message)
+    tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(message=message, uow=uow)
     await message.answer(
         text=await TemplateCreator.user_tasks_statistics_message(
             tasks_statistics=tasks_statistics
@@ -41,9 +43,9 @@ async def user_tasks_statistics_handler(message: Message) -> None:
 
 
 @tasks_router.message(Command(CommandNames.COMPLETE_TASK))
-async def complete_task_handler(message: Message) -> None:
+async def complete_task_handler(message: Message, uow: UpdateUnitOfWork) -> None:
     await message.delete()
-    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message)
+    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message, uow=uow)
     if not user_active_tasks:
         await message.answer(text=await TemplateCreator.all_tasks_already_completed_by_user())
     else:
@@ -57,12 +59,16 @@ async def complete_task_handler(message: Message) -> None:
 async def prove_completed_task_handler(
         query: CallbackQuery,
         callback_data: CompleteTaskCallbackData,
-        bot: Bot
+        bot: Bot,
+        uow: UpdateUnitOfWork
 ) -> None:
 
     assert query.message is not None
     await bot.delete_message(chat_id=query.message.chat.id, message_id=query.message.message_id)
-    task: TaskModel = await get_task_by_association_id(task_association_id=callback_data.task_association_id)
+    task: TaskModel = await get_task_by_association_id(
+        task_association_id=callback_data.task_association_id,
+        uow=uow
+    )
     await bot.send_message(
         chat_id=query.message.chat.id,
         text=await TemplateCreator.prove_completed_task_message(
@@ -78,24 +84,22 @@ async def prove_completed_task_handler(
 async def confirm_task_completeness_handler(
         query: CallbackQuery,
         callback_data: ConfirmTaskCompletenessCallbackData,
-        bot: Bot
+        bot: Bot,
+        uow: UpdateUnitOfWork
 ) -> None:
 
-    task_association: TaskAssociationModel = await get_task_association_by_id(
-        task_association_id=callback_data.task_association_id
+    confirmation_context: Optional[ConfirmationContext] = await confirm_task_completeness(
+        task_association_id=callback_data.task_association_id,
+        admin_id=query.from_user.id,
+        uow=uow
     )
 
-    if not task_association.task_completed:
-        await set_task_competed_for_user(task_association_id=callback_data.task_association_id)
-
-        task: TaskModel = await get_task_by_association_id(task_association_id=callback_data.task_association_id)
-        user: UserModel = await get_user_by_association_id(task_association_id=callback_data.task_association_id)
-        admin: UserModel = await get_user_by_id(id=query.from_user.id)
+    if confirmation_context:
         await bot.send_message(
-            chat_id=user.id,
+            chat_id=confirmation_context.user.id,
             text=await TemplateCreator.task_completeness_confirmed_message(
-                task=task,
-                admin=admin
+                task=confirmation_context.task,
+                admin=confirmation_context.admin
             )
         )
 
@@ -116,22 +120,22 @@ async def confirm_task_completeness_handler(
 async def reject_task_completeness_handler(
         query: CallbackQuery,
         callback_data: ConfirmTaskCompletenessCallbackData,
-        bot: Bot
+        bot: Bot,
+        uow: UpdateUnitOfWork
 ) -> None:
 
-    task_association: TaskAssociationModel = await get_task_association_by_id(
-        task_association_id=callback_data.task_association_id
+    confirmation_context: ConfirmationContext = await get_confirmation_context(
+        task_association_id=callback_data.task_association_id,
+        admin_id=query.from_user.id,
+        uow=uow
     )
 
-    if not task_association.task_completed:
-        task: TaskModel = await get_task_by_association_id(task_association_id=callback_data.task_association_id)
-        user: UserModel = await get_user_by_association_id(task_association_id=callback_data.task_association_id)
-        admin: UserModel = await get_user_by_id(id=query.from_user.id)
+    if not confirmation_context.task_association.task_completed:
         await bot.send_message(
-            chat_id=user.id,
+            chat_id=confirmation_context.user.id,
             text=await TemplateCreator.task_completeness_rejected_message(
-                task=task,
-                admin=admin
+                task=confirmation_context.task,
+                admin=confirmation_context.admin
             )
         )
 
@@ -150,8 +154,12 @@ async def reject_task_completeness_handler(
     F.content_type.in_({MessageFileTypes.PHOTO, MessageFileTypes.DOCUMENT, MessageFileTypes.VIDEO}),
     F.reply_to_message.text.startswith(ConfirmTaskCompletenessData.START_TEXT)
 )
-async def send_file_to_confirm_task_completeness_handler(message: Message, bot: Bot) -> None:
-    await message.delete()
+async def send_file_to_confirm_task_completeness_handler(
+        message: Message,
+        bot: Bot,
+        uow: UpdateUnitOfWork
+) -> None:
+
     assert message.reply_to_message is not None
     await message.reply_to_message.delete()
 
@@ -164,19 +172,43 @@ async def send_file_to_confirm_task_completeness_handler(message: Message, bot:
         )
     )
 
-    task: TaskModel = await get_task_by_association_id(task_association_id=task_association_id)
-    await send_task_on_confirmation(message=message, task_association_id=task_association_id, task=task, bot=bot)
+    task: TaskModel = await get_task_by_association_id(task_association_id=task_association_id, uow=uow)
+    failures: Dict[int, Exception] = await send_task_on_confirmation(
+        message=message,
+        task_association_id=task_association_id,
+        task=task,
+        bot=bot,
+        uow=uow
+    )
+
+    if len(failures) == len(AdminsIds().tuple()):
+        loggers.event.error(
+            'Task association with id=%s was not sent on confirmation to any admin',
+            task_association_id
+        )
+        await message.answer(text=await TemplateCreator.task_not_sent_on_confirmation_message(task=task))
+        return
 
     await message.answer(text=await TemplateCreator.task_sent_on_confirmation_message(task=task))
 
 
 @tasks_router.message(F.content_type.in_({MessageFileTypes.DOCUMENT}))
-async def update_tasks_handler(message: Message, bot: Bot) -> None:
+async def update_tasks_handler(message: Message, bot: Bot, uow: UpdateUnitOfWork) -> None:
     await message.delete()
-    new_tasks: List[TaskModel] = await get_new_tasks_from_message(message=message, bot=bot)
-    updated_tasks: List[TaskModel] = await update_tasks(tasks=new_tasks)
+    new_tasks: List[TaskModel] = await get_new_tasks_from_message(message=message, bot=bot, uow=uow)
+    tasks_catalog_diff: TasksCatalogDiff = await update_tasks(tasks=new_tasks, uow=uow)
     await message.answer(
         text=await TemplateCreator.tasks_updated_message(
-            tasks=updated_tasks
+            tasks_catalog_diff=tasks_catalog_diff
         )
     )
+
+    # Users are notified about new tasks in background, admin receives report, when broadcast is finished:
+    if tasks_catalog_diff.added or tasks_catalog_diff.reopened:
+        assert message.from_user is not None
+        broadcast: BroadcastModel = await create_broadcast(
+            text=await TemplateCreator.new_tasks_broadcast_message(tasks_catalog_diff=tasks_catalog_diff),
+            admin_id=message.from_user.id,
+            uow=uow
+        )
+        start_broadcast(bot=bot, broadcast=broadcast)
@@ -1,11 +1,17 @@
-from pydantic import BaseModel
+from typing import NamedTuple
 
 
-class UserTaskStatisticsResponseScheme(BaseModel):
+# Read models return raw rows, so responses are named tuples instead of validated models:
+class UserTaskStatisticsResponseScheme(NamedTuple):
     description: str
     is_completed: bool
 
 
-class UserActiveTaskScheme(BaseModel):
+class UserActiveTaskScheme(NamedTuple):
     task_association_id: int
     description: str
+
+
+class ActualTaskScheme(NamedTuple):
+    id: int
+    description: str
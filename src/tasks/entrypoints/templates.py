@@ -1,8 +1,8 @@
 from typing import Sequence
 from aiogram import html
 
-from src.tasks.constants import ConfirmTaskCompletenessData
-from src.tasks.domain.models import TaskModel
+from src.tasks.constants import CommandNames, ConfirmTaskCompletenessData
+from src.tasks.domain.models import TaskModel, TasksCatalogDiff
 from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme
 from src.users.domain.models import UserModel
 
@@ -21,11 +21,25 @@ class TemplateCreator:
         )
 
     @staticmethod
-    async def tasks_updated_message(tasks: Sequence[TaskModel]) -> str:
-        return 'Tasks were successfully updated!\nNow next tasks are available:\n' + '\n'.join(
-            f'{number}) {task.description}' for number, task in enumerate(tasks, start=1)
+    async def tasks_updated_message(tasks_catalog_diff: TasksCatalogDiff) -> str:
+        return (
+            'Tasks were successfully updated!\n'
+            f'Added: {len(tasks_catalog_diff.added)}, '
+            f'reopened: {len(tasks_catalog_diff.reopened)}, '
+            f'archived: {len(tasks_catalog_diff.archived)}, '
+            f'unchanged: {len(tasks_catalog_diff.unchanged)}.\n'
+            'Now next tasks are available:\n'
+        ) + '\n'.join(
+            f'{number}) {task.description}' for number, task in enumerate(tasks_catalog_diff.actual, start=1)
         )
 
+    @staticmethod
+    async def new_tasks_broadcast_message(tasks_catalog_diff: TasksCatalogDiff) -> str:
+        return 'New tasks are available:\n' + '\n'.join(
+            f'{number}) {task.description}'
+            for number, task in enumerate(tasks_catalog_diff.added + tasks_catalog_diff.reopened, start=1)
+        ) + f'\n\nCheck your progress with /{CommandNames.USER_TASKS_STATISTICS}'
+
     @staticmethod
     async def complete_task_message() -> str:
         return 'Please, select task, which you completeness you want to confirm:'
@@ -42,6 +56,13 @@ class TemplateCreator:
     async def task_sent_on_confirmation_message(task: TaskModel) -> str:
         return f'Task "{html.bold(task.description)}" with provided photo has been successfully sent on confirmation!'
 
+    @staticmethod
+    async def task_not_sent_on_confirmation_message(task: TaskModel) -> str:
+        return (
+            f'Task "{html.bold(task.description)}" could not be sent on confirmation. '
+            f'Please, try to complete it again later!'
+        )
+
     @staticmethod
     async def to_admin_task_confirmation_message(task: TaskModel, user: UserModel) -> str:
         return (
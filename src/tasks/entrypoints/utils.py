@@ -1,22 +1,24 @@
+import asyncio
 import yaml
 from io import BytesIO
-from typing import List, Optional, BinaryIO
-from aiogram import Bot
-from aiogram.types import Message
+from typing import Dict, List, Optional, BinaryIO, Tuple
+from aiogram import Bot, loggers
+from aiogram.types import Message, InlineKeyboardMarkup
 
-from src.tasks.constants import UPDATE_TASKS_DOCUMENT_APPROPRIATE_EXTENSIONS, MessageFileTypes
+from src.tasks.constants import UPDATE_TASKS_DOCUMENT_APPROPRIATE_EXTENSIONS, ADMINS_NOTIFICATION_CONCURRENCY
 from src.tasks.domain.models import TaskModel
 from src.tasks.entrypoints.markups import MarkupCreator
 from src.tasks.entrypoints.templates import TemplateCreator
 from src.tasks.exceptions import TasksFileFormatError
+from src.units_of_work import UpdateUnitOfWork
 from src.users.constants import AdminsIds
 from src.users.domain.models import UserModel
 from src.users.entrypoints.dependencies import check_if_user_is_admin, get_user_by_id
 from src.users.exceptions import UserHasNoPermissionsError
 
 
-async def get_new_tasks_from_message(message: Message, bot: Bot) -> List[TaskModel]:
-    if not await check_if_user_is_admin(message=message):
+async def get_new_tasks_from_message(message: Message, bot: Bot, uow: UpdateUnitOfWork) -> List[TaskModel]:
+    if not await check_if_user_is_admin(message=message, uow=uow):
         raise UserHasNoPermissionsError
 
     assert message.document is not None
@@ -35,50 +37,55 @@ async def get_new_tasks_from_message(message: Message, bot: Bot) -> List[TaskMod
     return [TaskModel(description=description) for description in tasks_descriptions]
 
 
-async def send_task_on_confirmation(message: Message, bot: Bot, task_association_id: int, task: TaskModel) -> None:
-    assert message.from_user is not None
-    user: UserModel = await get_user_by_id(id=message.from_user.id)
+async def send_task_on_confirmation(
+        message: Message,
+        bot: Bot,
+        task_association_id: int,
+        task: TaskModel,
+        uow: UpdateUnitOfWork
+) -> Dict[int, Exception]:
 
-    match message.content_type:
-        case MessageFileTypes.PHOTO:
-            assert message.photo is not None
-            for admin_id in AdminsIds().tuple():
-                await bot.send_photo(
-                    chat_id=admin_id,
-                    photo=message.photo[-1].file_id,  # the most quality photo
-                    reply_markup=await MarkupCreator.confirm_task_completeness_markup(
-                        task_association_id=task_association_id
-                    ),
-                    caption=await TemplateCreator.to_admin_task_confirmation_message(
-                        task=task,
-                        user=user
-                    )
-                )
-        case MessageFileTypes.DOCUMENT:
-            assert message.document is not None
-            for admin_id in AdminsIds().tuple():
-                await bot.send_document(
-                    chat_id=admin_id,
-                    document=message.document.file_id,
-                    reply_markup=await MarkupCreator.confirm_task_completeness_markup(
-                        task_association_id=task_association_id
-                    ),
-                    caption=await TemplateCreator.to_admin_task_confirmation_message(
-                        task=task,
-                        user=user
-                    )
-                )
-        case MessageFileTypes.VIDEO:
-            assert message.video is not None
-            for admin_id in AdminsIds().tuple():
-                await bot.send_video(
+    """
+    Copies message with proof of task completeness to all admins with the same caption and markup, so one path
+    covers all file types. Messages are sent concurrently, but number of concurrent requests is bounded.
+
+    Failed sending to one admin does not abort sending to others, so failures are logged and returned by admins ids.
+    Message is deleted only after sending, because it is copied by Telegram, but it is deleted even if sending
+    has failed.
+    """
+
+    admins_ids: Tuple[int, ...] = AdminsIds().tuple()
+    try:
+        assert message.from_user is not None
+        user: UserModel = await get_user_by_id(id=message.from_user.id, uow=uow)
+        caption: str = await TemplateCreator.to_admin_task_confirmation_message(task=task, user=user)
+        reply_markup: InlineKeyboardMarkup = await MarkupCreator.confirm_task_completeness_markup(
+            task_association_id=task_association_id
+        )
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(ADMINS_NOTIFICATION_CONCURRENCY)
+
+        async def send_to_admin(admin_id: int) -> None:
+            async with semaphore:
+                await bot.copy_message(
                     chat_id=admin_id,
-                    video=message.video.file_id,
-                    reply_markup=await MarkupCreator.confirm_task_completeness_markup(
-                        task_association_id=task_association_id
-                    ),
-                    caption=await TemplateCreator.to_admin_task_confirmation_message(
-                        task=task,
-                        user=user
-                    )
+                    from_chat_id=message.chat.id,
+                    message_id=message.message_id,
+                    caption=caption,
+                    reply_markup=reply_markup
                 )
+
+        results: List[Optional[BaseException]] = await asyncio.gather(
+            *(send_to_admin(admin_id=admin_id) for admin_id in admins_ids),
+            return_exceptions=True
+        )
+    finally:
+        await bot.delete_message(chat_id=message.chat.id, message_id=message.message_id)
+
+    failures: Dict[int, Exception] = {}
+    for admin_id, result in zip(admins_ids, results):
+        if isinstance(result, Exception):
+            loggers.event.warning('Failed to send task on confirmation to admin with id=%s: %r', admin_id, result)
+            failures[admin_id] = result
+
+    return failures
@@ -1,9 +1,9 @@
 from typing import List
 
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
-from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme
+from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme, ActualTaskScheme
+from src.tasks.domain.models import TasksCatalogSnapshot
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
-from src.tasks.service_layer.service import TasksService
+from src.tasks.service_layer.catalog import TasksCatalog, tasks_catalog
 
 
 class TasksViews:
@@ -11,31 +11,29 @@ class TasksViews:
     Views related to tasks, which purpose is to return information upon read requests,
     due to the fact that write requests (represented by commands) are different from read requests.
 
-    # TODO At current moment uses repositories pattern to retrieve data. In future can be changed on raw SQL
-    # TODO for speed-up purpose
+    Data is retrieved by tasks read model, so no domain models are built upon read requests. Actual tasks are taken
+    from tasks catalog snapshot. Statistics and active tasks of user are read with tasks descriptions by one query,
+    so they do not use snapshot.
     """
 
-    def __init__(self, uow: TasksUnitOfWork) -> None:
+    def __init__(self, uow: TasksUnitOfWork, catalog: TasksCatalog = tasks_catalog) -> None:
         self._uow: TasksUnitOfWork = uow
+        self._catalog: TasksCatalog = catalog
 
-    async def get_all_tasks(self) -> List[TaskModel]:
-        tasks: List[TaskModel] = await TasksService(uow=self._uow).get_all_tasks()
-
-        # Return only not archived tasks:
-        return [task for task in tasks if not task.is_archived]
+    async def get_all_tasks(self) -> List[ActualTaskScheme]:
+        snapshot: TasksCatalogSnapshot = await self._catalog.get_snapshot(uow=self._uow)
+        return [ActualTaskScheme(id=task.id, description=task.description) for task in snapshot.actual]
 
     async def get_user_tasks_statistics(self, user_id: int) -> List[UserTaskStatisticsResponseScheme]:
-        tasks_service: TasksService = TasksService(uow=self._uow)
-
-        # Only not archived task associations should be processed:
-        task_associations: List[TaskAssociationModel] = [
-            task_association for task_association in
-            await tasks_service.get_user_tasks_associations(user_id=user_id) if not task_association.task_archived
-        ]
-
-        return [
-            UserTaskStatisticsResponseScheme(
-                description=(await tasks_service.get_task_by_id(id=task_association.task_id)).description,
-                is_completed=task_association.task_completed
-            ) for task_association in task_associations
-        ]
+        async with self._uow as uow:
+            return [
+                UserTaskStatisticsResponseScheme._make(task_statistics)
+                for task_statistics in await uow.read_model.get_user_tasks_statistics(user_id=user_id)
+            ]
+
+    async def get_user_active_tasks(self, user_id: int) -> List[UserActiveTaskScheme]:
+        async with self._uow as uow:
+            return [
+                UserActiveTaskScheme._make(active_task)
+                for active_task in await uow.read_model.get_user_active_tasks(user_id=user_id)
+            ]
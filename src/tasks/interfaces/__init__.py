@@ -1,2 +1,3 @@
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
+from src.tasks.interfaces.read_models import TasksReadModel
@@ -0,0 +1,28 @@
+from typing import List, Tuple
+from abc import ABC, abstractmethod
+
+from src.core.interfaces import AbstractReadModel
+
+
+class TasksReadModel(AbstractReadModel, ABC):
+    """
+    An interface for reading tasks data, that is used by tasks views through tasks unit of work.
+    The main goal is that implementations of this interface can be easily replaced in tasks unit of work
+    using dependency injection without disrupting its functionality.
+    """
+
+    @abstractmethod
+    async def get_user_tasks_statistics(self, user_id: int) -> List[Tuple[str, bool]]:
+        """
+        Returns (task description, task completed) rows for all not archived tasks of user.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_active_tasks(self, user_id: int) -> List[Tuple[int, str]]:
+        """
+        Returns (task association id, task description) rows for all not archived and not completed tasks of user.
+        """
+
+        raise NotImplementedError
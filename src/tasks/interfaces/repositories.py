@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List, Set
 from abc import ABC, abstractmethod
 
 from src.core.interfaces import AbstractRepository, AbstractModel
@@ -16,6 +16,10 @@ class TasksRepository(AbstractRepository, ABC):
     async def add(self, model: AbstractModel) -> TaskModel:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskModel]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get(self, id: int) -> Optional[TaskModel]:
         raise NotImplementedError
@@ -32,6 +36,22 @@ class TasksRepository(AbstractRepository, ABC):
     async def list(self) -> List[TaskModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream(self) -> AsyncIterator[TaskModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def archive_tasks_except(self, descriptions: Set[str]) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_archived_status_by_ids(self, ids: List[int], is_archived: bool) -> None:
+        raise NotImplementedError
+
 
 class TasksAssociationsRepository(AbstractRepository, ABC):
     """
@@ -44,6 +64,10 @@ class TasksAssociationsRepository(AbstractRepository, ABC):
     async def add(self, model: AbstractModel) -> TaskAssociationModel:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskAssociationModel]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get(self, id: int) -> Optional[TaskAssociationModel]:
         raise NotImplementedError
@@ -56,6 +80,14 @@ class TasksAssociationsRepository(AbstractRepository, ABC):
     async def list(self) -> List[TaskAssociationModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream(self) -> AsyncIterator[TaskAssociationModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskAssociationModel]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_task_associations_by_task_id(self, task_id: int) -> List[TaskAssociationModel]:
         raise NotImplementedError
@@ -63,3 +95,11 @@ class TasksAssociationsRepository(AbstractRepository, ABC):
     @abstractmethod
     async def get_tasks_associations_by_user_id(self, user_id: int) -> List[TaskAssociationModel]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def set_archived_status_by_task_ids(self, task_ids: List[int], task_archived: bool) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_completed_status_if_active(self, id: int) -> Optional[TaskAssociationModel]:
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from abc import ABC
 
+from src.tasks.interfaces.read_models import TasksReadModel
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
 from src.core.interfaces import AbstractUnitOfWork
 
@@ -13,3 +14,4 @@ class TasksUnitOfWork(AbstractUnitOfWork, ABC):
 
     tasks: TasksRepository
     tasks_associations: TasksAssociationsRepository
+    read_model: TasksReadModel
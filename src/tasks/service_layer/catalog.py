@@ -0,0 +1,77 @@
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from src.core.concurrency import SingleFlight
+from src.tasks.domain.models import TaskModel, TasksCatalogSnapshot
+from src.tasks.interfaces.units_of_work import TasksUnitOfWork
+
+
+class TasksCatalog:
+    """
+    Process wide snapshot of tasks catalog, which is changed only by tasks update, so it is read from database once
+    and then is reloaded after every tasks update.
+
+    Snapshot is replaced by new one as a whole, so readers always see consistent catalog. Reader can detect, that its
+    snapshot was replaced, by comparing versions. Concurrent readers of not loaded catalog share one loading.
+
+    Version is taken before reading of tasks, so loading, which started later and therefore has read newer tasks,
+    is never replaced by loading, which finished later. Loadings, started before clearing, are not installed.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[TasksCatalogSnapshot] = None
+        self._version: int = 0
+        self._cleared_version: int = 0
+        self._loading: SingleFlight[None, TasksCatalogSnapshot] = SingleFlight()
+
+    @property
+    def snapshot(self) -> Optional[TasksCatalogSnapshot]:
+        return self._snapshot
+
+    async def load(self, uow: TasksUnitOfWork) -> TasksCatalogSnapshot:
+        self._version += 1
+        version: int = self._version
+        async with uow:
+            tasks: List[TaskModel] = await uow.tasks.list()
+
+            # Copies are not bound to any session, so they can be shared between units of work:
+            tasks_copies: Dict[int, TaskModel] = {task.id: TaskModel(**await task.to_dict()) for task in tasks}
+
+        actual: Tuple[TaskModel, ...] = tuple(
+            tasks_copies[id] for id in sorted(tasks_copies) if not tasks_copies[id].is_archived
+        )
+        snapshot: TasksCatalogSnapshot = TasksCatalogSnapshot(
+            version=version,
+            tasks=MappingProxyType(tasks_copies),
+            actual=actual
+        )
+        if version <= self._cleared_version:
+            return snapshot
+
+        if self._snapshot is None or self._snapshot.version < version:
+            self._snapshot = snapshot
+
+        return self._snapshot
+
+    async def get_snapshot(self, uow: TasksUnitOfWork) -> TasksCatalogSnapshot:
+        """
+        Returns current snapshot. If catalog was not loaded yet, loads it by provided unit of work.
+
+        Only initial loading is shared, because explicit reloading should see changes, committed right before it.
+        Shared loading works within its own session, so it is not broken by closing of session of cancelled reader.
+        """
+
+        if self._snapshot is None:
+            return await self._loading.do(key=None, function=lambda: self.load(uow=uow.detach()))
+
+        return self._snapshot
+
+    def is_stale(self, snapshot: TasksCatalogSnapshot) -> bool:
+        return self._snapshot is None or self._snapshot.version != snapshot.version
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._cleared_version = self._version
+
+
+tasks_catalog: TasksCatalog = TasksCatalog()
@@ -1,32 +1,53 @@
-from typing import Optional, List, Set
+from typing import Optional, List, Set, Dict
 
+from src.core.invalidation import AbstractInvalidationBus, InvalidationTopics, invalidation_bus
 from src.tasks.constants import ErrorDetails
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
+from src.tasks.domain.models import (
+    TaskModel,
+    TaskAssociationModel,
+    TasksCatalogDiff,
+    TasksCatalogSnapshot
+)
 from src.tasks.exceptions import TaskNotFoundError, TaskAssociationNotFoundError
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
+from src.tasks.service_layer.catalog import TasksCatalog, tasks_catalog
 from src.users.domain.models import UserModel
 
 
 class TasksService:
     """
     Service layer core according to DDD, which using a unit of work, will perform operations on the domain model.
+
+    Tasks, which are needed only for reading, are taken from tasks catalog snapshot instead of database.
+    Every change of tasks catalog is published to invalidation bus, so all bot instances drop their snapshots.
     """
 
-    def __init__(self, uow: TasksUnitOfWork) -> None:
+    def __init__(
+            self,
+            uow: TasksUnitOfWork,
+            catalog: TasksCatalog = tasks_catalog,
+            bus: AbstractInvalidationBus = invalidation_bus
+    ) -> None:
+
         self._uow: TasksUnitOfWork = uow
+        self._catalog: TasksCatalog = catalog
+        self._bus: AbstractInvalidationBus = bus
 
     async def create_task(self, task: TaskModel, users: List[UserModel]) -> TaskModel:
         async with self._uow as uow:
             task = await uow.tasks.add(model=task)
-            for user in users:
-                await uow.tasks_associations.add(
-                    model=TaskAssociationModel(
+            await uow.tasks_associations.add_many(
+                models=[
+                    TaskAssociationModel(
                         user_id=user.id,
                         task_id=task.id
-                    )
-                )
+                    ) for user in users
+                ]
+            )
 
+            uow.register_affected_users(users_ids=[user.id for user in users])
             await uow.commit()
+            await self._bus.publish(topic=InvalidationTopics.TASKS_CATALOG)
             return task
 
     async def check_task_existence(
@@ -75,16 +96,17 @@ class TasksService:
 
     async def create_tasks_associations_for_user(self, user: UserModel) -> List[TaskAssociationModel]:
         async with self._uow as uow:
-            task_associations: List[TaskAssociationModel] = [
-                await uow.tasks_associations.add(
-                    model=TaskAssociationModel(
+            task_associations: List[TaskAssociationModel] = await uow.tasks_associations.add_many(
+                models=[
+                    TaskAssociationModel(
                         user_id=user.id,
                         task_id=task.id,
                         task_archived=task.is_archived
-                    )
-                ) for task in await uow.tasks.list()
-            ]
+                    ) for task in await uow.tasks.list()
+                ]
+            )
 
+            uow.register_affected_users(users_ids=[user.id])
             await uow.commit()
             return task_associations
 
@@ -97,20 +119,22 @@ class TasksService:
             return task_associations
 
     async def archive_old_tasks(self, new_tasks: List[TaskModel]) -> None:
-        new_tasks_descriptions: Set[str] = {task.description for task in new_tasks}
         async with self._uow as uow:
-            for task in await uow.tasks.list():
-                if not (task.is_archived or task.description in new_tasks_descriptions):
-                    task.is_archived = True
-
-                    task_associations: List[
-                        TaskAssociationModel
-                    ] = await uow.tasks_associations.get_task_associations_by_task_id(task_id=task.id)
+            await self.archive_tasks_except(uow=uow, descriptions={task.description for task in new_tasks})
+            await uow.commit()
+            await self._bus.publish(topic=InvalidationTopics.TASKS_CATALOG)
 
-                    for task_association in task_associations:
-                        task_association.task_archived = True
+    @staticmethod
+    async def archive_tasks_except(uow: TasksUnitOfWork, descriptions: Set[str]) -> List[int]:
+        """
+        Archives all not archived tasks, which descriptions are not in provided descriptions, and their tasks
+        associations by set based UPDATE statements within transaction of provided unit of work.
+        Returns ids of archived tasks.
+        """
 
-                    await uow.commit()
+        archived_tasks_ids: List[int] = await uow.tasks.archive_tasks_except(descriptions=descriptions)
+        await uow.tasks_associations.set_archived_status_by_task_ids(task_ids=archived_tasks_ids, task_archived=True)
+        return archived_tasks_ids
 
     async def reopen_task(self, id: int) -> TaskModel:
         async with self._uow as uow:
@@ -127,7 +151,9 @@ class TasksService:
             for task_association in task_associations:
                 task_association.task_archived = False
 
+            uow.register_affected_users(users_ids=[task_association.user_id for task_association in task_associations])
             await uow.commit()
+            await self._bus.publish(topic=InvalidationTopics.TASKS_CATALOG)
             return task
 
     async def get_task_by_association_id(self, task_association_id: int) -> TaskModel:
@@ -136,11 +162,20 @@ class TasksService:
             if not task_association:
                 raise TaskAssociationNotFoundError
 
-            task: Optional[TaskModel] = await uow.tasks.get(id=task_association.task_id)
-            if not task:
-                raise TaskNotFoundError
+        return await self.get_catalog_task(id=task_association.task_id)
 
-            return task
+    async def get_catalog_task(self, id: int) -> TaskModel:
+        snapshot: TasksCatalogSnapshot = await self._catalog.get_snapshot(uow=self._uow)
+        task: Optional[TaskModel] = snapshot.tasks.get(id)
+        if not task:
+            # Task could be added by other process after snapshot was loaded:
+            snapshot = await self._catalog.load(uow=self._uow)
+            task = snapshot.tasks.get(id)
+
+        if not task:
+            raise TaskNotFoundError
+
+        return task
 
     async def get_task_association_by_id(self, task_association_id: int) -> TaskAssociationModel:
         async with self._uow as uow:
@@ -152,12 +187,90 @@ class TasksService:
 
     async def set_task_association_completed_status(self, task_association_id: int) -> TaskAssociationModel:
         async with self._uow as uow:
-            task_association: Optional[TaskAssociationModel] = await uow.tasks_associations.get(id=task_association_id)
+            task_association: Optional[TaskAssociationModel] = (
+                await uow.tasks_associations.set_completed_status_if_active(id=task_association_id)
+            )
+            if task_association:
+                uow.register_affected_users(users_ids=[task_association.user_id])
+                await uow.commit()
+                return task_association
+
+            # Task association was already completed, archived or does not exist:
+            task_association = await uow.tasks_associations.get(id=task_association_id)
             if not task_association:
                 raise TaskAssociationNotFoundError
 
-            if not task_association.task_archived and not task_association.task_completed:
-                task_association.task_completed = True
-                await uow.commit()
-
             return task_association
+
+
+class TasksCatalogSync:
+    """
+    Service, which synchronizes tasks catalog with provided tasks.
+
+    Current catalog is read once, added and reopened tasks are computed in memory, while not provided tasks are
+    archived by one set based UPDATE. All changes are applied by several bulk statements in one transaction, so number
+    of database round trips does not depend on number of provided tasks.
+    """
+
+    def __init__(self, uow: TasksUnitOfWork, bus: AbstractInvalidationBus = invalidation_bus) -> None:
+        self._uow: TasksUnitOfWork = uow
+        self._bus: AbstractInvalidationBus = bus
+
+    async def sync(self, tasks: List[TaskModel], users_ids: List[int]) -> TasksCatalogDiff:
+        # Dict is used instead of set to remove duplicates and to save order of provided tasks:
+        new_tasks_descriptions: Dict[str, None] = dict.fromkeys(task.description for task in tasks)
+
+        async with self._uow as uow:
+            catalog: Dict[str, TaskModel] = {task.description: task for task in await uow.tasks.list()}
+
+            reopened_tasks: List[TaskModel] = []
+            unchanged_tasks: List[TaskModel] = []
+            for description in new_tasks_descriptions:
+                if description in catalog:
+                    task: TaskModel = catalog[description]
+                    if task.is_archived:
+                        reopened_tasks.append(task)
+                    else:
+                        unchanged_tasks.append(task)
+
+            added_tasks: List[TaskModel] = await uow.tasks.add_many(
+                models=[
+                    TaskModel(description=description) for description in new_tasks_descriptions if
+                    description not in catalog
+                ]
+            )
+
+            await uow.tasks_associations.add_many(
+                models=[
+                    TaskAssociationModel(
+                        user_id=user_id,
+                        task_id=task.id
+                    ) for task in added_tasks for user_id in users_ids
+                ]
+            )
+
+            archived_tasks_ids: Set[int] = set(
+                await TasksService.archive_tasks_except(uow=uow, descriptions=set(new_tasks_descriptions))
+            )
+            archived_tasks: List[TaskModel] = [task for task in catalog.values() if task.id in archived_tasks_ids]
+
+            reopened_tasks_ids: List[int] = [task.id for task in reopened_tasks]
+            await uow.tasks.set_archived_status_by_ids(ids=reopened_tasks_ids, is_archived=False)
+            await uow.tasks_associations.set_archived_status_by_task_ids(
+                task_ids=reopened_tasks_ids,
+                task_archived=False
+            )
+
+            uow.register_affected_users(users_ids=users_ids)
+            await uow.commit()
+            await self._bus.publish(topic=InvalidationTopics.TASKS_CATALOG)
+
+        actual_tasks: Dict[str, TaskModel] = {task.description: task for task in reopened_tasks + unchanged_tasks}
+        actual_tasks.update({task.description: task for task in added_tasks})
+        return TasksCatalogDiff(
+            added=added_tasks,
+            archived=archived_tasks,
+            reopened=reopened_tasks,
+            unchanged=unchanged_tasks,
+            actual=[actual_tasks[description] for description in new_tasks_descriptions]
+        )
@@ -1,7 +1,9 @@
 from typing import Self
 
+from src.tasks.interfaces.read_models import TasksReadModel
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
+from src.tasks.adapters.read_models import SQLAlchemyTasksReadModel
 from src.tasks.adapters.repositories import SQLAlchemyTasksRepository, SQLAlchemyTasksAssociationsRepository
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
 
@@ -14,4 +16,5 @@ class SQLAlchemyTasksUnitOfWork(SQLAlchemyAbstractUnitOfWork, TasksUnitOfWork):
         self.tasks_associations: TasksAssociationsRepository = SQLAlchemyTasksAssociationsRepository(
             session=self._session
         )
+        self.read_model: TasksReadModel = SQLAlchemyTasksReadModel(session=self._session)
         return uow
@@ -0,0 +1,133 @@
+from abc import ABC
+from typing import Optional, Self
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.broadcasts.adapters.repositories import SQLAlchemyBroadcastsRepository
+from src.broadcasts.interfaces import BroadcastsUnitOfWork, BroadcastsRepository
+from src.broadcasts.service_layer.units_of_work import SQLAlchemyBroadcastsUnitOfWork
+from src.core.database.connection import (
+    engine as default_engine,
+    session_factory as default_session_factory,
+    replica_session_factory as default_replica_session_factory
+)
+from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
+from src.core.identity_map import IdentityMap
+from src.core.interfaces import AbstractUnitOfWork
+from src.read_models import ConfirmationsReadModel, SQLAlchemyConfirmationsReadModel
+from src.tasks.adapters.repositories import SQLAlchemyTasksRepository, SQLAlchemyTasksAssociationsRepository
+from src.tasks.interfaces import TasksUnitOfWork, TasksRepository, TasksAssociationsRepository
+from src.tasks.service_layer.units_of_work import SQLAlchemyTasksUnitOfWork
+from src.users.adapters.repositories import SQLAlchemyUsersRepository, CachedUsersRepository
+from src.users.config import users_config
+from src.users.interfaces import UsersUnitOfWork, UsersRepository
+from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
+
+
+class UpdateUnitOfWork(AbstractUnitOfWork, ABC):
+    """
+    An interface for work with all modules during handling of one telegram update.
+
+    Exposes repositories of all modules and units of work of every module, which should be provided to services and
+    views, so all of them work within one unit of work. Read only units of work should be used for requests, which
+    do not change data, to skip rollback after every read.
+
+    Identity map lives as long as unit of work and is consulted by dependencies before reading models by ids.
+
+    Read models, which join data of several modules, are exposed here too and are used within unit of work of module,
+    which owns changed data.
+    """
+
+    identity_map: IdentityMap
+
+    users: UsersRepository
+    tasks: TasksRepository
+    tasks_associations: TasksAssociationsRepository
+    broadcasts: BroadcastsRepository
+    confirmations: ConfirmationsReadModel
+    users_uow: UsersUnitOfWork
+    tasks_uow: TasksUnitOfWork
+    broadcasts_uow: BroadcastsUnitOfWork
+    users_read_only_uow: UsersUnitOfWork
+    tasks_read_only_uow: TasksUnitOfWork
+
+
+class SQLAlchemyUpdateUnitOfWork(SQLAlchemyAbstractUnitOfWork, UpdateUnitOfWork):
+    """
+    Shares one session for whole update between units of work of modules. Session checks out connection from pool
+    only on first query of transaction and returns it to pool, when transaction is ended by commit or rollback of
+    module unit of work. So updates, which do not use database, do not take connections, and connections are not held
+    during requests to Telegram, which handlers make between units of work.
+
+    Read only units of work of modules can be routed to replica, so user id, from whom update came, is provided to
+    them for keeping read your writes consistency.
+    """
+
+    def __init__(
+            self,
+            user_id: Optional[int] = None,
+            engine: AsyncEngine = default_engine,
+            session_factory: async_sessionmaker = default_session_factory,
+            replica_session_factory: Optional[async_sessionmaker] = default_replica_session_factory
+    ) -> None:
+
+        super().__init__(
+            session_factory=session_factory,
+            replica_session_factory=replica_session_factory,
+            user_id=user_id
+        )
+        self._engine: AsyncEngine = engine
+
+    async def __aenter__(self) -> Self:
+        session: AsyncSession = self._session_factory(bind=self._engine)
+        self._shared_session = session
+
+        uow = await super().__aenter__()
+        self.identity_map: IdentityMap = IdentityMap()
+        self.users: UsersRepository = SQLAlchemyUsersRepository(session=session)
+        if users_config.USERS_CACHE_ENABLED:
+            self.users = CachedUsersRepository(repository=self.users)
+
+        self.tasks: TasksRepository = SQLAlchemyTasksRepository(session=session)
+        self.tasks_associations: TasksAssociationsRepository = SQLAlchemyTasksAssociationsRepository(session=session)
+        self.broadcasts: BroadcastsRepository = SQLAlchemyBroadcastsRepository(session=session)
+        self.confirmations: ConfirmationsReadModel = SQLAlchemyConfirmationsReadModel(session=session)
+        self.users_uow: UsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session=session, user_id=self._user_id)
+        self.tasks_uow: TasksUnitOfWork = SQLAlchemyTasksUnitOfWork(session=session, user_id=self._user_id)
+        self.broadcasts_uow: BroadcastsUnitOfWork = SQLAlchemyBroadcastsUnitOfWork(
+            session=session,
+            user_id=self._user_id
+        )
+        self.users_read_only_uow: UsersUnitOfWork = SQLAlchemyUsersUnitOfWork(
+            session=session,
+            read_only=True,
+            replica_session_factory=self._replica_session_factory,
+            user_id=self._user_id
+        )
+        self.tasks_read_only_uow: TasksUnitOfWork = SQLAlchemyTasksUnitOfWork(
+            session=session,
+            read_only=True,
+            replica_session_factory=self._replica_session_factory,
+            user_id=self._user_id
+        )
+        return uow
+
+    async def commit(self) -> None:
+        await super().commit()
+        if isinstance(self.users, CachedUsersRepository):
+            await self.users.invalidate_changed()
+
+    def detach(self) -> Self:
+        return type(self)(
+            user_id=self._user_id,
+            engine=self._engine,
+            session_factory=self._session_factory,
+            replica_session_factory=self._replica_session_factory
+        )
+
+    async def __aexit__(self, *args, **kwargs) -> None:
+        try:
+            await super().__aexit__(*args, **kwargs)
+        finally:
+            self.identity_map.clear()
+            self._shared_session = None
+            await self._session.close()
@@ -0,0 +1,58 @@
+from typing import List, Optional
+from sqlalchemy import select, Result, Select, Row
+
+from src.core.database.interfaces import SQLAlchemyAbstractReadModel
+from src.users.adapters.orm import users_table
+from src.users.interfaces.read_models import UsersReadModel, UserAccountRow
+
+
+class SQLAlchemyUsersReadModel(SQLAlchemyAbstractReadModel, UsersReadModel):
+
+    _user_account_query: Select[UserAccountRow] = select(
+        users_table.c.id,
+        users_table.c.is_bot,
+        users_table.c.first_name,
+        users_table.c.role,
+        users_table.c.full_name,
+        users_table.c.url,
+        users_table.c.last_name,
+        users_table.c.username
+    )
+
+    async def get_user_account(self, user_id: int) -> Optional[UserAccountRow]:
+        result: Result = await self._session.execute(
+            self._user_account_query.where(
+                users_table.c.id == user_id
+            )
+        )
+
+        row: Optional[Row] = result.one_or_none()
+        return row._tuple() if row else None
+
+    async def get_all_users(self) -> List[UserAccountRow]:
+        result: Result = await self._session.execute(
+            self._user_account_query.order_by(
+                users_table.c.id
+            )
+        )
+
+        return [row._tuple() for row in result.all()]
+
+    async def get_all_users_ids(self) -> List[int]:
+        result: Result = await self._session.execute(
+            select(
+                users_table.c.id
+            ).order_by(
+                users_table.c.id
+            )
+        )
+
+        return list(result.scalars().all())
+
+    async def get_users_ids_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[int]:
+        query: Select = select(users_table.c.id).order_by(users_table.c.id).limit(limit)
+        if after_id is not None:
+            query = query.where(users_table.c.id > after_id)
+
+        result: Result = await self._session.execute(query)
+        return list(result.scalars().all())
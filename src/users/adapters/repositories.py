@@ -1,10 +1,16 @@
-from typing import List, Optional, Sequence, Any
-from sqlalchemy import insert, select, delete, update, Result, RowMapping, Row
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Any
+from sqlalchemy import insert, select, delete, update, Result, RowMapping, Row, Select
+from aiogram import loggers
 
 from src.users.interfaces.repositories import UsersRepository
+from src.users.adapters.orm import users_table
+from src.users.config import users_config
 from src.users.domain.models import UserModel
+from src.core.cache import NamespacedCache, create_cache
+from src.core.exceptions import CacheBackendError
 from src.core.database.interfaces.repositories import SQLAlchemyAbstractRepository
-from src.core.interfaces import AbstractModel
+from src.core.interfaces import AbstractModel, AbstractCache
 
 
 class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
@@ -55,3 +61,125 @@ class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
             assert isinstance(user, UserModel)
 
         return users
+
+    async def stream(self) -> AsyncIterator[UserModel]:
+        """
+        Fetches users from database by batches. Should not be used within read only units of work.
+        """
+
+        async for user in self._stream_scalars(query=select(UserModel).order_by(users_table.c.id)):
+            assert isinstance(user, UserModel)
+            yield user
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[UserModel]:
+        query: Select = select(UserModel).order_by(users_table.c.id).limit(limit)
+        if after_id is not None:
+            query = query.where(users_table.c.id > after_id)
+
+        result: Result = await self._session.execute(query)
+        users: Sequence[Row | RowMapping | Any] = result.scalars().all()
+
+        assert isinstance(users, List)
+        for user in users:
+            assert isinstance(user, UserModel)
+
+        return users
+
+
+users_cache: NamespacedCache = NamespacedCache(
+    cache=create_cache(max_size=users_config.USERS_CACHE_MAX_SIZE, default_ttl=users_config.USERS_CACHE_TTL),
+    namespace='users'
+)
+
+
+# Errors of cache backends, after which users are read from database:
+CACHE_ERRORS = (CacheBackendError, OSError, asyncio.IncompleteReadError)
+
+
+class CachedUsersRepository(UsersRepository):
+    """
+    Decorator for any users repository, which caches users, got by id, in provided cache.
+
+    Users are cached as dictionaries, so every read builds new model, which is not bound to any session.
+    Ids of added, updated and deleted users are remembered and are invalidated by unit of work only after commit,
+    so concurrent reads can not cache old state after invalidation. Till then changed users are read from decorated
+    repository and are not cached, so uncommitted changes are never cached.
+
+    Cache is an optimization only, so if cache backend fails, users are read from decorated repository.
+    """
+
+    def __init__(self, repository: UsersRepository, cache: AbstractCache = users_cache) -> None:
+        self._repository: UsersRepository = repository
+        self._cache: AbstractCache = cache
+        self._changed_ids: Set[int] = set()
+
+    async def get(self, id: int) -> Optional[UserModel]:
+        if id in self._changed_ids:
+            return await self._repository.get(id=id)
+
+        data: Optional[Dict[str, Any]] = await self._get_cached(id=id)
+        if data:
+            return UserModel(**data)
+
+        user: Optional[UserModel] = await self._repository.get(id=id)
+        if user:
+            await self._set_cached(id=id, data=await user.to_dict())
+
+        return user
+
+    async def get_by_first_name(self, first_name: str) -> Optional[UserModel]:
+        return await self._repository.get_by_first_name(first_name=first_name)
+
+    async def get_by_username(self, username: str) -> Optional[UserModel]:
+        return await self._repository.get_by_username(username=username)
+
+    async def add(self, model: AbstractModel) -> UserModel:
+        user: UserModel = await self._repository.add(model=model)
+        self._changed_ids.add(user.id)
+        return user
+
+    async def update(self, id: int, model: AbstractModel) -> UserModel:
+        self._changed_ids.add(id)
+        return await self._repository.update(id=id, model=model)
+
+    async def delete(self, id: int) -> None:
+        self._changed_ids.add(id)
+        await self._repository.delete(id=id)
+
+    async def list(self) -> List[UserModel]:
+        return await self._repository.list()
+
+    def stream(self) -> AsyncIterator[UserModel]:
+        return self._repository.stream()
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[UserModel]:
+        return await self._repository.list_page(after_id=after_id, limit=limit)
+
+    async def invalidate_changed(self) -> None:
+        """
+        Deletes changed users from cache. Should be called after commit of transaction, which changed them.
+        """
+
+        for id in self._changed_ids:
+            await self._delete_cached(id=id)
+
+        self._changed_ids.clear()
+
+    async def _get_cached(self, id: int) -> Optional[Dict[str, Any]]:
+        try:
+            return await self._cache.get(key=str(id))
+        except CACHE_ERRORS as e:
+            loggers.event.warning('Failed to get user with id=%s from cache: %r', id, e)
+            return None
+
+    async def _set_cached(self, id: int, data: Dict[str, Any]) -> None:
+        try:
+            await self._cache.set(key=str(id), value=data)
+        except CACHE_ERRORS as e:
+            loggers.event.warning('Failed to cache user with id=%s: %r', id, e)
+
+    async def _delete_cached(self, id: int) -> None:
+        try:
+            await self._cache.delete(key=str(id))
+        except CACHE_ERRORS as e:
+            loggers.event.warning('Failed to delete user with id=%s from cache: %r', id, e)
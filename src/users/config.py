@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings
+
+
+class UsersConfig(BaseSettings):
+
+    # Users cache settings. Users are cached by id in memory of current process, time to live is set in seconds:
+    USERS_CACHE_ENABLED: bool = True
+    USERS_CACHE_MAX_SIZE: int = 1024
+    USERS_CACHE_TTL: float = 300
+
+
+users_config: UsersConfig = UsersConfig()
@@ -13,6 +13,7 @@ class ErrorDetails:
     USER_NOT_FOUND: str = 'User with provided credentials not found'
     USER_ATTRIBUTE_REQUIRED: str = 'user id, first_name or username is required'
     USER_HAS_NO_PERMISSIONS: str = 'User has no permissions for current operation'
+    ADMIN_NOT_FOUND: str = 'Admin with provided id not found'
 
 
 @dataclass(frozen=True)
@@ -1,18 +1,18 @@
-from typing import List
+from typing import List, Optional
 from aiogram.types import Message
 
 from src.tasks.service_layer.service import TasksService
-from src.tasks.service_layer.units_of_work import SQLAlchemyTasksUnitOfWork
+from src.units_of_work import UpdateUnitOfWork
 from src.users.constants import UserRoles, AdminsIds
 from src.users.domain.models import UserModel
+from src.users.entrypoints.schemas import UserAccountScheme
 from src.users.entrypoints.views import UsersViews
 from src.users.service_layer.service import UsersService
-from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
 
 
-async def register_user(message: Message) -> UserModel:
+async def register_user(message: Message, uow: UpdateUnitOfWork) -> UserModel:
     assert message.from_user is not None  # Check for mypy. Also register should work only with private messages
-    users_service: UsersService = UsersService(uow=SQLAlchemyUsersUnitOfWork())
+    users_service: UsersService = UsersService(uow=uow.users_uow)
 
     user: UserModel
     if not await users_service.check_user_existence(id=message.from_user.id):
@@ -33,27 +33,34 @@ async def register_user(message: Message) -> UserModel:
             )
         )
 
-        tasks_service: TasksService = TasksService(uow=SQLAlchemyTasksUnitOfWork())
+        tasks_service: TasksService = TasksService(uow=uow.tasks_uow)
         await tasks_service.create_tasks_associations_for_user(user=user)
-    else:
-        user = await users_service.get_user_by_id(id=message.from_user.id)
+        return await uow.identity_map.add(id=user.id, model=user)
 
-    return user
+    return await get_user_by_id(id=message.from_user.id, uow=uow)
 
 
-async def get_all_users() -> List[UserModel]:
-    users_views: UsersViews = UsersViews(uow=SQLAlchemyUsersUnitOfWork())
+async def get_all_users(uow: UpdateUnitOfWork) -> List[UserAccountScheme]:
+    users_views: UsersViews = UsersViews(uow=uow.users_read_only_uow)
     return await users_views.get_all_users()
 
 
-async def check_if_user_is_admin(message: Message) -> bool:
+async def get_all_users_ids(uow: UpdateUnitOfWork) -> List[int]:
+    users_views: UsersViews = UsersViews(uow=uow.users_read_only_uow)
+    return await users_views.get_all_users_ids()
+
+
+async def check_if_user_is_admin(message: Message, uow: UpdateUnitOfWork) -> bool:
     assert message.from_user is not None
 
-    users_service: UsersService = UsersService(uow=SQLAlchemyUsersUnitOfWork())
-    user: UserModel = await users_service.get_user_by_id(id=message.from_user.id)
+    user: UserModel = await get_user_by_id(id=message.from_user.id, uow=uow)
     return user.role == UserRoles.ADMIN
 
 
-async def get_user_by_id(id: int) -> UserModel:
-    users_service: UsersService = UsersService(uow=SQLAlchemyUsersUnitOfWork())
-    return await users_service.get_user_by_id(id=id)
+async def get_user_by_id(id: int, uow: UpdateUnitOfWork) -> UserModel:
+    user: Optional[UserModel] = uow.identity_map.get(UserModel, id)
+    if user:
+        return user
+
+    users_service: UsersService = UsersService(uow=uow.users_read_only_uow)
+    return await uow.identity_map.add(id=id, model=await users_service.get_user_by_id(id=id))
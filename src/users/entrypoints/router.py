@@ -2,6 +2,7 @@ from aiogram import Router
 from aiogram.filters import CommandStart
 from aiogram.types import Message
 
+from src.units_of_work import UpdateUnitOfWork
 from src.users.domain.models import UserModel
 from src.users.entrypoints.dependencies import register_user
 from src.users.entrypoints.templates import TemplateCreator
@@ -10,11 +11,11 @@ users_router: Router = Router()
 
 
 @users_router.message(CommandStart())
-async def start_handler(message: Message) -> None:
+async def start_handler(message: Message, uow: UpdateUnitOfWork) -> None:
     """
     This handler receives messages with `/start` command
     """
 
     await message.delete()
-    user: UserModel = await register_user(message=message)
+    user: UserModel = await register_user(message=message, uow=uow)
     await message.answer(text=await TemplateCreator.start_message(user=user))
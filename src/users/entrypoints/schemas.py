@@ -0,0 +1,12 @@
+from typing import NamedTuple, Optional
+
+
+class UserAccountScheme(NamedTuple):
+    id: int
+    is_bot: bool
+    first_name: str
+    role: str
+    full_name: str
+    url: str
+    last_name: Optional[str]
+    username: Optional[str]
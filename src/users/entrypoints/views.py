@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Optional
 
-from src.users.domain.models import UserModel
+from src.users.entrypoints.schemas import UserAccountScheme
+from src.users.exceptions import UserNotFoundError
+from src.users.interfaces.read_models import UserAccountRow
 from src.users.interfaces.units_of_work import UsersUnitOfWork
-from src.users.service_layer.service import UsersService
 
 
 class UsersViews:
@@ -10,15 +11,24 @@ class UsersViews:
     Views related to users, which purpose is to return information upon read requests,
     due to the fact that write requests (represented by commands) are different from read requests.
 
-    # TODO At current moment uses repositories pattern to retrieve data. In future can be changed on raw SQL
-    # TODO for speed-up purpose
+    Data is retrieved by users read model, so no domain models are built upon read requests.
     """
 
     def __init__(self, uow: UsersUnitOfWork) -> None:
         self._uow: UsersUnitOfWork = uow
 
-    async def get_user_account(self, user_id: int) -> UserModel:
-        return await UsersService(self._uow).get_user_by_id(id=user_id)
+    async def get_user_account(self, user_id: int) -> UserAccountScheme:
+        async with self._uow as uow:
+            user_account: Optional[UserAccountRow] = await uow.read_model.get_user_account(user_id=user_id)
+            if not user_account:
+                raise UserNotFoundError
 
-    async def get_all_users(self) -> List[UserModel]:
-        return await UsersService(self._uow).get_all_users()
+            return UserAccountScheme._make(user_account)
+
+    async def get_all_users(self) -> List[UserAccountScheme]:
+        async with self._uow as uow:
+            return [UserAccountScheme._make(user_account) for user_account in await uow.read_model.get_all_users()]
+
+    async def get_all_users_ids(self) -> List[int]:
+        async with self._uow as uow:
+            return await uow.read_model.get_all_users_ids()
@@ -16,3 +16,7 @@ class UserNotFoundError(DetailedException):
 
 class UserHasNoPermissionsError(DetailedException):
     DETAIL = ErrorDetails.USER_HAS_NO_PERMISSIONS
+
+
+class AdminNotFoundError(DetailedException):
+    DETAIL = ErrorDetails.ADMIN_NOT_FOUND
@@ -0,0 +1,45 @@
+from typing import List, Tuple, Optional
+from abc import ABC, abstractmethod
+
+from src.core.interfaces import AbstractReadModel
+
+
+# (id, is_bot, first_name, role, full_name, url, last_name, username):
+UserAccountRow = Tuple[int, bool, str, str, str, str, Optional[str], Optional[str]]
+
+
+class UsersReadModel(AbstractReadModel, ABC):
+    """
+    An interface for reading users data, that is used by users views through users unit of work.
+    The main goal is that implementations of this interface can be easily replaced in users unit of work
+    using dependency injection without disrupting its functionality.
+    """
+
+    @abstractmethod
+    async def get_user_account(self, user_id: int) -> Optional[UserAccountRow]:
+        """
+        Returns account row of user, if user exists.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all_users(self) -> List[UserAccountRow]:
+        """
+        Returns account rows of all users.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all_users_ids(self) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_users_ids_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[int]:
+        """
+        Returns ids of users, ordered by id, which are greater than provided id, so all users can be read by pages
+        without loading all ids to memory.
+        """
+
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from abc import ABC, abstractmethod
 
 from src.core.interfaces import AbstractRepository, AbstractModel
@@ -35,3 +35,11 @@ class UsersRepository(AbstractRepository, ABC):
     @abstractmethod
     async def list(self) -> List[UserModel]:
         raise NotImplementedError
+
+    @abstractmethod
+    def stream(self) -> AsyncIterator[UserModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[UserModel]:
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 from abc import ABC
 
 from src.users.interfaces.repositories import UsersRepository
+from src.users.interfaces.read_models import UsersReadModel
 from src.core.interfaces import AbstractUnitOfWork
 
 
@@ -12,3 +13,4 @@ class UsersUnitOfWork(AbstractUnitOfWork, ABC):
     """
 
     users: UsersRepository
+    read_model: UsersReadModel
@@ -1,23 +1,40 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
+from src.core.concurrency import SingleFlight
+from src.core.invalidation import AbstractInvalidationBus, InvalidationTopics, invalidation_bus
 from src.users.constants import ErrorDetails
 from src.users.domain.models import UserModel
 from src.users.exceptions import UserNotFoundError
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 
 
+UsersByIdFlight = SingleFlight[Tuple[int, bool], Optional[Dict[str, Any]]]
+users_by_id_flight: UsersByIdFlight = SingleFlight()
+
+
 class UsersService:
     """
     Service layer core according to DDD, which using a unit of work, will perform operations on the domain model.
+    Every change of user is published to invalidation bus, so all bot instances drop the user from their caches.
     """
 
-    def __init__(self, uow: UsersUnitOfWork) -> None:
+    def __init__(
+            self,
+            uow: UsersUnitOfWork,
+            bus: AbstractInvalidationBus = invalidation_bus,
+            flight: UsersByIdFlight = users_by_id_flight
+    ) -> None:
+
         self._uow: UsersUnitOfWork = uow
+        self._bus: AbstractInvalidationBus = bus
+        self._flight: UsersByIdFlight = flight
 
     async def register_user(self, user: UserModel) -> UserModel:
         async with self._uow as uow:
             user = await uow.users.add(model=user)
+            uow.register_affected_users(users_ids=[user.id])
             await uow.commit()
+            await self._bus.publish(topic=InvalidationTopics.USERS, key=user.id)
             return user
 
     async def check_user_existence(
@@ -66,12 +83,29 @@ class UsersService:
             return user
 
     async def get_user_by_id(self, id: int) -> UserModel:
+        """
+        Concurrent reads of the same user share one read, which looks up users cache first, so session of unit of
+        work is touched only on cache misses. User is shared as dictionary, so every caller gets its own model,
+        which is not bound to session of other caller.
+
+        Shared read works within unit of work of the first caller, so no additional session and connection are used.
+        Only callers, which are routed to the same database, share read, so callers, which have to read their
+        writes from primary database, never get user from replica.
+        """
+
+        data: Optional[Dict[str, Any]] = await self._flight.do(
+            key=(id, self._uow.uses_replica()),
+            function=lambda: self._get_user_data(id=id)
+        )
+        if not data:
+            raise UserNotFoundError
+
+        return UserModel(**data)
+
+    async def _get_user_data(self, id: int) -> Optional[Dict[str, Any]]:
         async with self._uow as uow:
             user: Optional[UserModel] = await uow.users.get(id=id)
-            if not user:
-                raise UserNotFoundError
-
-            return user
+            return await user.to_dict() if user else None
 
     async def get_all_users(self) -> List[UserModel]:
         async with self._uow as uow:
@@ -1,8 +1,11 @@
 from typing import Self
 
 from src.users.interfaces.repositories import UsersRepository
+from src.users.interfaces.read_models import UsersReadModel
 from src.users.interfaces.units_of_work import UsersUnitOfWork
-from src.users.adapters.repositories import SQLAlchemyUsersRepository
+from src.users.adapters.repositories import SQLAlchemyUsersRepository, CachedUsersRepository
+from src.users.config import users_config
+from src.users.adapters.read_models import SQLAlchemyUsersReadModel
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
 
 
@@ -11,4 +14,13 @@ class SQLAlchemyUsersUnitOfWork(SQLAlchemyAbstractUnitOfWork, UsersUnitOfWork):
     async def __aenter__(self) -> Self:
         uow = await super().__aenter__()
         self.users: UsersRepository = SQLAlchemyUsersRepository(session=self._session)
+        if users_config.USERS_CACHE_ENABLED:
+            self.users = CachedUsersRepository(repository=self.users)
+
+        self.read_model: UsersReadModel = SQLAlchemyUsersReadModel(session=self._session)
         return uow
+
+    async def commit(self) -> None:
+        await super().commit()
+        if isinstance(self.users, CachedUsersRepository):
+            await self.users.invalidate_changed()
@@ -0,0 +1,39 @@
+import asyncio
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+
+def create_webhook_application(
+        dispatcher: Dispatcher,
+        bot: Bot,
+        path: str,
+        secret_token: str
+) -> web.Application:
+
+    """
+    Creates aiohttp application, which receives updates from Telegram on provided path. Telegram is answered
+    immediately and updates are handled in background. Requests without secret token are rejected.
+
+    Startup and shutdown of dispatcher are bound to startup and shutdown of application.
+    """
+
+    application: web.Application = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dispatcher,
+        bot=bot,
+        handle_in_background=True,
+        secret_token=secret_token
+    ).register(application, path=path)
+    setup_application(application, dispatcher, bot=bot)
+    return application
+
+
+async def run_webhook_application(application: web.Application, host: str, port: int) -> None:
+    runner: web.AppRunner = web.AppRunner(application)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host=host, port=port).start()
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
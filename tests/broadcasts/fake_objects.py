@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
+from aiogram import Bot
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.methods import SendMessage
+
+from src.broadcasts.constants import BroadcastStatuses
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.interfaces import BroadcastsRepository, BroadcastsUnitOfWork
+from src.core.interfaces import AbstractModel
+from src.users.interfaces import UsersRepository, UsersReadModel
+from tests.users.fake_objects import FakeUsersReadModel
+
+
+class FakeBroadcastsRepository(BroadcastsRepository):
+
+    def __init__(self, broadcasts: Optional[Dict[int, BroadcastModel]] = None) -> None:
+        self.broadcasts: Dict[int, BroadcastModel] = broadcasts if broadcasts else {}
+
+    async def get(self, id: int) -> Optional[BroadcastModel]:
+        return self.broadcasts.get(id)
+
+    async def add(self, model: AbstractModel) -> BroadcastModel:
+        broadcast: BroadcastModel = BroadcastModel(**await model.to_dict(include={'id': len(self.broadcasts) + 1}))
+        self.broadcasts[broadcast.id] = broadcast
+        return broadcast
+
+    async def update(self, id: int, model: AbstractModel) -> BroadcastModel:
+        broadcast: BroadcastModel = BroadcastModel(**await model.to_dict())
+        if id in self.broadcasts:
+            self.broadcasts[id] = broadcast
+
+        return broadcast
+
+    async def delete(self, id: int) -> None:
+        if id in self.broadcasts:
+            del self.broadcasts[id]
+
+    async def list(self) -> List[BroadcastModel]:
+        return list(self.broadcasts.values())
+
+    async def stream(self) -> AsyncIterator[BroadcastModel]:
+        for id in sorted(self.broadcasts):
+            yield self.broadcasts[id]
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[BroadcastModel]:
+        return [
+            self.broadcasts[id] for id in sorted(self.broadcasts) if after_id is None or id > after_id
+        ][:limit]
+
+    async def list_unfinished(self) -> List[BroadcastModel]:
+        return [broadcast for broadcast in await self.list() if broadcast.status == BroadcastStatuses.IN_PROGRESS]
+
+    async def claim_unfinished(
+            self,
+            owner: str,
+            heartbeat_at: datetime,
+            stale_before: datetime
+    ) -> List[BroadcastModel]:
+
+        claimed: List[BroadcastModel] = []
+        for broadcast in await self.list_unfinished():
+            if broadcast.owner is None or broadcast.heartbeat_at is None or broadcast.heartbeat_at < stale_before:
+                broadcast.owner = owner
+                broadcast.heartbeat_at = heartbeat_at
+                claimed.append(BroadcastModel(**await broadcast.to_dict()))
+
+        return claimed
+
+    async def update_owned(self, id: int, model: AbstractModel, owner: str) -> Optional[BroadcastModel]:
+        broadcast: Optional[BroadcastModel] = self.broadcasts.get(id)
+        if broadcast is None or broadcast.owner != owner:
+            return None
+
+        return await self.update(id=id, model=model)
+
+
+class FakeBroadcastsUnitOfWork(BroadcastsUnitOfWork):
+    """
+    Unit of work, which records every saved state of broadcasts as checkpoints.
+    """
+
+    def __init__(self, broadcasts_repository: BroadcastsRepository, users_repository: UsersRepository) -> None:
+        super().__init__()
+        self.broadcasts: BroadcastsRepository = broadcasts_repository
+        self.users_read_model: UsersReadModel = FakeUsersReadModel(users_repository=users_repository)
+        self.checkpoints: List[Dict[str, Any]] = []
+
+    async def commit(self) -> None:
+        for broadcast in await self.broadcasts.list():
+            self.checkpoints.append(await broadcast.to_dict())
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakeBot(Bot):
+    """
+    Bot, which records sent messages instead of sending requests to Telegram and is blocked by provided chats.
+    """
+
+    def __init__(self, blocked_chats_ids: Optional[Set[int]] = None) -> None:
+        super().__init__(token='42:TEST')
+        self.blocked_chats_ids: Set[int] = blocked_chats_ids if blocked_chats_ids else set()
+        self.sent_messages: List[Dict[str, Any]] = []
+
+    async def send_message(  # type: ignore[override]
+            self,
+            chat_id: Union[int, str],
+            text: str,
+            **kwargs: Any
+    ) -> bool:
+
+        if chat_id in self.blocked_chats_ids:
+            raise TelegramForbiddenError(
+                method=SendMessage(chat_id=chat_id, text=text),
+                message='Forbidden: bot was blocked by the user'
+            )
+
+        self.sent_messages.append({'chat_id': chat_id, 'text': text, **kwargs})
+        return True
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.broadcasts.constants import BroadcastStatuses
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.entrypoints.utils import resume_broadcasts, run_broadcast
+from src.broadcasts.service_layer.service import BroadcastsService
+from src.broadcasts.service_layer.units_of_work import SQLAlchemyBroadcastsUnitOfWork
+from src.core.database.connection import DATABASE_URL
+from src.users.domain.models import UserModel
+from tests.broadcasts.fake_objects import FakeBot
+from tests.config import FakeUserConfig
+
+
+@pytest.mark.anyio
+async def test_run_broadcast_counts_blocked_users_and_reports_to_admin(create_test_user: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(**FakeUserConfig().to_dict(to_lower=True) | {'id': 2}))
+
+    broadcast: BroadcastModel = await BroadcastsService(uow=SQLAlchemyBroadcastsUnitOfWork()).create_broadcast(
+        text='text',
+        admin_id=FakeUserConfig.ID
+    )
+    bot: FakeBot = FakeBot(blocked_chats_ids={2})
+    finished_broadcast: Optional[BroadcastModel] = await run_broadcast(bot=bot, broadcast=broadcast)
+
+    assert finished_broadcast is not None
+    assert (finished_broadcast.delivered, finished_broadcast.failed, finished_broadcast.blocked) == (1, 0, 1)
+    assert [sent_message['chat_id'] for sent_message in bot.sent_messages] == [FakeUserConfig.ID, FakeUserConfig.ID]
+    assert 'Delivered: 1' in bot.sent_messages[-1]['text']
+
+    async with SQLAlchemyBroadcastsUnitOfWork() as uow:
+        saved_broadcast: Optional[BroadcastModel] = await uow.broadcasts.get(id=broadcast.id)
+        assert saved_broadcast is not None
+        assert saved_broadcast.status == BroadcastStatuses.FINISHED
+        assert saved_broadcast.last_user_id == 2
+
+    await engine.dispose()
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_resume_broadcasts_continues_unfinished_broadcasts(create_test_user: None) -> None:
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=SQLAlchemyBroadcastsUnitOfWork())
+    await BroadcastsService(uow=SQLAlchemyBroadcastsUnitOfWork(), owner='stopped').create_broadcast(
+        text='text',
+        admin_id=FakeUserConfig.ID
+    )
+    async with SQLAlchemyBroadcastsUnitOfWork() as uow:
+        await uow.broadcasts.update(
+            id=(await uow.broadcasts.list_unfinished())[0].id,
+            model=BroadcastModel(text='text', admin_id=FakeUserConfig.ID, owner=None)
+        )
+        await uow.commit()
+
+    bot: FakeBot = FakeBot()
+    results: List[Optional[BroadcastModel]] = [await task for task in await resume_broadcasts(bot=bot)]
+
+    assert len(results) == 1
+    assert results[0] is not None and results[0].delivered == 1
+    assert await broadcasts_service.get_unfinished_broadcasts() == []
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_broadcasts_are_claimed_by_one_instance(create_test_user: None) -> None:
+    now: datetime = datetime.now(tz=timezone.utc)
+    async with SQLAlchemyBroadcastsUnitOfWork() as uow:
+        for owner, heartbeat_at in (('stopped', now - timedelta(hours=1)), ('running', now)):
+            await uow.broadcasts.add(
+                model=BroadcastModel(text='text', admin_id=FakeUserConfig.ID, owner=owner, heartbeat_at=heartbeat_at)
+            )
+
+        await uow.commit()
+
+    claims: List[List[BroadcastModel]] = list(await asyncio.gather(
+        *(
+            BroadcastsService(uow=SQLAlchemyBroadcastsUnitOfWork(), owner=owner).claim_unfinished_broadcasts()
+            for owner in ('first', 'second')
+        )
+    ))
+
+    assert sorted(len(claimed_broadcasts) for claimed_broadcasts in claims) == [0, 1]
+    assert [claimed_broadcasts[0].admin_id for claimed_broadcasts in claims if claimed_broadcasts] == [
+        FakeUserConfig.ID
+    ]
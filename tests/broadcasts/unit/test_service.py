@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from src.broadcasts.constants import BroadcastStatuses, DeliveryResults
+from src.broadcasts.domain.models import BroadcastModel
+from src.broadcasts.exceptions import BroadcastLeaseLostError
+from src.broadcasts.service_layer.service import BroadcastsService
+from src.users.domain.models import UserModel
+from tests.broadcasts.fake_objects import FakeBroadcastsRepository, FakeBroadcastsUnitOfWork
+from tests.config import FakeUserConfig
+from tests.users.fake_objects import FakeUsersRepository
+
+
+def create_fake_broadcasts_unit_of_work(users_count: int) -> FakeBroadcastsUnitOfWork:
+    users: Dict[int, UserModel] = {
+        id: UserModel(**FakeUserConfig().to_dict(to_lower=True) | {'id': id}) for id in range(1, users_count + 1)
+    }
+    return FakeBroadcastsUnitOfWork(
+        broadcasts_repository=FakeBroadcastsRepository(),
+        users_repository=FakeUsersRepository(users=users)
+    )
+
+
+@pytest.mark.anyio
+async def test_broadcasts_service_run_broadcast_delivers_to_all_users_by_pages() -> None:
+    uow: FakeBroadcastsUnitOfWork = create_fake_broadcasts_unit_of_work(users_count=5)
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow, page_size=2, workers=2)
+    broadcast: BroadcastModel = await broadcasts_service.create_broadcast(text='text', admin_id=FakeUserConfig.ID)
+    delivered_to: List[int] = []
+
+    async def deliver(user_id: int, text: str) -> str:
+        delivered_to.append(user_id)
+        if user_id == 2:
+            return DeliveryResults.BLOCKED
+        elif user_id == 4:
+            raise ValueError
+
+        return DeliveryResults.DELIVERED
+
+    broadcast = await broadcasts_service.run_broadcast(broadcast=broadcast, deliver=deliver)
+
+    assert sorted(delivered_to) == [1, 2, 3, 4, 5]
+    assert (broadcast.delivered, broadcast.failed, broadcast.blocked) == (3, 1, 1)
+    assert broadcast.status == BroadcastStatuses.FINISHED
+    assert await broadcasts_service.get_unfinished_broadcasts() == []
+
+    # Creation, one checkpoint per page and finishing:
+    assert [checkpoint['last_user_id'] for checkpoint in uow.checkpoints] == [None, 2, 4, 5, 5]
+
+
+@pytest.mark.anyio
+async def test_broadcasts_service_run_broadcast_resumes_from_checkpoint() -> None:
+    uow: FakeBroadcastsUnitOfWork = create_fake_broadcasts_unit_of_work(users_count=5)
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow, page_size=2)
+    broadcast: BroadcastModel = await broadcasts_service.create_broadcast(text='text', admin_id=FakeUserConfig.ID)
+    broadcast.last_user_id = 3
+    broadcast.delivered = 3
+    delivered_to: List[int] = []
+
+    async def deliver(user_id: int, text: str) -> str:
+        delivered_to.append(user_id)
+        return DeliveryResults.DELIVERED
+
+    broadcast = await broadcasts_service.run_broadcast(broadcast=broadcast, deliver=deliver)
+
+    assert delivered_to == [4, 5]
+    assert broadcast.delivered == 5
+
+
+@pytest.mark.anyio
+async def test_broadcasts_service_run_broadcast_bounds_concurrent_deliveries() -> None:
+    uow: FakeBroadcastsUnitOfWork = create_fake_broadcasts_unit_of_work(users_count=20)
+    broadcasts_service: BroadcastsService = BroadcastsService(uow=uow, page_size=10, workers=3)
+    broadcast: BroadcastModel = await broadcasts_service.create_broadcast(text='text', admin_id=FakeUserConfig.ID)
+    concurrent_deliveries: List[int] = [0]
+    max_concurrent_deliveries: List[int] = [0]
+
+    async def deliver(user_id: int, text: str) -> str:
+        concurrent_deliveries[0] += 1
+        max_concurrent_deliveries[0] = max(max_concurrent_deliveries[0], concurrent_deliveries[0])
+        await asyncio.sleep(0.001)
+        concurrent_deliveries[0] -= 1
+        return DeliveryResults.DELIVERED
+
+    broadcast = await broadcasts_service.run_broadcast(broadcast=broadcast, deliver=deliver)
+
+    assert broadcast.delivered == 20
+    assert max_concurrent_deliveries[0] == 3
+
+
+@pytest.mark.anyio
+async def test_broadcasts_service_claims_only_abandoned_broadcasts() -> None:
+    uow: FakeBroadcastsUnitOfWork = create_fake_broadcasts_unit_of_work(users_count=5)
+    first_service: BroadcastsService = BroadcastsService(uow=uow, page_size=2, owner='first')
+    second_service: BroadcastsService = BroadcastsService(uow=uow, page_size=2, owner='second', lease_timeout=60)
+    broadcast: BroadcastModel = await first_service.create_broadcast(text='text', admin_id=FakeUserConfig.ID)
+
+    assert await second_service.claim_unfinished_broadcasts() == []
+
+    broadcast.heartbeat_at = datetime.now(tz=timezone.utc) - timedelta(seconds=120)
+    await uow.broadcasts.update(id=broadcast.id, model=broadcast)
+    claimed_broadcasts: List[BroadcastModel] = await second_service.claim_unfinished_broadcasts()
+    assert [claimed_broadcast.owner for claimed_broadcast in claimed_broadcasts] == ['second']
+    assert await second_service.claim_unfinished_broadcasts() == []
+
+    async def deliver(user_id: int, text: str) -> str:
+        return DeliveryResults.DELIVERED
+
+    # Previous owner stops on its first checkpoint, new owner delivers broadcast:
+    with pytest.raises(BroadcastLeaseLostError):
+        await first_service.run_broadcast(broadcast=broadcast, deliver=deliver)
+
+    broadcast = await second_service.run_broadcast(broadcast=claimed_broadcasts[0], deliver=deliver)
+    assert broadcast.status == BroadcastStatuses.FINISHED
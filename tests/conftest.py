@@ -10,7 +10,10 @@ from src.core.database.connection import DATABASE_URL
 from src.core.database.metadata import metadata
 from src.users.adapters.orm import start_mappers as start_users_mappers
 from src.tasks.adapters.orm import start_mappers as start_tasks_mappers
+from src.broadcasts.adapters.orm import start_mappers as start_broadcasts_mappers
 from src.tasks.domain.models import TaskModel, TaskAssociationModel
+from src.tasks.service_layer.catalog import tasks_catalog
+from src.units_of_work import UpdateUnitOfWork, SQLAlchemyUpdateUnitOfWork
 from tests.config import FakeUserConfig, FakeTaskConfig, FakeMessageConfig, FakeTaskAssociationConfig
 from tests.utils import drop_test_db
 
@@ -24,6 +27,15 @@ def anyio_backend() -> str:
     return 'asyncio'
 
 
+@pytest.fixture(autouse=True)
+def clear_tasks_catalog() -> None:
+    """
+    Every test works with its own database, so tasks catalog snapshot of previous test should not be used.
+    """
+
+    tasks_catalog.clear()
+
+
 @pytest.fixture
 async def async_connection() -> AsyncGenerator[AsyncConnection, None]:
     engine: AsyncEngine = create_async_engine(DATABASE_URL)
@@ -47,6 +59,7 @@ async def map_models_to_orm(create_test_db: None) -> None:
     try:
         start_users_mappers()
         start_tasks_mappers()
+        start_broadcasts_mappers()
     except ArgumentError:
         pass
 
@@ -80,6 +93,19 @@ async def create_test_task(create_test_user: None) -> None:
             await conn.rollback()
 
 
+@pytest.fixture
+async def update_unit_of_work(map_models_to_orm: None) -> AsyncGenerator[UpdateUnitOfWork, None]:
+    """
+    Unit of work, which is provided to handlers by middleware during handling of one update.
+    """
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with SQLAlchemyUpdateUnitOfWork(engine=engine) as uow:
+        yield uow
+
+    await engine.dispose()
+
+
 @pytest.fixture
 async def message() -> Message:
     message: Message = Message(**FakeMessageConfig().to_dict(to_lower=True))
@@ -1,6 +1,10 @@
+import asyncio
 from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
 
-from src.core.interfaces import AbstractModel
+from src.core.exceptions import CacheBackendError
+from src.core.interfaces import AbstractCache, AbstractModel
 
 
 @dataclass
@@ -11,3 +15,156 @@ class FakeModel(AbstractModel):
 
     field1: str = 'test'
     field2: int = 123
+
+
+class FakeRedisServer:
+    """
+    Local server, which speaks Redis serialization protocol and supports only commands, used by RedisCache.
+    Time to live of keys is ignored, except of PTTL response.
+    """
+
+    def __init__(self) -> None:
+        self.values: Dict[bytes, bytes] = {}
+        self.ttls: Dict[bytes, int] = {}
+        self.port: int = 0
+        self.delay: float = 0
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, host='127.0.0.1', port=0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                count: int = int((await reader.readuntil(b'\r\n'))[1:-2])
+                args: List[bytes] = []
+                for _ in range(count):
+                    length: int = int((await reader.readuntil(b'\r\n'))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+
+                response: bytes = self._execute(command=args[0].upper(), args=args[1:])
+                await asyncio.sleep(self.delay)
+                writer.write(response)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _execute(self, command: bytes, args: List[bytes]) -> bytes:
+        if command == b'GET':
+            return self._bulk(self.values.get(args[0]))
+        elif command == b'MGET':
+            return f'*{len(args)}\r\n'.encode() + b''.join(self._bulk(self.values.get(key)) for key in args)
+        elif command == b'SET':
+            self.values[args[0]] = args[1]
+            self.ttls.pop(args[0], None)
+            if len(args) == 4 and args[2].upper() == b'PX':
+                self.ttls[args[0]] = int(args[3])
+
+            return b'+OK\r\n'
+        elif command == b'DEL':
+            existed: bool = self.values.pop(args[0], None) is not None
+            self.ttls.pop(args[0], None)
+            return f':{int(existed)}\r\n'.encode()
+        elif command == b'PTTL':
+            if args[0] not in self.values:
+                return b':-2\r\n'
+
+            return f':{self.ttls.get(args[0], -1)}\r\n'.encode()
+
+        return b'-ERR unknown command\r\n'
+
+    @staticmethod
+    def _bulk(value: Optional[bytes]) -> bytes:
+        if value is None:
+            return b'$-1\r\n'
+
+        return f'${len(value)}\r\n'.encode() + value + b'\r\n'
+
+
+class FailingCache(AbstractCache):
+    """
+    Cache, which backend is unavailable.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise CacheBackendError
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise ConnectionRefusedError
+
+    async def delete(self, key: str) -> None:
+        raise CacheBackendError
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        raise CacheBackendError
+
+    async def ttl(self, key: str) -> Optional[float]:
+        raise CacheBackendError
+
+
+class FakeListenDriverConnection:
+    """
+    Driver connection, which only keeps listeners, as asyncpg connection does, and can be terminated.
+    """
+
+    def __init__(self) -> None:
+        self.listeners: Dict[str, Callable[..., None]] = {}
+        self.termination_listeners: List[Callable[[Any], None]] = []
+
+    async def add_listener(self, channel: str, callback: Callable[..., None]) -> None:
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel: str, callback: Callable[..., None]) -> None:
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback: Callable[[Any], None]) -> None:
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback: Callable[[Any], None]) -> None:
+        self.termination_listeners.remove(callback)
+
+    def terminate(self) -> None:
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+class FakeListenConnection:
+
+    def __init__(self) -> None:
+        self.driver_connection: FakeListenDriverConnection = FakeListenDriverConnection()
+        self.invalidated: bool = False
+        self.closed: bool = False
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self.driver_connection)
+
+    async def invalidate(self) -> None:
+        self.invalidated = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeListenEngine:
+    """
+    Engine, which opens fake listening connections and fails to connect provided number of times.
+    """
+
+    def __init__(self) -> None:
+        self.connections: List[FakeListenConnection] = []
+        self.failures: int = 0
+
+    async def connect(self) -> FakeListenConnection:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionRefusedError
+
+        connection: FakeListenConnection = FakeListenConnection()
+        self.connections.append(connection)
+        return connection
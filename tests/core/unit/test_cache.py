@@ -0,0 +1,156 @@
+import asyncio
+import pytest
+from typing import Any, Optional
+
+from src.core.cache import LRUCache, InMemoryCache, RedisCache, NamespacedCache, CacheStats, create_cache
+from src.core.cache.config import CacheConfig, cache_config
+from src.core.cache.constants import CacheBackends
+from src.core.exceptions import CacheBackendError
+from tests.core.fake_objects import FakeRedisServer
+
+
+def test_lru_cache_counts_hits_and_misses() -> None:
+    cache: LRUCache[int, str] = LRUCache(max_size=2, ttl=60)
+    assert cache.get(key=1) is None
+
+    cache.set(key=1, value='first')
+    value: Optional[str] = cache.get(key=1)
+    assert value == 'first'
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.stats() == CacheStats(hits=1, misses=1)
+    assert cache.stats().hit_ratio == 0.5
+
+
+def test_lru_cache_evicts_least_recently_used_value() -> None:
+    cache: LRUCache[int, str] = LRUCache(max_size=2, ttl=60)
+    cache.set(key=1, value='first')
+    cache.set(key=2, value='second')
+    assert cache.get(key=1) == 'first'
+
+    cache.set(key=3, value='third')
+    assert len(cache) == 2
+    assert cache.get(key=2) is None
+    assert cache.get(key=1) == 'first'
+    assert cache.get(key=3) == 'third'
+
+
+def test_lru_cache_evicts_expired_value() -> None:
+    cache: LRUCache[int, str] = LRUCache(max_size=2, ttl=0)
+    cache.set(key=1, value='first')
+    assert cache.get(key=1) is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_and_clear() -> None:
+    cache: LRUCache[int, str] = LRUCache(max_size=2, ttl=60)
+    cache.set(key=1, value='first')
+    cache.set(key=2, value='second')
+
+    cache.delete(key=1)
+    cache.delete(key=3)
+    assert cache.get(key=1) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_in_memory_cache() -> None:
+    cache: InMemoryCache = InMemoryCache(max_size=10, default_ttl=60)
+    await cache.set(key='first', value={'id': 1})
+    await cache.set(key='second', value=[2], ttl=0)
+
+    value: Optional[Any] = await cache.get(key='first')
+    assert value == {'id': 1}
+    assert await cache.get(key='second') is None
+    assert await cache.get_many(keys=['first', 'second', 'third']) == {'first': {'id': 1}}
+
+    ttl: Optional[float] = await cache.ttl(key='first')
+    assert ttl is not None and 0 < ttl <= 60
+
+    await cache.delete(key='first')
+    assert await cache.get(key='first') is None
+    assert await cache.ttl(key='first') is None
+
+
+@pytest.mark.anyio
+async def test_redis_cache_with_fake_server() -> None:
+    server: FakeRedisServer = FakeRedisServer()
+    await server.start()
+    cache: RedisCache = RedisCache(host='127.0.0.1', port=server.port)
+
+    await cache.set(key='first', value={'id': 1})
+    await cache.set(key='second', value='value', ttl=1.5)
+    assert server.values[b'first'] == b'{"id": 1}'
+
+    assert await cache.get(key='first') == {'id': 1}
+    assert await cache.get(key='third') is None
+    assert await cache.get_many(keys=['first', 'third', 'second']) == {'first': {'id': 1}, 'second': 'value'}
+    assert await cache.get_many(keys=[]) == {}
+
+    assert await cache.ttl(key='first') is None
+    assert await cache.ttl(key='second') == 1.5
+    assert await cache.ttl(key='third') is None
+
+    await cache.delete(key='first')
+    assert await cache.get(key='first') is None
+
+    with pytest.raises(CacheBackendError):
+        await cache.execute('UNKNOWN')
+
+    await cache.close()
+    await server.stop()
+
+
+@pytest.mark.anyio
+async def test_redis_cache_drops_connection_after_cancelled_command() -> None:
+    server: FakeRedisServer = FakeRedisServer()
+    await server.start()
+    cache: RedisCache = RedisCache(host='127.0.0.1', port=server.port)
+    await cache.set(key='first', value=1)
+    await cache.set(key='second', value=2)
+
+    # Response of cancelled command would be read by next command, if connection was kept:
+    server.delay = 0.05
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(cache.get(key='first'), timeout=0.01)
+
+    server.delay = 0
+    assert await cache.get(key='second') == 2
+
+    await cache.close()
+    await server.stop()
+
+
+@pytest.mark.anyio
+async def test_namespaced_cache_prefixes_keys_and_counts_hits() -> None:
+    backend: InMemoryCache = InMemoryCache(max_size=10, default_ttl=60)
+    cache: NamespacedCache = NamespacedCache(cache=backend, namespace='users', version=2)
+
+    await cache.set(key=1, value='first')
+    assert await backend.get(key='users:v2:1') == 'first'
+    assert await NamespacedCache(cache=backend, namespace='users').get(key=1) is None
+
+    assert await cache.get(key=1) == 'first'
+    assert await cache.get_many(keys=[1, 2]) == {'1': 'first'}
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert cache.stats() == CacheStats(hits=2, misses=1)
+
+    cache.clear()
+    assert await cache.get(key=1) is None
+    await cache.set(key=1, value='second')
+    assert await cache.get(key=1) == 'second'
+
+
+def test_create_cache_selects_backend_by_config() -> None:
+    config: CacheConfig = cache_config.model_copy(update={'CACHE_BACKEND': CacheBackends.REDIS})
+    assert isinstance(create_cache(config=config), RedisCache)
+
+    config = cache_config.model_copy(update={'CACHE_BACKEND': CacheBackends.MEMORY})
+    assert isinstance(create_cache(config=config, max_size=1), InMemoryCache)
+
+
+def test_cache_stats_hit_ratio_without_requests() -> None:
+    assert CacheStats(hits=0, misses=0).hit_ratio == 0
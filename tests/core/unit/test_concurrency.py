@@ -0,0 +1,107 @@
+import asyncio
+import time
+import pytest
+from typing import List, Tuple
+
+from src.core.concurrency import SingleFlight, TokenBucket
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_concurrent_calls_with_same_key() -> None:
+    calls: List[int] = []
+
+    async def function(value: int) -> int:
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    results: Tuple[int, int, int] = await asyncio.gather(
+        single_flight.do(key='first', function=lambda: function(1)),
+        single_flight.do(key='first', function=lambda: function(2)),
+        single_flight.do(key='second', function=lambda: function(3))
+    )
+
+    assert list(results) == [1, 1, 3]
+    assert calls == [1, 3]
+    await asyncio.sleep(0)
+    assert len(single_flight) == 0
+
+    assert await single_flight.do(key='first', function=lambda: function(4)) == 4
+    assert calls == [1, 3, 4]
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_exception() -> None:
+    async def function() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    results: Tuple[BaseException | int, BaseException | int] = await asyncio.gather(
+        single_flight.do(key='first', function=function),
+        single_flight.do(key='first', function=function),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.anyio
+async def test_single_flight_call_is_not_cancelled_by_first_caller() -> None:
+    async def function() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    first_caller: asyncio.Task = asyncio.create_task(single_flight.do(key='first', function=function))
+    await asyncio.sleep(0)
+    second_caller: asyncio.Task = asyncio.create_task(single_flight.do(key='first', function=function))
+    await asyncio.sleep(0)
+
+    first_caller.cancel()
+    assert await second_caller == 1
+    assert first_caller.cancelled()
+
+
+@pytest.mark.anyio
+async def test_token_bucket_allows_burst_and_paces_next_acquires() -> None:
+    bucket: TokenBucket = TokenBucket(rate=50, capacity=2)
+    started_at: float = time.monotonic()
+    wait_times: Tuple[float, float, float] = await asyncio.gather(bucket.acquire(), bucket.acquire(), bucket.acquire())
+
+    assert wait_times[0] < 0.01 and wait_times[1] < 0.01
+    assert wait_times[2] >= 0.015
+    assert time.monotonic() - started_at >= 0.015
+    assert not bucket.is_full()
+
+
+@pytest.mark.anyio
+async def test_token_bucket_waits_while_paused() -> None:
+    bucket: TokenBucket = TokenBucket(rate=1000, capacity=1)
+    bucket.pause(seconds=0.05)
+
+    assert await bucket.acquire() >= 0.045
+
+
+@pytest.mark.anyio
+async def test_token_bucket_serves_waiters_concurrently_in_order_of_arrival() -> None:
+    bucket: TokenBucket = TokenBucket(rate=20, capacity=1)
+    started_at: float = time.monotonic()
+    wait_times: Tuple[float, float, float] = await asyncio.gather(bucket.acquire(), bucket.acquire(), bucket.acquire())
+
+    # Waiters sleep concurrently, so the last one waits only for its own token:
+    assert wait_times[0] < 0.01
+    assert 0.045 <= wait_times[1] < wait_times[2] < 0.13
+    assert time.monotonic() - started_at < 0.13
+
+
+@pytest.mark.anyio
+async def test_token_bucket_requeues_waiters_after_pause() -> None:
+    bucket: TokenBucket = TokenBucket(rate=100, capacity=1)
+    await bucket.acquire()
+    waiter: asyncio.Task = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    bucket.pause(seconds=0.05)
+    assert await waiter >= 0.045
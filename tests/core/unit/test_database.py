@@ -1,11 +1,16 @@
+import asyncio
 import pytest
-from typing import Sequence, Optional
-from sqlalchemy import insert, select, CursorResult, Row
+from typing import Sequence, Optional, List, Any, Dict
+from sqlalchemy import insert, select, event, CursorResult, Result, Row, AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from src.users.domain.models import UserModel
+from src.core.database.config import database_config, DatabaseConfig
+from src.core.database.connection import DATABASE_URL, warm_up_pool, get_pool_arguments, get_connect_arguments
+from src.core.database.constants import DatabasePoolModes
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
+from src.core.database.routing import ReadYourWritesTracker
 from tests.config import FakeUserConfig
 
 
@@ -41,3 +46,271 @@ async def test_sqlalchemy_abstract_unit_of_work_not_saves_incorrect_model_and_ro
     cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(id=FakeUserConfig.ID))
     result: Sequence[Row] = cursor.all()
     assert not result
+
+
+@pytest.mark.anyio
+async def test_warm_up_pool_establishes_connections_before_usage(map_models_to_orm: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL, poolclass=AsyncAdaptedQueuePool, pool_size=3)
+    connects: List[Any] = []
+    event.listen(engine.sync_engine, 'connect', lambda *args: connects.append(args))
+
+    await warm_up_pool(engine=engine, connections_count=3)
+    assert len(connects) == 3
+
+    connections: List[AsyncConnection] = await asyncio.gather(*[engine.connect() for _ in range(3)])
+    for connection in connections:
+        await connection.close()
+
+    assert len(connects) == 3
+    await engine.dispose()
+
+
+def test_get_pool_arguments_with_sqlite() -> None:
+    config: DatabaseConfig = database_config.model_copy(update={'DATABASE_DIALECT': 'sqlite'})
+    assert get_pool_arguments(config=config) == {}
+
+
+def test_get_pool_arguments_with_session_pool_mode() -> None:
+    config: DatabaseConfig = database_config.model_copy(
+        update={
+            'DATABASE_DIALECT': 'postgresql',
+            'DATABASE_POOL_MODE': DatabasePoolModes.SESSION,
+            'DATABASE_POOL_SIZE': 7
+        }
+    )
+
+    assert get_pool_arguments(config=config)['pool_size'] == 7
+
+
+def test_get_pool_arguments_with_transaction_pool_mode() -> None:
+    config: DatabaseConfig = database_config.model_copy(
+        update={
+            'DATABASE_DIALECT': 'postgresql',
+            'DATABASE_POOL_MODE': DatabasePoolModes.TRANSACTION
+        }
+    )
+
+    assert get_pool_arguments(config=config) == {'poolclass': NullPool}
+
+
+def test_get_connect_arguments_with_not_asyncpg_driver() -> None:
+    config: DatabaseConfig = database_config.model_copy(update={'DATABASE_DRIVER': 'aiosqlite'})
+    assert get_connect_arguments(config=config) == {}
+
+
+def test_get_connect_arguments_with_transaction_pool_mode() -> None:
+    config: DatabaseConfig = database_config.model_copy(
+        update={
+            'DATABASE_DRIVER': 'asyncpg',
+            'DATABASE_POOL_MODE': DatabasePoolModes.TRANSACTION,
+            'DATABASE_STATEMENT_CACHE_SIZE': 100
+        }
+    )
+
+    connect_arguments: Dict[str, Any] = get_connect_arguments(config=config)
+    assert connect_arguments['statement_cache_size'] == 0
+    assert connect_arguments['prepared_statement_cache_size'] == 0
+    assert connect_arguments['prepared_statement_name_func']() != connect_arguments['prepared_statement_name_func']()
+
+
+@pytest.fixture
+def session_rollbacks(monkeypatch: pytest.MonkeyPatch) -> List[AsyncSession]:
+    """
+    Collects sessions, which sent ROLLBACK.
+    """
+
+    rollbacks: List[AsyncSession] = []
+    rollback = AsyncSession.rollback
+
+    async def spy_rollback(session: AsyncSession) -> None:
+        rollbacks.append(session)
+        await rollback(session)
+
+    monkeypatch.setattr(AsyncSession, 'rollback', spy_rollback)
+    return rollbacks
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_skips_rollback_after_commit(
+        map_models_to_orm: None,
+        session_rollbacks: List[AsyncSession]
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    async with uow:
+        new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+        await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+        await uow.commit()
+
+    assert not session_rollbacks
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_rollbacks_after_read(
+        create_test_user: None,
+        session_rollbacks: List[AsyncSession]
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    async with uow:
+        await uow._session.execute(select(UserModel))
+
+    assert len(session_rollbacks) == 1
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_read_only_uses_autocommit_and_skips_rollback(
+        create_test_user: None,
+        session_rollbacks: List[AsyncSession]
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(read_only=True)
+    async with uow:
+        connection: AsyncConnection = await uow._session.connection()
+        assert connection.sync_connection is not None
+        assert connection.sync_connection.get_execution_options()['isolation_level'] == 'AUTOCOMMIT'
+
+        result: Result = await uow._session.execute(select(UserModel))
+        assert result.first()
+
+    assert not session_rollbacks
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_read_only_rollbacks_on_exception(
+        create_test_user: None,
+        session_rollbacks: List[AsyncSession]
+) -> None:
+
+    with pytest.raises(ValueError):
+        uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(read_only=True)
+        async with uow:
+            await uow._session.execute(select(UserModel))
+            raise ValueError
+
+    assert len(session_rollbacks) == 1
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_read_only_ends_transaction_of_provided_session(
+        create_test_user: None
+) -> None:
+
+    session: AsyncSession = async_sessionmaker(bind=create_async_engine(DATABASE_URL))()
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(session=session, read_only=True)
+    async with uow:
+        user: Optional[UserModel] = (await uow._session.execute(select(UserModel))).scalar_one_or_none()
+        assert session.in_transaction()
+
+    assert not session.in_transaction()
+    assert user is not None and user not in session
+    await session.close()
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_expunges_models_after_commit(create_test_user: None) -> None:
+    session: AsyncSession = async_sessionmaker(bind=create_async_engine(DATABASE_URL))()
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(session=session)
+    async with uow:
+        user: Optional[UserModel] = (await uow._session.execute(select(UserModel))).scalar_one_or_none()
+        await uow.commit()
+
+    assert user is not None and user not in session
+    await session.close()
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_routes_read_only_to_replica(create_test_user: None) -> None:
+    replica_engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    replica_session_factory: async_sessionmaker = async_sessionmaker(bind=replica_engine)
+    tracker: ReadYourWritesTracker = ReadYourWritesTracker()
+
+    read_only_uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(
+        read_only=True,
+        replica_session_factory=replica_session_factory,
+        user_id=FakeUserConfig.ID,
+        tracker=tracker
+    )
+    async with read_only_uow:
+        assert isinstance(read_only_uow._session.bind, AsyncEngine)
+        assert read_only_uow._session.bind.pool is replica_engine.pool
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(
+        replica_session_factory=replica_session_factory,
+        user_id=FakeUserConfig.ID,
+        tracker=tracker
+    )
+    async with uow:
+        assert isinstance(uow._session.bind, AsyncEngine)
+        assert uow._session.bind.pool is not replica_engine.pool
+        await uow.commit()
+
+    async with read_only_uow:
+        assert isinstance(read_only_uow._session.bind, AsyncEngine)
+        assert read_only_uow._session.bind.pool is not replica_engine.pool
+
+    await replica_engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_detached_works_within_own_session(create_test_user: None) -> None:
+    session: AsyncSession = async_sessionmaker(bind=create_async_engine(DATABASE_URL))()
+    tracker: ReadYourWritesTracker = ReadYourWritesTracker()
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(
+        session=session,
+        read_only=True,
+        user_id=FakeUserConfig.ID,
+        tracker=tracker
+    )
+
+    detached_uow: SQLAlchemyAbstractUnitOfWork = uow.detach()
+    async with detached_uow:
+        assert detached_uow._session is not session
+        assert (await detached_uow._session.execute(select(UserModel))).scalar_one_or_none() is not None
+
+    await session.close()
+    assert detached_uow._read_only
+    assert detached_uow._user_id == FakeUserConfig.ID
+    assert detached_uow._tracker is tracker
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_registers_writes_of_affected_users_on_commit(
+        create_test_user: None
+) -> None:
+
+    tracker: ReadYourWritesTracker = ReadYourWritesTracker(window=60)
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(user_id=FakeUserConfig.ID, tracker=tracker)
+    async with uow:
+        uow.register_affected_users(users_ids=[FakeUserConfig.ID + 1])
+
+    assert not tracker.has_recent_writes(user_id=FakeUserConfig.ID + 1)
+
+    async with uow:
+        uow.register_affected_users(users_ids=[FakeUserConfig.ID + 2])
+        await uow.commit()
+
+    assert tracker.has_recent_writes(user_id=FakeUserConfig.ID)
+    assert tracker.has_recent_writes(user_id=FakeUserConfig.ID + 2)
+    assert not tracker.has_recent_writes(user_id=FakeUserConfig.ID + 1)
+
+
+def test_read_your_writes_tracker() -> None:
+    tracker: ReadYourWritesTracker = ReadYourWritesTracker(window=60)
+    assert not tracker.has_recent_writes(user_id=FakeUserConfig.ID)
+    assert not tracker.has_recent_writes(user_id=None)
+
+    tracker.register_write(user_id=FakeUserConfig.ID)
+    assert tracker.has_recent_writes(user_id=FakeUserConfig.ID)
+
+    tracker = ReadYourWritesTracker(window=0)
+    tracker.register_write(user_id=FakeUserConfig.ID)
+    assert not tracker.has_recent_writes(user_id=FakeUserConfig.ID)
+
+
+def test_read_your_writes_tracker_evicts_expired_writes() -> None:
+    tracker: ReadYourWritesTracker = ReadYourWritesTracker(window=0)
+    for user_id in range(100):
+        tracker.register_write(user_id=user_id)
+
+    assert len(tracker._last_writes) == 1
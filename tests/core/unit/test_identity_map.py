@@ -0,0 +1,33 @@
+import pytest
+from typing import Optional
+
+from src.core.identity_map import IdentityMap
+from tests.core.fake_objects import FakeModel
+
+
+@pytest.mark.anyio
+async def test_identity_map_keeps_copies_by_type_and_id() -> None:
+    identity_map: IdentityMap = IdentityMap()
+    model: FakeModel = FakeModel()
+
+    model_copy: FakeModel = await identity_map.add(id=1, model=model)
+    assert model_copy is not model
+    assert model_copy == model
+
+    found_model: Optional[FakeModel] = identity_map.get(FakeModel, 1)
+    assert found_model is model_copy
+    assert identity_map.get(FakeModel, 2) is None
+
+
+@pytest.mark.anyio
+async def test_identity_map_discard_and_clear() -> None:
+    identity_map: IdentityMap = IdentityMap()
+    await identity_map.add(id=1, model=FakeModel())
+    await identity_map.add(id=2, model=FakeModel())
+
+    identity_map.discard(FakeModel, 1)
+    assert identity_map.get(FakeModel, 1) is None
+    assert len(identity_map) == 1
+
+    identity_map.clear(FakeModel)
+    assert len(identity_map) == 0
@@ -0,0 +1,55 @@
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import SendMessage, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import Chat, Message
+
+
+class FakeSession(BaseSession):
+    """
+    Session of bot, which records requests instead of sending them to Telegram and answers them successfully.
+    Requests are answered only when can_answer is set.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: List[TelegramMethod[Any]] = []
+        self.can_answer: asyncio.Event = asyncio.Event()
+        self.can_answer.set()
+
+    async def make_request(
+            self,
+            bot: Bot,
+            method: TelegramMethod[TelegramType],
+            timeout: Optional[int] = None
+    ) -> TelegramType:
+
+        await self.can_answer.wait()
+        request: TelegramMethod[Any] = method
+        self.requests.append(request)
+        if isinstance(request, SendMessage):
+            return Message(  # type: ignore[return-value]
+                message_id=len(self.requests),
+                date=datetime.now(),
+                chat=Chat(id=int(request.chat_id), type='private'),
+                text=request.text
+            )
+
+        return True  # type: ignore[return-value]
+
+    async def stream_content(
+            self,
+            url: str,
+            headers: Optional[Dict[str, Any]] = None,
+            timeout: int = 30,
+            chunk_size: int = 65536,
+            raise_for_status: bool = True
+    ) -> AsyncGenerator[bytes, None]:
+
+        yield b''
+
+    async def close(self) -> None:
+        pass
@@ -1,6 +1,12 @@
-from typing import Dict, Optional, List
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, List, Set, Tuple, Union
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import CopyMessage
+from aiogram.types import MessageId
 
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
+from src.tasks.interfaces.read_models import TasksReadModel
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
 from src.tasks.domain.models import TaskModel, TaskAssociationModel
 from src.core.interfaces import AbstractModel
@@ -26,6 +32,9 @@ class FakeTasksRepository(TasksRepository):
         self.tasks[task.id] = task
         return task
 
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskModel]:
+        return [await self.add(model=model) for model in models]
+
     async def update(self, id: int, model: AbstractModel) -> TaskModel:
         task: TaskModel = TaskModel(**await model.to_dict())
         if id in self.tasks:
@@ -40,10 +49,37 @@ class FakeTasksRepository(TasksRepository):
     async def list(self) -> List[TaskModel]:
         return list(self.tasks.values())
 
+    async def stream(self) -> AsyncIterator[TaskModel]:
+        for id in sorted(self.tasks):
+            yield self.tasks[id]
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskModel]:
+        return [
+            self.tasks[id] for id in sorted(self.tasks) if after_id is None or id > after_id
+        ][:limit]
+
+    async def archive_tasks_except(self, descriptions: Set[str]) -> List[int]:
+        archived_tasks_ids: List[int] = []
+        for task in self.tasks.values():
+            if not (task.is_archived or task.description in descriptions):
+                task.is_archived = True
+                archived_tasks_ids.append(task.id)
+
+        return archived_tasks_ids
+
+    async def set_archived_status_by_ids(self, ids: List[int], is_archived: bool) -> None:
+        for task in self.tasks.values():
+            if task.id in ids:
+                task.is_archived = is_archived
+
 
 class FakeTasksAssociationsRepository(TasksAssociationsRepository):
 
-    def __init__(self, tasks_associations: Optional[Dict[int, TaskAssociationModel]] = None) -> None:
+    def __init__(
+            self,
+            tasks_associations: Optional[Dict[int, TaskAssociationModel]] = None
+    ) -> None:
+
         self.tasks_associations: Dict[int, TaskAssociationModel] = tasks_associations if tasks_associations else {}
 
     async def get(self, id: int) -> Optional[TaskAssociationModel]:
@@ -61,11 +97,27 @@ class FakeTasksAssociationsRepository(TasksAssociationsRepository):
             task_association.user_id == user_id
         ]
 
+    async def set_archived_status_by_task_ids(self, task_ids: List[int], task_archived: bool) -> None:
+        for task_association in self.tasks_associations.values():
+            if task_association.task_id in task_ids:
+                task_association.task_archived = task_archived
+
+    async def set_completed_status_if_active(self, id: int) -> Optional[TaskAssociationModel]:
+        task_association: Optional[TaskAssociationModel] = self.tasks_associations.get(id)
+        if not task_association or task_association.task_completed or task_association.task_archived:
+            return None
+
+        task_association.task_completed = True
+        return task_association
+
     async def add(self, model: AbstractModel) -> TaskAssociationModel:
         task_association: TaskAssociationModel = TaskAssociationModel(**await model.to_dict())
         self.tasks_associations[task_association.id] = task_association
         return task_association
 
+    async def add_many(self, models: List[AbstractModel]) -> List[TaskAssociationModel]:
+        return [await self.add(model=model) for model in models]
+
     async def update(self, id: int, model: AbstractModel) -> TaskAssociationModel:
         task_association: TaskAssociationModel = TaskAssociationModel(**await model.to_dict())
         if id in self.tasks_associations:
@@ -80,6 +132,58 @@ class FakeTasksAssociationsRepository(TasksAssociationsRepository):
     async def list(self) -> List[TaskAssociationModel]:
         return list(self.tasks_associations.values())
 
+    async def stream(self) -> AsyncIterator[TaskAssociationModel]:
+        for id in sorted(self.tasks_associations):
+            yield self.tasks_associations[id]
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskAssociationModel]:
+        return [
+            self.tasks_associations[id] for id in sorted(self.tasks_associations) if after_id is None or id > after_id
+        ][:limit]
+
+
+class FakeTasksReadModel(TasksReadModel):
+    """
+    Read model, which joins data of provided repositories in memory.
+    """
+
+    def __init__(
+            self,
+            tasks_repository: TasksRepository,
+            tasks_associations_repository: TasksAssociationsRepository
+    ) -> None:
+
+        self.tasks: TasksRepository = tasks_repository
+        self.tasks_associations: TasksAssociationsRepository = tasks_associations_repository
+
+    async def get_user_tasks_statistics(self, user_id: int) -> List[Tuple[str, bool]]:
+        tasks: Dict[int, TaskModel] = {task.id: task for task in await self.tasks.list()}
+        return [
+            (tasks[task_association.task_id].description, task_association.task_completed)
+            for task_association in await self.tasks_associations.get_tasks_associations_by_user_id(user_id=user_id)
+            if not task_association.task_archived and task_association.task_id in tasks
+        ]
+
+    async def get_user_active_tasks(self, user_id: int) -> List[Tuple[int, str]]:
+        tasks: Dict[int, TaskModel] = {task.id: task for task in await self.tasks.list()}
+        return [
+            (task_association.id, tasks[task_association.task_id].description)
+            for task_association in await self.tasks_associations.get_tasks_associations_by_user_id(user_id=user_id)
+            if not (task_association.task_archived or task_association.task_completed)
+            and task_association.task_id in tasks
+        ]
+
+
+class SlowFakeTasksRepository(FakeTasksRepository):
+    """
+    Repository, which lists tasks with delay after reading them, as if database answered slowly.
+    """
+
+    async def list(self) -> List[TaskModel]:
+        tasks: List[TaskModel] = await super().list()
+        await asyncio.sleep(0.02)
+        return tasks
+
 
 class FakeTasksUnitOfWork(TasksUnitOfWork):
 
@@ -92,10 +196,60 @@ class FakeTasksUnitOfWork(TasksUnitOfWork):
         super().__init__()
         self.tasks: TasksRepository = tasks_repository
         self.tasks_associations: TasksAssociationsRepository = tasks_associations_repository
+        self.read_model: TasksReadModel = FakeTasksReadModel(
+            tasks_repository=tasks_repository,
+            tasks_associations_repository=tasks_associations_repository
+        )
         self.committed: bool = False
+        self.affected_users_ids: Set[int] = set()
+
+    def register_affected_users(self, users_ids: Iterable[int]) -> None:
+        self.affected_users_ids.update(users_ids)
 
     async def commit(self) -> None:
         self.committed = True
 
     async def rollback(self) -> None:
         pass
+
+
+class FakeBot(Bot):
+    """
+    Bot, which records copied and deleted messages instead of sending requests to Telegram and fails for provided
+    chats.
+    """
+
+    def __init__(self, failing_chats_ids: Optional[Set[int]] = None) -> None:
+        super().__init__(token='42:TEST')
+        self.failing_chats_ids: Set[int] = failing_chats_ids if failing_chats_ids else set()
+        self.copied_messages: List[Dict[str, Any]] = []
+        self.deleted_messages: List[Dict[str, Any]] = []
+
+    async def delete_message(  # type: ignore[override]
+            self,
+            chat_id: Union[int, str],
+            message_id: int,
+            **kwargs: Any
+    ) -> bool:
+
+        self.deleted_messages.append({'chat_id': chat_id, 'message_id': message_id})
+        return True
+
+    async def copy_message(  # type: ignore[override]
+            self,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_id: int,
+            **kwargs: Any
+    ) -> MessageId:
+
+        if chat_id in self.failing_chats_ids:
+            raise TelegramBadRequest(
+                method=CopyMessage(chat_id=chat_id, from_chat_id=from_chat_id, message_id=message_id),
+                message='chat not found'
+            )
+
+        self.copied_messages.append(
+            {'chat_id': chat_id, 'from_chat_id': from_chat_id, 'message_id': message_id, **kwargs}
+        )
+        return MessageId(message_id=message_id)
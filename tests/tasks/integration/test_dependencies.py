@@ -1,13 +1,16 @@
 import pytest
-from typing import List, Optional
+from typing import Any, List, Optional
 from aiogram.types import Message
-from sqlalchemy import update, select, CursorResult, Row
+from sqlalchemy import update, select, event, CursorResult, Row
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from src.core.database.connection import DATABASE_URL
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
-from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme
+from src.tasks.domain.models import TaskModel, TaskAssociationModel, TasksCatalogDiff, ConfirmationContext
+from src.tasks.exceptions import TaskAssociationNotFoundError
+from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme, ActualTaskScheme
 from src.users.domain.models import UserModel
+from src.users.exceptions import AdminNotFoundError
+from src.units_of_work import UpdateUnitOfWork, SQLAlchemyUpdateUnitOfWork
 from tests.config import FakeTaskConfig, FakeTaskAssociationConfig, FakeUserConfig
 from src.tasks.entrypoints.dependencies import (
     get_user_tasks_statistics,
@@ -17,13 +20,23 @@ from src.tasks.entrypoints.dependencies import (
     get_task_by_association_id,
     get_user_by_association_id,
     set_task_competed_for_user,
-    get_task_association_by_id
+    get_task_association_by_id,
+    get_confirmation_context,
+    confirm_task_completeness
 )
 
 
 @pytest.mark.anyio
-async def test_get_user_tasks_statistics_with_existing_tasks(create_test_task: None, message: Message) -> None:
-    user_tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(message=message)
+async def test_get_user_tasks_statistics_with_existing_tasks(
+        create_test_task: None,
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    user_tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_tasks_statistics) == 1
 
     task_statistics: UserTaskStatisticsResponseScheme = user_tasks_statistics[0]
@@ -32,17 +45,29 @@ async def test_get_user_tasks_statistics_with_existing_tasks(create_test_task: N
 
 
 @pytest.mark.anyio
-async def test_get_user_tasks_statistics_without_existing_tasks(map_models_to_orm: None, message: Message) -> None:
-    user_tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(message=message)
+async def test_get_user_tasks_statistics_without_existing_tasks(
+        map_models_to_orm: None,
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    user_tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_tasks_statistics) == 0
 
 
 @pytest.mark.anyio
-async def test_get_actual_tasks_with_existing_actual_tasks(create_test_task: None) -> None:
-    tasks: List[TaskModel] = await get_actual_tasks()
+async def test_get_actual_tasks_with_existing_actual_tasks(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    tasks: List[ActualTaskScheme] = await get_actual_tasks(uow=update_unit_of_work)
     assert len(tasks) == 1
 
-    task: TaskModel = tasks[0]
+    task: ActualTaskScheme = tasks[0]
     assert task.id == FakeTaskConfig.ID
     assert task.description == FakeTaskConfig.DESCRIPTION
 
@@ -50,7 +75,8 @@ async def test_get_actual_tasks_with_existing_actual_tasks(create_test_task: Non
 @pytest.mark.anyio
 async def test_get_actual_tasks_with_existing_archived_tasks(
         create_test_task: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     await async_connection.execute(
@@ -64,23 +90,46 @@ async def test_get_actual_tasks_with_existing_archived_tasks(
     )
     await async_connection.commit()
 
-    tasks: List[TaskModel] = await get_actual_tasks()
+    tasks: List[ActualTaskScheme] = await get_actual_tasks(uow=update_unit_of_work)
     assert len(tasks) == 0
 
 
 @pytest.mark.anyio
-async def test_get_actual_tasks_without_existing_tasks(map_models_to_orm: None) -> None:
-    tasks: List[TaskModel] = await get_actual_tasks()
+async def test_get_actual_tasks_without_existing_tasks(
+        map_models_to_orm: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    tasks: List[ActualTaskScheme] = await get_actual_tasks(uow=update_unit_of_work)
     assert len(tasks) == 0
 
 
+@pytest.mark.anyio
+async def test_get_actual_tasks_after_update_tasks(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    assert len(await get_actual_tasks(uow=update_unit_of_work)) == 1
+
+    new_task: TaskModel = TaskModel(description=f'new_{FakeTaskConfig.DESCRIPTION}')
+    await update_tasks(tasks=[new_task], uow=update_unit_of_work)
+
+    tasks: List[ActualTaskScheme] = await get_actual_tasks(uow=update_unit_of_work)
+    assert [task.description for task in tasks] == [new_task.description]
+
+
 @pytest.mark.anyio
 async def test_get_user_active_tasks_with_existing_actual_tasks(
         create_test_task: None,
-        message: Message
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
-    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message)
+    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_active_tasks) == 1
 
     active_task: UserActiveTaskScheme = user_active_tasks[0]
@@ -92,7 +141,8 @@ async def test_get_user_active_tasks_with_existing_actual_tasks(
 async def test_get_user_active_tasks_with_existing_archived_tasks(
         create_test_task: None,
         async_connection: AsyncConnection,
-        message: Message
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     await async_connection.execute(
@@ -106,7 +156,10 @@ async def test_get_user_active_tasks_with_existing_archived_tasks(
     )
     await async_connection.commit()
 
-    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message)
+    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_active_tasks) == 0
 
 
@@ -114,7 +167,8 @@ async def test_get_user_active_tasks_with_existing_archived_tasks(
 async def test_get_user_active_tasks_with_existing_completed_tasks(
         create_test_task: None,
         async_connection: AsyncConnection,
-        message: Message
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     await async_connection.execute(
@@ -128,24 +182,32 @@ async def test_get_user_active_tasks_with_existing_completed_tasks(
     )
     await async_connection.commit()
 
-    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message)
+    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_active_tasks) == 0
 
 
 @pytest.mark.anyio
 async def test_get_user_active_tasks_without_existing_tasks(
         map_models_to_orm: None,
-        message: Message
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
-    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(message=message)
+    user_active_tasks: List[UserActiveTaskScheme] = await get_user_active_tasks(
+        message=message,
+        uow=update_unit_of_work
+    )
     assert len(user_active_tasks) == 0
 
 
 @pytest.mark.anyio
 async def test_update_tasks_with_no_existing_tasks_and_with_created_user(
         create_test_user: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(TaskAssociationModel))
@@ -153,7 +215,7 @@ async def test_update_tasks_with_no_existing_tasks_and_with_created_user(
     assert result is None
 
     tasks: List[TaskModel] = [TaskModel(**FakeTaskConfig().to_dict(to_lower=True))]
-    await update_tasks(tasks=tasks)
+    await update_tasks(tasks=tasks, uow=update_unit_of_work)
 
     cursor = await async_connection.execute(select(TaskAssociationModel))
     result = cursor.first()
@@ -167,7 +229,8 @@ async def test_update_tasks_with_no_existing_tasks_and_with_created_user(
 @pytest.mark.anyio
 async def test_update_tasks_with_existing_not_archived_tasks_and_with_created_user(
         create_test_task: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(TaskAssociationModel))
@@ -175,9 +238,10 @@ async def test_update_tasks_with_existing_not_archived_tasks_and_with_created_us
     assert result is not None
 
     tasks: List[TaskModel] = [TaskModel(**FakeTaskConfig().to_dict(to_lower=True))]
-    updated_tasks: List[TaskModel] = await update_tasks(tasks=tasks)
-    assert len(updated_tasks) == 1
-    task: TaskModel = updated_tasks[0]
+    tasks_catalog_diff: TasksCatalogDiff = await update_tasks(tasks=tasks, uow=update_unit_of_work)
+    assert len(tasks_catalog_diff.actual) == 1
+    assert len(tasks_catalog_diff.unchanged) == 1
+    task: TaskModel = tasks_catalog_diff.actual[0]
     assert task.id == FakeTaskConfig.ID
     assert task.description == FakeTaskConfig.DESCRIPTION
     assert task.is_archived is False
@@ -194,7 +258,8 @@ async def test_update_tasks_with_existing_not_archived_tasks_and_with_created_us
 @pytest.mark.anyio
 async def test_update_tasks_with_existing_archived_tasks_and_with_created_user(
         create_test_task: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(TaskAssociationModel))
@@ -224,9 +289,10 @@ async def test_update_tasks_with_existing_archived_tasks_and_with_created_user(
     await async_connection.commit()
 
     tasks: List[TaskModel] = [TaskModel(**FakeTaskConfig().to_dict(to_lower=True))]
-    updated_tasks: List[TaskModel] = await update_tasks(tasks=tasks)
-    assert len(updated_tasks) == 1
-    task: TaskModel = updated_tasks[0]
+    tasks_catalog_diff: TasksCatalogDiff = await update_tasks(tasks=tasks, uow=update_unit_of_work)
+    assert len(tasks_catalog_diff.actual) == 1
+    assert len(tasks_catalog_diff.reopened) == 1
+    task: TaskModel = tasks_catalog_diff.actual[0]
     assert task.id == FakeTaskConfig.ID
     assert task.description == FakeTaskConfig.DESCRIPTION
     assert task.is_archived is False
@@ -242,10 +308,51 @@ async def test_update_tasks_with_existing_archived_tasks_and_with_created_user(
         assert not task_archived
 
 
+@pytest.mark.anyio
+async def test_update_tasks_archives_not_provided_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    new_description: str = 'NewTaskDescription'
+    tasks: List[TaskModel] = [TaskModel(description=new_description)]
+    tasks_catalog_diff: TasksCatalogDiff = await update_tasks(tasks=tasks, uow=update_unit_of_work)
+    assert len(tasks_catalog_diff.added) == 1
+    assert len(tasks_catalog_diff.archived) == 1
+    assert tasks_catalog_diff.archived[0].description == FakeTaskConfig.DESCRIPTION
+    assert tasks_catalog_diff.archived[0].is_archived
+    assert [task.description for task in tasks_catalog_diff.actual] == [new_description]
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            task_id=FakeTaskAssociationConfig.TASK_ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result is not None
+    task_archived: bool = result[4]
+    assert task_archived
+
+    cursor = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            task_id=tasks_catalog_diff.added[0].id
+        )
+    )
+    result = cursor.first()
+    assert result is not None
+    assert result[2] == FakeUserConfig.ID
+
+
 @pytest.mark.anyio
 async def test_update_tasks_with_no_existing_tasks_and_no_users(
         map_models_to_orm: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(TaskModel))
@@ -257,9 +364,10 @@ async def test_update_tasks_with_no_existing_tasks_and_no_users(
     assert result is None
 
     tasks: List[TaskModel] = [TaskModel(**FakeTaskConfig().to_dict(to_lower=True))]
-    updated_tasks: List[TaskModel] = await update_tasks(tasks=tasks)
-    assert len(updated_tasks) == 1
-    task: TaskModel = updated_tasks[0]
+    tasks_catalog_diff: TasksCatalogDiff = await update_tasks(tasks=tasks, uow=update_unit_of_work)
+    assert len(tasks_catalog_diff.actual) == 1
+    assert len(tasks_catalog_diff.added) == 1
+    task: TaskModel = tasks_catalog_diff.actual[0]
     assert task.id == FakeTaskConfig.ID
     assert task.description == FakeTaskConfig.DESCRIPTION
     assert task.is_archived is False
@@ -274,17 +382,29 @@ async def test_update_tasks_with_no_existing_tasks_and_no_users(
 
 
 @pytest.mark.anyio
-async def test_get_task_by_association_id_success(create_test_task: None) -> None:
-    task: TaskModel = await get_task_by_association_id(task_association_id=FakeTaskAssociationConfig.ID)
+async def test_get_task_by_association_id_success(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    task: TaskModel = await get_task_by_association_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
 
     assert task.id == FakeTaskConfig.ID
     assert task.description == FakeTaskConfig.DESCRIPTION
 
 
 @pytest.mark.anyio
-async def test_get_task_association_by_id_success(create_test_task: None) -> None:
+async def test_get_task_association_by_id_success(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
     task_association: TaskAssociationModel = await get_task_association_by_id(
-        task_association_id=FakeTaskAssociationConfig.ID
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
     )
 
     assert task_association.id == FakeTaskAssociationConfig.ID
@@ -292,17 +412,58 @@ async def test_get_task_association_by_id_success(create_test_task: None) -> Non
 
 
 @pytest.mark.anyio
-async def test_get_user_by_association_id_success(create_test_task: None) -> None:
-    user: UserModel = await get_user_by_association_id(task_association_id=FakeTaskAssociationConfig.ID)
+async def test_get_user_by_association_id_success(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    user: UserModel = await get_user_by_association_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
 
     assert user.id == FakeUserConfig.ID
     assert user.first_name == FakeUserConfig.FIRST_NAME
 
 
+@pytest.mark.anyio
+async def test_repeated_reads_within_update_use_identity_map(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    task_association: TaskAssociationModel = await get_task_association_by_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
+    task: TaskModel = await get_task_by_association_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
+    user: UserModel = await get_user_by_association_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
+
+    assert task.id == FakeTaskConfig.ID
+    assert user.id == FakeUserConfig.ID
+    assert update_unit_of_work.identity_map.get(TaskAssociationModel, FakeTaskAssociationConfig.ID) is task_association
+    assert update_unit_of_work.identity_map.get(TaskModel, FakeTaskConfig.ID) is task
+    assert update_unit_of_work.identity_map.get(UserModel, FakeUserConfig.ID) is user
+
+    await set_task_competed_for_user(task_association_id=FakeTaskAssociationConfig.ID, uow=update_unit_of_work)
+    completed_task_association: TaskAssociationModel = await get_task_association_by_id(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        uow=update_unit_of_work
+    )
+    assert completed_task_association.task_completed
+
+
 @pytest.mark.anyio
 async def test_set_task_competed_for_user_success(
         create_test_task: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(
@@ -317,10 +478,143 @@ async def test_set_task_competed_for_user_success(
     task_completed: bool = result[3]
     assert not task_completed
 
-    await set_task_competed_for_user(task_association_id=FakeTaskAssociationConfig.ID)
+    await set_task_competed_for_user(task_association_id=FakeTaskAssociationConfig.ID, uow=update_unit_of_work)
 
     cursor = await async_connection.execute(select(TaskAssociationModel).filter_by(id=FakeTaskAssociationConfig.ID))
     result = cursor.first()
     assert result is not None
     task_completed = result[3]
     assert task_completed
+
+
+@pytest.mark.anyio
+async def test_get_confirmation_context_success(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    confirmation_context: ConfirmationContext = await get_confirmation_context(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        admin_id=FakeUserConfig.ID,
+        uow=update_unit_of_work
+    )
+
+    assert confirmation_context.task_association.id == FakeTaskAssociationConfig.ID
+    assert confirmation_context.task.description == FakeTaskConfig.DESCRIPTION
+    assert confirmation_context.user.first_name == FakeUserConfig.FIRST_NAME
+    assert confirmation_context.admin.id == FakeUserConfig.ID
+
+
+@pytest.mark.anyio
+async def test_get_confirmation_context_fail_admin_does_not_exist(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    with pytest.raises(AdminNotFoundError):
+        await get_confirmation_context(
+            task_association_id=FakeTaskAssociationConfig.ID,
+            admin_id=FakeUserConfig.ID + 1,
+            uow=update_unit_of_work
+        )
+
+
+@pytest.mark.anyio
+async def test_get_confirmation_context_fail_task_association_does_not_exist(
+        create_test_task: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    with pytest.raises(TaskAssociationNotFoundError):
+        await get_confirmation_context(
+            task_association_id=FakeTaskAssociationConfig.ID + 1,
+            admin_id=FakeUserConfig.ID,
+            uow=update_unit_of_work
+        )
+
+
+@pytest.mark.anyio
+async def test_confirm_task_completeness_success(
+        create_test_task: None,
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    confirmation_context: Optional[ConfirmationContext] = await confirm_task_completeness(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        admin_id=FakeUserConfig.ID,
+        uow=update_unit_of_work
+    )
+
+    assert confirmation_context is not None
+    assert confirmation_context.task.description == FakeTaskConfig.DESCRIPTION
+    assert confirmation_context.task_association.task_completed
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result is not None
+    task_completed: bool = result[3]
+    assert task_completed
+
+    confirmation_context = await confirm_task_completeness(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        admin_id=FakeUserConfig.ID,
+        uow=update_unit_of_work
+    )
+
+    assert confirmation_context is None
+
+
+@pytest.mark.anyio
+async def test_confirm_task_completeness_runs_in_one_transaction(create_test_task: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    statements: List[str] = []
+    commits: List[Any] = []
+    event.listen(engine.sync_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    event.listen(engine.sync_engine, 'commit', lambda *args: commits.append(args))
+
+    async with SQLAlchemyUpdateUnitOfWork(engine=engine) as uow:
+        confirmation_context: Optional[ConfirmationContext] = await confirm_task_completeness(
+            task_association_id=FakeTaskAssociationConfig.ID,
+            admin_id=FakeUserConfig.ID,
+            uow=uow
+        )
+
+    assert confirmation_context is not None
+    assert confirmation_context.task_association.task_completed
+    assert [statement.split()[0] for statement in statements] == ['SELECT', 'UPDATE']
+    assert len(commits) == 1
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_confirm_task_completeness_fail_admin_does_not_exist(
+        create_test_task: None,
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    with pytest.raises(AdminNotFoundError):
+        await confirm_task_completeness(
+            task_association_id=FakeTaskAssociationConfig.ID,
+            admin_id=FakeUserConfig.ID + 1,
+            uow=update_unit_of_work
+        )
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result is not None
+    task_completed: bool = result[3]
+    assert not task_completed
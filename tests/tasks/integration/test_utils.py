@@ -0,0 +1,82 @@
+import pytest
+from aiogram.types import Message
+from typing import Dict
+
+from src.tasks.domain.models import TaskModel
+from src.tasks.entrypoints.utils import send_task_on_confirmation
+from src.units_of_work import UpdateUnitOfWork
+from src.users.constants import AdminsIds
+from src.users.exceptions import UserNotFoundError
+from tests.config import FakeTaskConfig, FakeTaskAssociationConfig, FakeMessageConfig
+from tests.tasks.fake_objects import FakeBot
+
+
+@pytest.mark.anyio
+async def test_send_task_on_confirmation_copies_message_to_all_admins(
+        create_test_user: None,
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    bot: FakeBot = FakeBot()
+    failures: Dict[int, Exception] = await send_task_on_confirmation(
+        message=message,
+        bot=bot,
+        task_association_id=FakeTaskAssociationConfig.ID,
+        task=TaskModel(**FakeTaskConfig().to_dict(to_lower=True)),
+        uow=update_unit_of_work
+    )
+
+    assert not failures
+    assert {copied_message['chat_id'] for copied_message in bot.copied_messages} == set(AdminsIds().tuple())
+    for copied_message in bot.copied_messages:
+        assert copied_message['message_id'] == FakeMessageConfig.MESSAGE_ID
+        assert FakeTaskConfig.DESCRIPTION in copied_message['caption']
+        assert copied_message['reply_markup'] is bot.copied_messages[0]['reply_markup']
+
+    assert [deleted_message['message_id'] for deleted_message in bot.deleted_messages] == [
+        FakeMessageConfig.MESSAGE_ID
+    ]
+
+
+@pytest.mark.anyio
+async def test_send_task_on_confirmation_collects_failures(
+        create_test_user: None,
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    failing_admin_id: int = AdminsIds().tuple()[0]
+    bot: FakeBot = FakeBot(failing_chats_ids={failing_admin_id})
+    failures: Dict[int, Exception] = await send_task_on_confirmation(
+        message=message,
+        bot=bot,
+        task_association_id=FakeTaskAssociationConfig.ID,
+        task=TaskModel(**FakeTaskConfig().to_dict(to_lower=True)),
+        uow=update_unit_of_work
+    )
+
+    assert set(failures) == {failing_admin_id}
+    assert len(bot.copied_messages) == len(AdminsIds().tuple()) - 1
+
+
+@pytest.mark.anyio
+async def test_send_task_on_confirmation_deletes_message_after_error(
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    bot: FakeBot = FakeBot()
+    with pytest.raises(UserNotFoundError):
+        await send_task_on_confirmation(
+            message=message,
+            bot=bot,
+            task_association_id=FakeTaskAssociationConfig.ID,
+            task=TaskModel(**FakeTaskConfig().to_dict(to_lower=True)),
+            uow=update_unit_of_work
+        )
+
+    assert not bot.copied_messages
+    assert [deleted_message['message_id'] for deleted_message in bot.deleted_messages] == [
+        FakeMessageConfig.MESSAGE_ID
+    ]
@@ -1,8 +1,7 @@
 import pytest
 from typing import List
 
-from src.tasks.domain.models import TaskModel
-from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme
+from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme, UserActiveTaskScheme, ActualTaskScheme
 from src.tasks.interfaces import TasksUnitOfWork, TasksRepository, TasksAssociationsRepository
 from src.tasks.entrypoints.views import TasksViews
 from tests.config import FakeTaskConfig, FakeTaskAssociationConfig
@@ -29,7 +28,7 @@ async def test_tasks_views_get_all_tasks_with_existing_archived_tasks() -> None:
     )
 
     tasks_views: TasksViews = TasksViews(uow=tasks_unit_of_work)
-    tasks: List[TaskModel] = await tasks_views.get_all_tasks()
+    tasks: List[ActualTaskScheme] = await tasks_views.get_all_tasks()
     assert len(tasks) == 0
 
 
@@ -46,7 +45,7 @@ async def test_tasks_views_get_all_tasks_without_existing_tasks() -> None:
     )
 
     tasks_views: TasksViews = TasksViews(uow=tasks_unit_of_work)
-    tasks: List[TaskModel] = await tasks_views.get_all_tasks()
+    tasks: List[ActualTaskScheme] = await tasks_views.get_all_tasks()
     assert len(tasks) == 0
 
 
@@ -63,12 +62,12 @@ async def test_tasks_views_get_all_tasks_with_existing_non_archived_tasks() -> N
     )
 
     tasks_views: TasksViews = TasksViews(uow=tasks_unit_of_work)
-    tasks: List[TaskModel] = await tasks_views.get_all_tasks()
+    tasks: List[ActualTaskScheme] = await tasks_views.get_all_tasks()
     assert len(tasks) == 1
 
-    task: TaskModel = tasks[0]
+    task: ActualTaskScheme = tasks[0]
     assert task.id == FakeTaskConfig.ID
-    assert not task.is_archived
+    assert task.description == FakeTaskConfig.DESCRIPTION
 
 
 @pytest.mark.anyio
@@ -136,3 +135,50 @@ async def test_tasks_views_get_user_tasks_statistics_with_existing_non_archived_
     task_statistics: UserTaskStatisticsResponseScheme = user_tasks_statistics[0]
     assert task_statistics.description == FakeTaskConfig.DESCRIPTION
     assert not task_statistics.is_completed
+
+
+@pytest.mark.anyio
+async def test_tasks_views_get_user_active_tasks_with_existing_active_tasks() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance(with_tasks_associations=True)
+    )
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    tasks_views: TasksViews = TasksViews(uow=tasks_unit_of_work)
+    user_active_tasks: List[UserActiveTaskScheme] = await tasks_views.get_user_active_tasks(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_active_tasks) == 1
+
+    active_task: UserActiveTaskScheme = user_active_tasks[0]
+    assert active_task.task_association_id == FakeTaskAssociationConfig.ID
+    assert active_task.description == FakeTaskConfig.DESCRIPTION
+
+
+@pytest.mark.anyio
+async def test_tasks_views_get_user_active_tasks_with_existing_completed_tasks() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance(with_tasks_associations=True)
+    )
+
+    assert isinstance(tasks_associations_repository, FakeTasksAssociationsRepository)
+    tasks_associations_repository.tasks_associations[FakeTaskAssociationConfig.ID].task_completed = True
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    tasks_views: TasksViews = TasksViews(uow=tasks_unit_of_work)
+    user_active_tasks: List[UserActiveTaskScheme] = await tasks_views.get_user_active_tasks(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_active_tasks) == 0
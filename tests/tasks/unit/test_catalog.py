@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from typing import List
+
+from src.tasks.domain.models import TaskModel, TasksCatalogSnapshot
+from src.tasks.interfaces.repositories import TasksRepository
+from src.tasks.interfaces.units_of_work import TasksUnitOfWork
+from src.tasks.service_layer.catalog import TasksCatalog
+from src.tasks.service_layer.service import TasksService
+from tests.config import FakeTaskConfig, FakeTaskAssociationConfig
+from tests.tasks.fake_objects import FakeTasksUnitOfWork, SlowFakeTasksRepository
+from tests.tasks.utils import (
+    create_fake_tasks_associations_repository_instance,
+    create_fake_tasks_repository_instance
+)
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_load_builds_snapshot() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    await tasks_repository.add(model=TaskModel(description='archived_task', is_archived=True, id=FakeTaskConfig.ID + 1))
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance()
+    )
+
+    tasks_catalog: TasksCatalog = TasksCatalog()
+    assert tasks_catalog.snapshot is None
+
+    snapshot: TasksCatalogSnapshot = await tasks_catalog.get_snapshot(uow=tasks_unit_of_work)
+    assert snapshot.version == 1
+    assert set(snapshot.tasks) == {FakeTaskConfig.ID, FakeTaskConfig.ID + 1}
+    assert [task.id for task in snapshot.actual] == [FakeTaskConfig.ID]
+    assert await tasks_catalog.get_snapshot(uow=tasks_unit_of_work) is snapshot
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_reload_makes_previous_snapshot_stale() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance()
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance()
+    )
+
+    tasks_catalog: TasksCatalog = TasksCatalog()
+    snapshot: TasksCatalogSnapshot = await tasks_catalog.load(uow=tasks_unit_of_work)
+    assert not tasks_catalog.is_stale(snapshot=snapshot)
+    assert not snapshot.actual
+
+    await tasks_repository.add(model=TaskModel(**FakeTaskConfig().to_dict(to_lower=True)))
+    new_snapshot: TasksCatalogSnapshot = await tasks_catalog.load(uow=tasks_unit_of_work)
+    assert tasks_catalog.is_stale(snapshot=snapshot)
+    assert new_snapshot.version == snapshot.version + 1
+    assert [task.id for task in new_snapshot.actual] == [FakeTaskConfig.ID]
+
+
+@pytest.mark.anyio
+async def test_tasks_service_get_task_by_association_id_reloads_catalog_without_task() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance()
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance(
+            with_tasks_associations=True
+        )
+    )
+
+    tasks_catalog: TasksCatalog = TasksCatalog()
+    await tasks_catalog.load(uow=tasks_unit_of_work)
+    await tasks_repository.add(model=TaskModel(**FakeTaskConfig().to_dict(to_lower=True)))
+
+    tasks_service: TasksService = TasksService(uow=tasks_unit_of_work, catalog=tasks_catalog)
+    task: TaskModel = await tasks_service.get_task_by_association_id(
+        task_association_id=FakeTaskAssociationConfig.ID
+    )
+    assert task.id == FakeTaskConfig.ID
+    assert task.description == FakeTaskConfig.DESCRIPTION
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_shares_concurrent_initial_loading() -> None:
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=await create_fake_tasks_repository_instance(with_task=True),
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance()
+    )
+
+    tasks_catalog: TasksCatalog = TasksCatalog()
+    snapshots: List[TasksCatalogSnapshot] = await asyncio.gather(
+        *(tasks_catalog.get_snapshot(uow=tasks_unit_of_work) for _ in range(3))
+    )
+
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0].version == 1
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_keeps_snapshot_of_latest_started_loading() -> None:
+    old_tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=SlowFakeTasksRepository(),
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance()
+    )
+    new_tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=await create_fake_tasks_repository_instance(with_task=True),
+        tasks_associations_repository=await create_fake_tasks_associations_repository_instance()
+    )
+
+    tasks_catalog: TasksCatalog = TasksCatalog()
+    old_loading: asyncio.Task = asyncio.create_task(tasks_catalog.load(uow=old_tasks_unit_of_work))
+    await asyncio.sleep(0)
+    new_snapshot: TasksCatalogSnapshot = await tasks_catalog.load(uow=new_tasks_unit_of_work)
+    await old_loading
+
+    assert tasks_catalog.snapshot is new_snapshot
+    assert [task.id for task in new_snapshot.actual] == [FakeTaskConfig.ID]
+
+    # Loading, started before clearing, could read tasks, which were changed before clearing:
+    old_loading = asyncio.create_task(tasks_catalog.load(uow=old_tasks_unit_of_work))
+    await asyncio.sleep(0)
+    tasks_catalog.clear()
+    await old_loading
+    assert tasks_catalog.snapshot is None
@@ -0,0 +1,92 @@
+import pytest
+from types import ModuleType
+from typing import AsyncGenerator, Dict, List, Tuple, Any
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.database.connection import DATABASE_URL
+from src.tasks.adapters.orm import TASKS_ASSOCIATIONS_ACTIVE_PREDICATE
+from src.tasks.adapters.read_models import SQLAlchemyTasksReadModel
+from src.tasks.adapters.repositories import SQLAlchemyTasksAssociationsRepository
+from tests.config import FakeTaskAssociationConfig
+from tests.utils import capture_statements, drop_test_db, explain_query_plan, get_migration, run_migrations
+
+
+@pytest.fixture
+async def create_test_db() -> AsyncGenerator[None, None]:
+    """
+    Indexes are checked on schema, which is created by migrations, instead of ORM tables.
+    """
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as connection:
+        await connection.run_sync(run_migrations)
+
+    await engine.dispose()
+    yield
+    drop_test_db()
+
+
+@pytest.mark.anyio
+async def test_get_tasks_associations_by_user_id_uses_user_id_task_id_index(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    statements: List[Tuple[str, Any]]
+    async with capture_statements(connection=async_connection) as statements:
+        await SQLAlchemyTasksAssociationsRepository(session=session).get_tasks_associations_by_user_id(
+            user_id=FakeTaskAssociationConfig.USER_ID
+        )
+
+    assert len(statements) == 1
+    assert 'ix_tasks_associations_user_id_task_id' in await explain_query_plan(async_connection, *statements[0])
+
+
+@pytest.mark.anyio
+async def test_get_task_associations_by_task_id_uses_task_id_index(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    statements: List[Tuple[str, Any]]
+    async with capture_statements(connection=async_connection) as statements:
+        await SQLAlchemyTasksAssociationsRepository(session=session).get_task_associations_by_task_id(
+            task_id=FakeTaskAssociationConfig.TASK_ID
+        )
+
+    assert len(statements) == 1
+    assert 'ix_tasks_associations_task_id' in await explain_query_plan(async_connection, *statements[0])
+
+
+@pytest.mark.anyio
+async def test_get_user_active_tasks_uses_active_partial_index(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    statements: List[Tuple[str, Any]]
+    async with capture_statements(connection=async_connection) as statements:
+        await SQLAlchemyTasksReadModel(session=session).get_user_active_tasks(
+            user_id=FakeTaskAssociationConfig.USER_ID
+        )
+
+    assert len(statements) == 1
+    assert 'ix_tasks_associations_active_user_id' in await explain_query_plan(async_connection, *statements[0])
+
+
+def test_active_partial_index_predicate_of_orm_matches_migration() -> None:
+    migration: ModuleType = get_migration(revision='3c9e1b7d5a24')
+    compile_kwargs: Dict[str, Any] = {'literal_binds': True, 'include_table': False}
+    assert str(
+        TASKS_ASSOCIATIONS_ACTIVE_PREDICATE.compile(dialect=postgresql.dialect(), compile_kwargs=compile_kwargs)
+    ) == migration.POSTGRESQL_ACTIVE_PREDICATE
+    assert str(
+        TASKS_ASSOCIATIONS_ACTIVE_PREDICATE.compile(dialect=sqlite.dialect(), compile_kwargs=compile_kwargs)
+    ) == migration.SQLITE_ACTIVE_PREDICATE
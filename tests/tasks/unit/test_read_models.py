@@ -0,0 +1,140 @@
+import pytest
+from typing import List, Tuple
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.tasks.domain.models import TaskAssociationModel
+from src.tasks.adapters.read_models import SQLAlchemyTasksReadModel
+from tests.config import FakeTaskAssociationConfig, FakeTaskConfig
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_tasks_statistics_with_existing_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_tasks_statistics: List[Tuple[str, bool]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_tasks_statistics(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert user_tasks_statistics == [(FakeTaskConfig.DESCRIPTION, FakeTaskAssociationConfig.TASK_COMPLETED)]
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_tasks_statistics_with_existing_archived_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        update(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        ).values(
+            task_archived=True
+        )
+    )
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_tasks_statistics: List[Tuple[str, bool]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_tasks_statistics(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_tasks_statistics) == 0
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_tasks_statistics_without_existing_tasks(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_tasks_statistics: List[Tuple[str, bool]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_tasks_statistics(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_tasks_statistics) == 0
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_active_tasks_with_existing_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_active_tasks: List[Tuple[int, str]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_active_tasks(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert user_active_tasks == [(FakeTaskAssociationConfig.ID, FakeTaskConfig.DESCRIPTION)]
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_active_tasks_with_existing_completed_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        update(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        ).values(
+            task_completed=True
+        )
+    )
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_active_tasks: List[Tuple[int, str]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_active_tasks(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_active_tasks) == 0
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_read_model_get_user_active_tasks_with_existing_archived_tasks(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        update(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        ).values(
+            task_archived=True
+        )
+    )
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_active_tasks: List[Tuple[int, str]] = await SQLAlchemyTasksReadModel(
+        session=session
+    ).get_user_active_tasks(
+        user_id=FakeTaskAssociationConfig.USER_ID
+    )
+
+    assert len(user_active_tasks) == 0
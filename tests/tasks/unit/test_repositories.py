@@ -96,6 +96,29 @@ async def test_sqlalchemy_tasks_repository_empty_list(
     assert len(tasks_list) == 0
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_repository_stream_and_list_page(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    tasks_repository: SQLAlchemyTasksRepository = SQLAlchemyTasksRepository(session=session)
+    tasks: List[TaskModel] = await tasks_repository.add_many(
+        models=[TaskModel(id=0, description=f'{FakeTaskConfig.DESCRIPTION}_{index}') for index in range(3)]
+    )
+    tasks_ids: List[int] = sorted(task.id for task in tasks)
+
+    assert [task.id async for task in tasks_repository.stream()] == tasks_ids
+
+    first_page: List[TaskModel] = await tasks_repository.list_page(limit=2)
+    assert [task.id for task in first_page] == tasks_ids[:2]
+
+    second_page: List[TaskModel] = await tasks_repository.list_page(after_id=first_page[-1].id, limit=2)
+    assert [task.id for task in second_page] == tasks_ids[2:]
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_repository_delete_existing_task(
         create_test_task: None,
@@ -150,6 +173,28 @@ async def test_sqlalchemy_tasks_repository_add_task_success(
     assert result
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_repository_add_many_tasks_success(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    descriptions: List[str] = [FakeTaskConfig.DESCRIPTION, 'NewTaskDescription']
+    tasks: List[TaskModel] = await SQLAlchemyTasksRepository(session=session).add_many(
+        models=[TaskModel(description=description) for description in descriptions]
+    )
+
+    assert [task.description for task in tasks] == descriptions
+    for task in tasks:
+        assert task.id
+
+    cursor: CursorResult = await async_connection.execute(select(TaskModel))
+    result: Sequence[Row] = cursor.all()
+    assert len(result) == 2
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_repository_add_task_fail_already_exists(
         create_test_task: None,
@@ -208,6 +253,65 @@ async def test_sqlalchemy_tasks_repository_update_non_existing_task(
         await SQLAlchemyTasksRepository(session=session).update(id=FakeTaskConfig.ID, model=task)
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_repository_archive_tasks_except_with_not_provided_task(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    archived_tasks_ids: List[int] = await SQLAlchemyTasksRepository(session=session).archive_tasks_except(
+        descriptions=set()
+    )
+
+    assert archived_tasks_ids == [FakeTaskConfig.ID]
+
+    cursor: CursorResult = await async_connection.execute(select(TaskModel).filter_by(id=FakeTaskConfig.ID))
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[2] is True
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_repository_archive_tasks_except_with_provided_task(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    archived_tasks_ids: List[int] = await SQLAlchemyTasksRepository(session=session).archive_tasks_except(
+        descriptions={FakeTaskConfig.DESCRIPTION}
+    )
+
+    assert len(archived_tasks_ids) == 0
+
+    cursor: CursorResult = await async_connection.execute(select(TaskModel).filter_by(id=FakeTaskConfig.ID))
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[2] is False
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_repository_set_archived_status_by_ids(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    await SQLAlchemyTasksRepository(session=session).set_archived_status_by_ids(
+        ids=[FakeTaskConfig.ID],
+        is_archived=True
+    )
+
+    cursor: CursorResult = await async_connection.execute(select(TaskModel).filter_by(id=FakeTaskConfig.ID))
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[2] is True
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_associations_repository_get_success(
         create_test_task: None,
@@ -325,6 +429,33 @@ async def test_sqlalchemy_tasks_associations_repository_get_tasks_associations_b
     assert len(tasks_associations) == 0
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_set_archived_status_by_task_ids(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).set_archived_status_by_task_ids(
+        task_ids=[FakeTaskAssociationConfig.TASK_ID],
+        task_archived=True
+    )
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[4] is True
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_associations_repository_list(
         create_test_task: None,
@@ -354,6 +485,23 @@ async def test_sqlalchemy_tasks_associations_repository_empty_list(
     assert len(tasks_list) == 0
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_stream_and_list_page(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyTasksAssociationsRepository = SQLAlchemyTasksAssociationsRepository(session=session)
+
+    assert [task_association.id async for task_association in repository.stream()] == [FakeTaskAssociationConfig.ID]
+
+    page: List[TaskAssociationModel] = await repository.list_page(limit=1)
+    assert [task_association.id for task_association in page] == [FakeTaskAssociationConfig.ID]
+    assert await repository.list_page(after_id=FakeTaskAssociationConfig.ID, limit=1) == []
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_associations_repository_delete_existing_task_association(
         create_test_task: None,
@@ -414,6 +562,60 @@ async def test_sqlalchemy_tasks_associations_repository_add_task_association_suc
     assert result
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_add_many_task_associations_success(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    cursor: CursorResult = await async_connection.execute(select(TaskAssociationModel))
+    result: Sequence[Row] = cursor.all()
+    assert len(result) == 0
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    task_associations: List[TaskAssociationModel] = await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).add_many(
+        models=[
+            TaskAssociationModel(user_id=FakeTaskAssociationConfig.USER_ID, task_id=task_id)
+            for task_id in range(1, 4)
+        ]
+    )
+
+    assert len(task_associations) == 3
+    assert {task_association.task_id for task_association in task_associations} == {1, 2, 3}
+    for task_association in task_associations:
+        assert task_association.id
+        assert not task_association.task_completed
+        assert not task_association.task_archived
+
+    cursor = await async_connection.execute(select(TaskAssociationModel))
+    result = cursor.all()
+    assert len(result) == 3
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_add_many_without_task_associations(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    task_associations: List[TaskAssociationModel] = await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).add_many(
+        models=[]
+    )
+
+    assert len(task_associations) == 0
+
+    cursor: CursorResult = await async_connection.execute(select(TaskAssociationModel))
+    result: Sequence[Row] = cursor.all()
+    assert len(result) == 0
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_tasks_associations_repository_update_existing_task_association(
         create_test_task: None,
@@ -474,3 +676,81 @@ async def test_sqlalchemy_tasks_associations_repository_update_non_existing_task
             id=FakeTaskAssociationConfig.ID,
             model=task_association
         )
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_set_completed_status_if_active_only_once(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    tasks_associations_repository: SQLAlchemyTasksAssociationsRepository = SQLAlchemyTasksAssociationsRepository(
+        session=session
+    )
+
+    task_association: Optional[TaskAssociationModel] = (
+        await tasks_associations_repository.set_completed_status_if_active(id=FakeTaskAssociationConfig.ID)
+    )
+    assert task_association is not None
+    assert task_association.id == FakeTaskAssociationConfig.ID
+    assert task_association.user_id == FakeTaskAssociationConfig.USER_ID
+    assert task_association.task_completed
+    assert await tasks_associations_repository.set_completed_status_if_active(id=FakeTaskAssociationConfig.ID) is None
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[3] is True
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_set_completed_status_if_active_with_archived_task(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    tasks_associations_repository: SQLAlchemyTasksAssociationsRepository = SQLAlchemyTasksAssociationsRepository(
+        session=session
+    )
+
+    await tasks_associations_repository.set_archived_status_by_task_ids(
+        task_ids=[FakeTaskAssociationConfig.TASK_ID],
+        task_archived=True
+    )
+    assert await tasks_associations_repository.set_completed_status_if_active(id=FakeTaskAssociationConfig.ID) is None
+
+    cursor: CursorResult = await async_connection.execute(
+        select(
+            TaskAssociationModel
+        ).filter_by(
+            id=FakeTaskAssociationConfig.ID
+        )
+    )
+    result: Optional[Row] = cursor.first()
+    assert result
+    assert result[3] is False
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_tasks_associations_repository_set_completed_status_if_active_fail_does_not_exist(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    assert await SQLAlchemyTasksAssociationsRepository(
+        session=session
+    ).set_completed_status_if_active(
+        id=FakeTaskAssociationConfig.ID
+    ) is None
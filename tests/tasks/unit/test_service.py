@@ -5,8 +5,8 @@ from src.tasks.constants import ErrorDetails
 from src.tasks.exceptions import TaskNotFoundError, TaskAssociationNotFoundError
 from src.tasks.interfaces.repositories import TasksRepository, TasksAssociationsRepository
 from src.tasks.interfaces.units_of_work import TasksUnitOfWork
-from src.tasks.domain.models import TaskModel, TaskAssociationModel
-from src.tasks.service_layer.service import TasksService
+from src.tasks.domain.models import TaskModel, TaskAssociationModel, TasksCatalogDiff
+from src.tasks.service_layer.service import TasksService, TasksCatalogSync
 from src.users.domain.models import UserModel
 from tests.tasks.fake_objects import FakeTasksUnitOfWork, FakeTasksRepository, FakeTasksAssociationsRepository
 from tests.config import FakeTaskConfig, FakeTaskAssociationConfig, FakeUserConfig
@@ -559,3 +559,107 @@ async def test_tasks_service_set_task_association_completed_status_fail_task_ass
         await tasks_service.set_task_association_completed_status(
             task_association_id=FakeTaskAssociationConfig.ID
         )
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_sync_with_new_task() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance()
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance()
+    )
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    task: TaskModel = TaskModel(**FakeTaskConfig().to_dict(to_lower=True))
+    tasks_catalog_diff: TasksCatalogDiff = await TasksCatalogSync(uow=tasks_unit_of_work).sync(
+        tasks=[task, task],
+        users_ids=[FakeUserConfig.ID]
+    )
+
+    assert tasks_catalog_diff.added == [task]
+    assert tasks_catalog_diff.actual == [task]
+    assert not (tasks_catalog_diff.archived or tasks_catalog_diff.reopened or tasks_catalog_diff.unchanged)
+    assert len(await tasks_repository.list()) == 1
+    assert len(await tasks_associations_repository.list()) == 1
+    assert isinstance(tasks_unit_of_work, FakeTasksUnitOfWork)
+    assert tasks_unit_of_work.committed
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_sync_with_existing_task() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance(with_tasks_associations=True)
+    )
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    task: TaskModel = TaskModel(**FakeTaskConfig().to_dict(to_lower=True))
+    tasks_catalog_diff: TasksCatalogDiff = await TasksCatalogSync(uow=tasks_unit_of_work).sync(
+        tasks=[task],
+        users_ids=[]
+    )
+
+    assert tasks_catalog_diff.unchanged == [task]
+    assert tasks_catalog_diff.actual == [task]
+    assert not (tasks_catalog_diff.added or tasks_catalog_diff.archived or tasks_catalog_diff.reopened)
+    assert not (await tasks_repository.list())[0].is_archived
+    assert not (await tasks_associations_repository.list())[0].task_archived
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_sync_archives_not_provided_task() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance(with_tasks_associations=True)
+    )
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    tasks_catalog_diff: TasksCatalogDiff = await TasksCatalogSync(uow=tasks_unit_of_work).sync(tasks=[], users_ids=[])
+
+    assert len(tasks_catalog_diff.archived) == 1
+    assert tasks_catalog_diff.archived[0].id == FakeTaskConfig.ID
+    assert not (tasks_catalog_diff.added or tasks_catalog_diff.reopened or tasks_catalog_diff.unchanged)
+    assert not tasks_catalog_diff.actual
+    assert (await tasks_repository.list())[0].is_archived
+    assert (await tasks_associations_repository.list())[0].task_archived
+
+
+@pytest.mark.anyio
+async def test_tasks_catalog_sync_reopens_archived_task() -> None:
+    tasks_repository: TasksRepository = await create_fake_tasks_repository_instance(with_task=True)
+    tasks_associations_repository: TasksAssociationsRepository = (
+        await create_fake_tasks_associations_repository_instance(with_tasks_associations=True)
+    )
+
+    tasks_unit_of_work: TasksUnitOfWork = FakeTasksUnitOfWork(
+        tasks_repository=tasks_repository,
+        tasks_associations_repository=tasks_associations_repository
+    )
+
+    assert isinstance(tasks_repository, FakeTasksRepository)
+    tasks_repository.tasks[FakeTaskConfig.ID].is_archived = True
+    assert isinstance(tasks_associations_repository, FakeTasksAssociationsRepository)
+    tasks_associations_repository.tasks_associations[FakeTaskAssociationConfig.ID].task_archived = True
+
+    task: TaskModel = TaskModel(**FakeTaskConfig().to_dict(to_lower=True))
+    tasks_catalog_diff: TasksCatalogDiff = await TasksCatalogSync(uow=tasks_unit_of_work).sync(
+        tasks=[task],
+        users_ids=[]
+    )
+
+    assert tasks_catalog_diff.reopened == [task]
+    assert tasks_catalog_diff.actual == [task]
+    assert not (tasks_catalog_diff.added or tasks_catalog_diff.archived or tasks_catalog_diff.unchanged)
+    assert not (await tasks_repository.list())[0].is_archived
+    assert not (await tasks_associations_repository.list())[0].task_archived
@@ -0,0 +1,262 @@
+import asyncio
+import pytest
+from typing import Any, Dict, List, Optional, Tuple
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import AnswerCallbackQuery, DeleteMessage, GetMe, SendMessage, TelegramMethod
+from aiogram.types import TelegramObject, Message
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.database.connection import DATABASE_URL
+from src.middlewares import RateLimiterMiddleware, UnitOfWorkMiddleware, background_requests
+from src.tasks.domain.models import ConfirmationContext
+from src.tasks.entrypoints.dependencies import get_user_tasks_statistics, confirm_task_completeness
+from src.tasks.entrypoints.schemas import UserTaskStatisticsResponseScheme
+from src.units_of_work import UpdateUnitOfWork, SQLAlchemyUpdateUnitOfWork
+from src.users.domain.models import UserModel
+from src.users.adapters.repositories import users_cache
+from src.users.config import users_config
+from src.users.entrypoints.dependencies import get_user_by_id, check_if_user_is_admin
+from tests.config import FakeUserConfig, FakeTaskAssociationConfig, FakeMessageConfig
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_middleware_holds_connection_only_during_transactions(
+        create_test_task: None,
+        message: Message
+) -> None:
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    checkouts: List[Any] = []
+    checkins: List[Any] = []
+    event.listen(engine.sync_engine, 'checkout', lambda *args: checkouts.append(args))
+    event.listen(engine.sync_engine, 'checkin', lambda *args: checkins.append(args))
+
+    async def handler(event: TelegramObject, data: Dict[str, Any]) -> Optional[ConfirmationContext]:
+        uow: UpdateUnitOfWork = data['uow']
+        user: UserModel = await get_user_by_id(id=FakeUserConfig.ID, uow=uow)
+        assert user.id == FakeUserConfig.ID
+        assert len(checkouts) == len(checkins)
+
+        assert isinstance(event, Message)
+        tasks_statistics: List[UserTaskStatisticsResponseScheme] = await get_user_tasks_statistics(
+            message=event,
+            uow=uow
+        )
+        assert len(tasks_statistics) == 1
+        assert len(checkouts) == len(checkins)
+
+        return await confirm_task_completeness(
+            task_association_id=FakeTaskAssociationConfig.ID,
+            admin_id=FakeUserConfig.ID,
+            uow=uow
+        )
+
+    middleware: UnitOfWorkMiddleware = UnitOfWorkMiddleware(
+        uow_factory=lambda user_id: SQLAlchemyUpdateUnitOfWork(user_id, engine=engine)
+    )
+    confirmation_context: Optional[ConfirmationContext] = await middleware(handler, message, {})
+    assert confirmation_context is not None
+    assert checkouts
+    assert len(checkouts) == len(checkins)
+
+    # Updates, which do not use database, do not check out connections:
+    checkouts.clear()
+
+    async def database_less_handler(event: TelegramObject, data: Dict[str, Any]) -> None:
+        return None
+
+    await middleware(database_less_handler, message, {})
+    assert not checkouts
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_middleware_does_not_check_out_connection_on_users_cache_hit(
+        create_test_user: None,
+        message: Message,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    monkeypatch.setattr(users_config, 'USERS_CACHE_ENABLED', True)
+    users_cache.clear()
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    checkouts: List[Any] = []
+    event.listen(engine.sync_engine, 'checkout', lambda *args: checkouts.append(args))
+
+    async def handler(event: TelegramObject, data: Dict[str, Any]) -> bool:
+        assert isinstance(event, Message)
+        await get_user_by_id(id=FakeUserConfig.ID, uow=data['uow'])
+        return await check_if_user_is_admin(message=event, uow=data['uow'])
+
+    middleware: UnitOfWorkMiddleware = UnitOfWorkMiddleware(
+        uow_factory=lambda user_id: SQLAlchemyUpdateUnitOfWork(user_id, engine=engine, replica_session_factory=None)
+    )
+    await middleware(handler, message, {})
+    assert len(checkouts) == 1
+
+    checkouts.clear()
+    await middleware(handler, message, {})
+    assert not checkouts
+
+    users_cache.clear()
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_middleware_commits_are_visible_to_next_updates(
+        create_test_task: None,
+        message: Message
+) -> None:
+
+    async def handler(event: TelegramObject, data: Dict[str, Any]) -> Optional[ConfirmationContext]:
+        return await confirm_task_completeness(
+            task_association_id=FakeTaskAssociationConfig.ID,
+            admin_id=FakeUserConfig.ID,
+            uow=data['uow']
+        )
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    middleware: UnitOfWorkMiddleware = UnitOfWorkMiddleware(
+        uow_factory=lambda user_id: SQLAlchemyUpdateUnitOfWork(user_id, engine=engine)
+    )
+
+    assert await middleware(handler, message, {}) is not None
+    assert await middleware(handler, message, {}) is None
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_paces_requests_to_one_chat() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(global_rate=1000, chat_rate=20, chat_burst=1)
+    bot: Bot = Bot(token='42:TEST')
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        return getattr(method, 'chat_id')
+
+    results: Tuple[Any, Any, Any] = await asyncio.gather(
+        middleware(make_request, bot, SendMessage(chat_id=1, text='first')),
+        middleware(make_request, bot, SendMessage(chat_id=1, text='second')),
+        middleware(make_request, bot, SendMessage(chat_id=2, text='third'))
+    )
+
+    assert list(results) == [1, 1, 2]
+    assert middleware.requests_count == 3
+    assert middleware.queue_depth == 0
+    assert 0.04 <= middleware.total_wait_time < 0.1
+    assert middleware.average_wait_time == middleware.total_wait_time / 3
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_requeues_request_after_retry_after() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(max_retries=1)
+    bot: Bot = Bot(token='42:TEST')
+    calls: List[str] = []
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        calls.append(getattr(method, 'text'))
+        if len(calls) == 1:
+            raise TelegramRetryAfter(method=method, message='Too Many Requests', retry_after=0)
+
+        return True
+
+    assert await middleware(make_request, bot, SendMessage(chat_id=1, text='message')) is True
+    assert calls == ['message', 'message']
+
+    calls.clear()
+    middleware = RateLimiterMiddleware(max_retries=0)
+    with pytest.raises(TelegramRetryAfter):
+        await middleware(make_request, bot, SendMessage(chat_id=1, text='message'))
+
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_paces_background_requests_by_share_of_global_rate() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(
+        global_rate=100,
+        chat_rate=1000,
+        background_rate_share=0.2
+    )
+    bot: Bot = Bot(token='42:TEST')
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        return True
+
+    async def make_background_requests() -> None:
+        background_requests.set(True)
+        for chat_id in range(3):
+            await middleware(make_request, bot, SendMessage(chat_id=chat_id, text='broadcast'))
+
+    # Task runs within copy of context, so requests of test are not marked as background ones:
+    await asyncio.create_task(make_background_requests())
+    assert 0.09 <= middleware.total_wait_time < 0.15
+
+    # Requests outside of background context are not paced by background bucket:
+    await middleware(make_request, bot, SendMessage(chat_id=1, text='answer'))
+    assert middleware.last_wait_time < 0.01
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_limits_only_send_methods() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(global_rate=1, chat_rate=1)
+    bot: Bot = Bot(token='42:TEST')
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        return True
+
+    await middleware(make_request, bot, SendMessage(chat_id=1, text='message'))
+    for _ in range(3):
+        await middleware(make_request, bot, DeleteMessage(chat_id=1, message_id=FakeMessageConfig.MESSAGE_ID))
+        await middleware(make_request, bot, AnswerCallbackQuery(callback_query_id='42'))
+        await middleware(make_request, bot, GetMe())
+
+    # Both global and chat buckets are empty after first message, but other methods do not wait for turn:
+    assert middleware.requests_count == 1
+    assert middleware.total_wait_time < 0.01
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_allows_one_message_to_chat_without_waiting() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(global_rate=1000, chat_rate=20)
+    bot: Bot = Bot(token='42:TEST')
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        return True
+
+    await middleware(make_request, bot, SendMessage(chat_id=1, text='first'))
+    assert middleware.last_wait_time < 0.01
+
+    await middleware(make_request, bot, SendMessage(chat_id=1, text='second'))
+    assert middleware.last_wait_time >= 0.04
+    await bot.session.close()
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_middleware_pauses_global_bucket_after_retry_after() -> None:
+    middleware: RateLimiterMiddleware = RateLimiterMiddleware(global_rate=1000, max_retries=1)
+    bot: Bot = Bot(token='42:TEST')
+    calls: List[str] = []
+
+    async def make_request(bot: Bot, method: TelegramMethod[Any]) -> Any:
+        calls.append(type(method).__name__)
+        if len(calls) == 1:
+            raise TelegramRetryAfter(method=method, message='Too Many Requests', retry_after=1)
+
+        return True
+
+    first_request: asyncio.Task = asyncio.create_task(
+        middleware(make_request, bot, SendMessage(chat_id=1, text='message'))
+    )
+    await asyncio.sleep(0.01)
+
+    # Requests to other chats also wait, till global bucket is paused:
+    assert await middleware(make_request, bot, SendMessage(chat_id=2, text='message')) is True
+    assert middleware.last_wait_time >= 0.9
+    assert await first_request is True
+    await bot.session.close()
@@ -0,0 +1,69 @@
+import pytest
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.read_models import SQLAlchemyConfirmationsReadModel, ConfirmationRow
+from tests.config import FakeTaskAssociationConfig, FakeTaskConfig, FakeUserConfig
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_confirmations_read_model_get_confirmation_row_success(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    confirmation_row: Optional[ConfirmationRow] = await SQLAlchemyConfirmationsReadModel(
+        session=session
+    ).get_confirmation_row(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        admin_id=FakeUserConfig.ID
+    )
+
+    assert confirmation_row is not None
+    task_association, task, user, admin = confirmation_row
+    assert task_association.id == FakeTaskAssociationConfig.ID
+    assert task.description == FakeTaskConfig.DESCRIPTION
+    assert user.id == FakeTaskAssociationConfig.USER_ID
+    assert admin is not None
+    assert admin.id == FakeUserConfig.ID
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_confirmations_read_model_get_confirmation_row_with_not_existing_admin(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    confirmation_row: Optional[ConfirmationRow] = await SQLAlchemyConfirmationsReadModel(
+        session=session
+    ).get_confirmation_row(
+        task_association_id=FakeTaskAssociationConfig.ID,
+        admin_id=FakeUserConfig.ID + 1
+    )
+
+    assert confirmation_row is not None
+    task_association, _, _, admin = confirmation_row
+    assert task_association.id == FakeTaskAssociationConfig.ID
+    assert admin is None
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_confirmations_read_model_get_confirmation_row_with_not_existing_task_association(
+        create_test_task: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    confirmation_row: Optional[ConfirmationRow] = await SQLAlchemyConfirmationsReadModel(
+        session=session
+    ).get_confirmation_row(
+        task_association_id=FakeTaskAssociationConfig.ID + 1,
+        admin_id=FakeUserConfig.ID
+    )
+
+    assert confirmation_row is None
@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from typing import Any, AsyncGenerator, Dict, List
+from aiogram import Bot
+from aiogram.methods import DeleteMessage, SendMessage, TelegramMethod
+from aiohttp import web
+from aiohttp import test_utils
+
+from src.app import dispatcher
+from src.webhook import create_webhook_application
+from tests.config import FakeUserConfig
+from tests.fake_objects import FakeSession
+
+
+WEBHOOK_PATH: str = '/webhook'
+WEBHOOK_SECRET: str = 'secret'
+
+# Update, recorded from Telegram:
+RECORDED_UPDATE: Dict[str, Any] = {
+    'update_id': 1,
+    'message': {
+        'message_id': 1,
+        'date': 1718000000,
+        'chat': {'id': FakeUserConfig.ID, 'type': 'private', 'first_name': FakeUserConfig.FIRST_NAME},
+        'from': {
+            'id': FakeUserConfig.ID,
+            'is_bot': False,
+            'first_name': FakeUserConfig.FIRST_NAME,
+            'username': FakeUserConfig.USERNAME
+        },
+        'text': '/my_stats',
+        'entities': [{'offset': 0, 'length': 9, 'type': 'bot_command'}]
+    }
+}
+
+
+@pytest.fixture
+async def session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+async def client(
+        create_test_user: None,
+        session: FakeSession
+) -> AsyncGenerator[test_utils.TestClient, None]:
+
+    """
+    Client of webhook application, which passes updates to dispatcher of bot with all its routers and middlewares.
+    Dispatcher is started up and shut down together with application.
+    """
+
+    bot: Bot = Bot(token='42:TEST', session=session)
+    application: web.Application = create_webhook_application(
+        dispatcher=dispatcher,
+        bot=bot,
+        path=WEBHOOK_PATH,
+        secret_token=WEBHOOK_SECRET
+    )
+    async with test_utils.TestClient(test_utils.TestServer(application)) as client:
+        yield client
+
+
+async def wait_for_requests(session: FakeSession, count: int) -> List[TelegramMethod[Any]]:
+    for _ in range(100):
+        if len(session.requests) >= count:
+            break
+
+        await asyncio.sleep(0.01)
+
+    return session.requests
+
+
+@pytest.mark.anyio
+async def test_webhook_application_answers_immediately_and_handles_update_in_background(
+        client: test_utils.TestClient,
+        session: FakeSession
+) -> None:
+
+    session.can_answer.clear()
+    response = await client.post(
+        WEBHOOK_PATH,
+        json=RECORDED_UPDATE,
+        headers={'X-Telegram-Bot-Api-Secret-Token': WEBHOOK_SECRET}
+    )
+    assert response.status == 200
+    assert session.requests == []
+
+    session.can_answer.set()
+    requests: List[TelegramMethod[Any]] = await wait_for_requests(session=session, count=2)
+
+    # Command is deleted and statistics of user is sent to user:
+    assert isinstance(requests[0], DeleteMessage)
+    assert requests[0].chat_id == FakeUserConfig.ID
+    assert isinstance(requests[1], SendMessage)
+    assert requests[1].chat_id == FakeUserConfig.ID
+
+
+@pytest.mark.anyio
+async def test_webhook_application_rejects_requests_without_secret_token(
+        client: test_utils.TestClient,
+        session: FakeSession
+) -> None:
+
+    response = await client.post(WEBHOOK_PATH, json=RECORDED_UPDATE)
+    assert response.status == 401
+
+    response = await client.post(
+        WEBHOOK_PATH,
+        json=RECORDED_UPDATE,
+        headers={'X-Telegram-Bot-Api-Secret-Token': 'wrong'}
+    )
+    assert response.status == 401
+
+    await asyncio.sleep(0.01)
+    assert session.requests == []
@@ -1,7 +1,8 @@
-from typing import Dict, Optional, List
+from typing import AsyncIterator, Dict, Optional, List
 
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 from src.users.interfaces.repositories import UsersRepository
+from src.users.interfaces.read_models import UsersReadModel, UserAccountRow
 from src.users.domain.models import UserModel
 from src.core.interfaces import AbstractModel
 
@@ -47,13 +48,62 @@ class FakeUsersRepository(UsersRepository):
     async def list(self) -> List[UserModel]:
         return list(self.users.values())
 
+    async def stream(self) -> AsyncIterator[UserModel]:
+        for id in sorted(self.users):
+            yield self.users[id]
+
+    async def list_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[UserModel]:
+        return [
+            self.users[id] for id in sorted(self.users) if after_id is None or id > after_id
+        ][:limit]
 
-class FakeUsersUnitOfWork(UsersUnitOfWork):
+
+class FakeUsersReadModel(UsersReadModel):
+    """
+    Read model, which builds rows from data of provided repository.
+    """
 
     def __init__(self, users_repository: UsersRepository) -> None:
+        self.users: UsersRepository = users_repository
+
+    async def get_user_account(self, user_id: int) -> Optional[UserAccountRow]:
+        user: Optional[UserModel] = await self.users.get(id=user_id)
+        return self._to_row(user=user) if user else None
+
+    async def get_all_users(self) -> List[UserAccountRow]:
+        return [self._to_row(user=user) for user in await self.users.list()]
+
+    async def get_all_users_ids(self) -> List[int]:
+        return [user.id for user in await self.users.list()]
+
+    async def get_users_ids_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[int]:
+        return [user.id for user in await self.users.list_page(after_id=after_id, limit=limit)]
+
+    @staticmethod
+    def _to_row(user: UserModel) -> UserAccountRow:
+        return (
+            user.id,
+            user.is_bot,
+            user.first_name,
+            user.role,
+            user.full_name,
+            user.url,
+            user.last_name,
+            user.username
+        )
+
+
+class FakeUsersUnitOfWork(UsersUnitOfWork):
+
+    def __init__(self, users_repository: UsersRepository, uses_replica: bool = False) -> None:
         super().__init__()
         self.users: UsersRepository = users_repository
+        self.read_model: UsersReadModel = FakeUsersReadModel(users_repository=users_repository)
         self.committed: bool = False
+        self._uses_replica: bool = uses_replica
+
+    def uses_replica(self) -> bool:
+        return self._uses_replica
 
     async def commit(self) -> None:
         self.committed = True
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 from src.users.constants import UserRoles
 from src.users.exceptions import UserNotFoundError
 from src.users.domain.models import UserModel
+from src.users.entrypoints.schemas import UserAccountScheme
+from src.units_of_work import UpdateUnitOfWork
 from tests.config import FakeUserConfig
 from src.users.entrypoints.dependencies import (
     register_user,
@@ -20,14 +22,15 @@ from src.users.entrypoints.dependencies import (
 async def test_register_user_success_without_existing_user(
         map_models_to_orm: None,
         message: Message,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(id=FakeUserConfig.ID))
     result: Optional[Row] = cursor.first()
     assert not result
 
-    user: UserModel = await register_user(message=message)
+    user: UserModel = await register_user(message=message, uow=update_unit_of_work)
 
     assert user.id == FakeUserConfig.ID
     assert user.username == FakeUserConfig.USERNAME
@@ -42,14 +45,15 @@ async def test_register_user_success_without_existing_user(
 async def test_register_user_success_with_existing_user(
         create_test_user: None,
         message: Message,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(id=FakeUserConfig.ID))
     result: Optional[Row] = cursor.first()
     assert result
 
-    user: UserModel = await register_user(message=message)
+    user: UserModel = await register_user(message=message, uow=update_unit_of_work)
 
     assert user.id == FakeUserConfig.ID
     assert user.username == FakeUserConfig.USERNAME
@@ -57,11 +61,15 @@ async def test_register_user_success_with_existing_user(
 
 
 @pytest.mark.anyio
-async def test_get_all_users_with_existing_user(create_test_user: None) -> None:
-    users: List[UserModel] = await get_all_users()
+async def test_get_all_users_with_existing_user(
+        create_test_user: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    users: List[UserAccountScheme] = await get_all_users(uow=update_unit_of_work)
     assert len(users) == 1
 
-    user: UserModel = users[0]
+    user: UserAccountScheme = users[0]
     assert user.id == FakeUserConfig.ID
     assert user.username == FakeUserConfig.USERNAME
     assert user.first_name == FakeUserConfig.FIRST_NAME
@@ -69,38 +77,56 @@ async def test_get_all_users_with_existing_user(create_test_user: None) -> None:
 
 
 @pytest.mark.anyio
-async def test_get_all_users_without_existing_users(map_models_to_orm: None) -> None:
-    users: List[UserModel] = await get_all_users()
+async def test_get_all_users_without_existing_users(
+        map_models_to_orm: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    users: List[UserAccountScheme] = await get_all_users(uow=update_unit_of_work)
     assert len(users) == 0
 
 
 @pytest.mark.anyio
-async def test_if_user_is_admin_with_default_role(create_test_user: None, message: Message) -> None:
-    assert not await check_if_user_is_admin(message)
+async def test_if_user_is_admin_with_default_role(
+        create_test_user: None,
+        message: Message,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    assert not await check_if_user_is_admin(message, uow=update_unit_of_work)
 
 
 @pytest.mark.anyio
 async def test_if_user_is_admin_with_admin_role(
         create_test_user: None,
         message: Message,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        update_unit_of_work: UpdateUnitOfWork
 ) -> None:
 
     await async_connection.execute(update(UserModel).values(role=UserRoles.ADMIN).filter_by(id=FakeUserConfig.ID))
     await async_connection.commit()
 
-    assert await check_if_user_is_admin(message)
+    assert await check_if_user_is_admin(message, uow=update_unit_of_work)
 
 
 @pytest.mark.anyio
-async def test_users_service_get_user_by_id_success(create_test_user: None) -> None:
-    found_user: UserModel = await get_user_by_id(id=FakeUserConfig.ID)
+async def test_users_service_get_user_by_id_success(
+        create_test_user: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
+    found_user: UserModel = await get_user_by_id(id=FakeUserConfig.ID, uow=update_unit_of_work)
     assert found_user.username == FakeUserConfig.USERNAME
     assert found_user.first_name == FakeUserConfig.FIRST_NAME
     assert found_user.id == FakeUserConfig.ID
 
 
 @pytest.mark.anyio
-async def test_users_service_get_user_by_id_fail(map_models_to_orm: None) -> None:
+async def test_users_service_get_user_by_id_fail(
+        map_models_to_orm: None,
+        update_unit_of_work: UpdateUnitOfWork
+) -> None:
+
     with pytest.raises(UserNotFoundError):
-        await get_user_by_id(id=FakeUserConfig.ID)
+        await get_user_by_id(id=FakeUserConfig.ID, uow=update_unit_of_work)
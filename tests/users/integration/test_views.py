@@ -1,7 +1,7 @@
 import pytest
 from typing import List
 
-from src.users.domain.models import UserModel
+from src.users.entrypoints.schemas import UserAccountScheme
 from src.users.exceptions import UserNotFoundError
 from src.users.interfaces import UsersUnitOfWork, UsersRepository
 from src.users.entrypoints.views import UsersViews
@@ -14,7 +14,7 @@ from tests.users.utils import create_fake_users_repository_instance
 async def test_users_views_get_user_account_success() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    user: UserModel = await UsersViews(uow=users_unit_of_work).get_user_account(user_id=FakeUserConfig.ID)
+    user: UserAccountScheme = await UsersViews(uow=users_unit_of_work).get_user_account(user_id=FakeUserConfig.ID)
     assert user.id == FakeUserConfig.ID
     assert user.username == FakeUserConfig.USERNAME
     assert user.first_name == FakeUserConfig.FIRST_NAME
@@ -33,9 +33,9 @@ async def test_users_views_get_user_account_fails_user_does_not_exist() -> None:
 async def test_users_views_get_all_users_with_existing_users() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    users: List[UserModel] = await UsersViews(uow=users_unit_of_work).get_all_users()
+    users: List[UserAccountScheme] = await UsersViews(uow=users_unit_of_work).get_all_users()
     assert len(users) == 1
-    user: UserModel = users[0]
+    user: UserAccountScheme = users[0]
     assert user.id == FakeUserConfig.ID
     assert user.username == FakeUserConfig.USERNAME
     assert user.first_name == FakeUserConfig.FIRST_NAME
@@ -46,5 +46,5 @@ async def test_users_views_get_all_users_with_existing_users() -> None:
 async def test_users_views_get_all_users_without_existing_users() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance()
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    users: List[UserModel] = await UsersViews(uow=users_unit_of_work).get_all_users()
+    users: List[UserAccountScheme] = await UsersViews(uow=users_unit_of_work).get_all_users()
     assert len(users) == 0
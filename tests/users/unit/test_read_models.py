@@ -0,0 +1,89 @@
+import pytest
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.users.adapters.read_models import SQLAlchemyUsersReadModel
+from src.users.interfaces.read_models import UserAccountRow
+from tests.config import FakeUserConfig
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_read_model_get_user_account_success(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_account: Optional[UserAccountRow] = await SQLAlchemyUsersReadModel(
+        session=session
+    ).get_user_account(
+        user_id=FakeUserConfig.ID
+    )
+
+    assert user_account == (
+        FakeUserConfig.ID,
+        FakeUserConfig.IS_BOT,
+        FakeUserConfig.FIRST_NAME,
+        FakeUserConfig.ROLE,
+        FakeUserConfig.FULL_NAME,
+        FakeUserConfig.URL,
+        FakeUserConfig.LAST_NAME,
+        FakeUserConfig.USERNAME
+    )
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_read_model_get_user_account_fail_user_does_not_exist(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user_account: Optional[UserAccountRow] = await SQLAlchemyUsersReadModel(
+        session=session
+    ).get_user_account(
+        user_id=FakeUserConfig.ID
+    )
+
+    assert user_account is None
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_read_model_get_all_users(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    users_accounts: List[UserAccountRow] = await SQLAlchemyUsersReadModel(session=session).get_all_users()
+    assert len(users_accounts) == 1
+    assert users_accounts[0][0] == FakeUserConfig.ID
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_read_model_get_all_users_ids(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    users_ids: List[int] = await SQLAlchemyUsersReadModel(session=session).get_all_users_ids()
+    assert users_ids == [FakeUserConfig.ID]
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_read_model_get_users_ids_page(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    read_model: SQLAlchemyUsersReadModel = SQLAlchemyUsersReadModel(session=session)
+
+    assert await read_model.get_users_ids_page(limit=10) == [FakeUserConfig.ID]
+    assert await read_model.get_users_ids_page(after_id=FakeUserConfig.ID, limit=10) == []
@@ -1,12 +1,17 @@
 import pytest
-from typing import Optional, List, Sequence
+from typing import Any, Dict, Optional, List, Sequence
 from sqlalchemy import select, CursorResult, Row
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 
+from src.core.cache import InMemoryCache, NamespacedCache, CacheStats
+from src.users.constants import UserRoles
 from src.users.domain.models import UserModel
-from src.users.adapters.repositories import SQLAlchemyUsersRepository
+from src.users.adapters.repositories import SQLAlchemyUsersRepository, CachedUsersRepository
+from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
 from tests.config import FakeUserConfig
+from tests.core.fake_objects import FailingCache
+from tests.users.fake_objects import FakeUsersRepository
 
 
 @pytest.mark.anyio
@@ -132,6 +137,38 @@ async def test_sqlalchemy_users_repository_empty_list(
     assert len(users_list) == 0
 
 
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_stream_and_list_page(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    users_repository: SQLAlchemyUsersRepository = SQLAlchemyUsersRepository(session=session)
+    for id in (3, 1, 2):
+        await users_repository.add(model=UserModel(**{**FakeUserConfig().to_dict(to_lower=True), 'id': id}))
+
+    streamed_users_ids: List[int] = [user.id async for user in users_repository.stream()]
+    assert streamed_users_ids == [1, 2, 3]
+
+    first_page: List[UserModel] = await users_repository.list_page(limit=2)
+    assert [user.id for user in first_page] == [1, 2]
+
+    second_page: List[UserModel] = await users_repository.list_page(after_id=first_page[-1].id, limit=2)
+    assert [user.id for user in second_page] == [3]
+
+    assert await users_repository.list_page(after_id=second_page[-1].id, limit=2) == []
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_stream_fail_within_read_only_unit_of_work(create_test_user: None) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(read_only=True, replica_session_factory=None)
+    async with uow:
+        with pytest.raises(AssertionError):
+            [user async for user in uow.users.stream()]
+
+
 @pytest.mark.anyio
 async def test_sqlalchemy_users_repository_delete_existing_user(
         create_test_user: None,
@@ -242,3 +279,65 @@ async def test_sqlalchemy_users_repository_update_non_existing_user(
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(NoResultFound):
         await SQLAlchemyUsersRepository(session=session).update(id=FakeUserConfig.ID, model=user)
+
+
+@pytest.mark.anyio
+async def test_cached_users_repository_caches_users_by_id() -> None:
+    cache: NamespacedCache = NamespacedCache(cache=InMemoryCache(max_size=10, default_ttl=60), namespace='users')
+    users_repository: FakeUsersRepository = FakeUsersRepository()
+    cached_users_repository: CachedUsersRepository = CachedUsersRepository(repository=users_repository, cache=cache)
+    await cached_users_repository.add(model=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+    await cached_users_repository.invalidate_changed()
+
+    assert await cached_users_repository.get(id=FakeUserConfig.ID)
+    assert cache.stats() == CacheStats(hits=0, misses=1)
+
+    users_repository.users.clear()
+    user: Optional[UserModel] = await cached_users_repository.get(id=FakeUserConfig.ID)
+    assert user and user.id == FakeUserConfig.ID
+    assert cache.stats() == CacheStats(hits=1, misses=1)
+
+
+@pytest.mark.anyio
+async def test_cached_users_repository_invalidates_changed_users_after_commit() -> None:
+    cache: NamespacedCache = NamespacedCache(cache=InMemoryCache(max_size=10, default_ttl=60), namespace='users')
+    cached_users_repository: CachedUsersRepository = CachedUsersRepository(
+        repository=FakeUsersRepository(),
+        cache=cache
+    )
+    user: UserModel = await cached_users_repository.add(model=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+    await cached_users_repository.get(id=user.id)
+    assert await cache.get(key=user.id) is None
+
+    await cached_users_repository.invalidate_changed()
+    await cached_users_repository.get(id=user.id)
+    assert await cache.get(key=user.id)
+
+    user.role = UserRoles.ADMIN
+    await cached_users_repository.update(id=user.id, model=user)
+    updated_user: Optional[UserModel] = await cached_users_repository.get(id=user.id)
+    assert updated_user and updated_user.role == UserRoles.ADMIN
+
+    # Cache keeps committed state till commit of changes:
+    cached_data: Optional[Dict[str, Any]] = await cache.get(key=user.id)
+    assert cached_data and cached_data['role'] == FakeUserConfig.ROLE
+
+    await cached_users_repository.invalidate_changed()
+    assert await cache.get(key=user.id) is None
+
+    await cached_users_repository.delete(id=user.id)
+    await cached_users_repository.invalidate_changed()
+    assert await cached_users_repository.get(id=user.id) is None
+
+
+@pytest.mark.anyio
+async def test_cached_users_repository_reads_users_from_repository_if_cache_fails() -> None:
+    cached_users_repository: CachedUsersRepository = CachedUsersRepository(
+        repository=FakeUsersRepository(),
+        cache=FailingCache()
+    )
+    user: UserModel = await cached_users_repository.add(model=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+
+    assert await cached_users_repository.get(id=user.id) == user
+    await cached_users_repository.delete(id=user.id)
+    assert await cached_users_repository.get(id=user.id) is None
@@ -1,13 +1,16 @@
+import asyncio
 import pytest
-from typing import List
+from typing import List, Optional
 
+from src.core.concurrency import SingleFlight
+from src.core.invalidation import InProcessInvalidationBus, InvalidationTopics
 from src.users.constants import ErrorDetails
 from src.users.exceptions import UserNotFoundError
 from src.users.interfaces.repositories import UsersRepository
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 from src.users.domain.models import UserModel
-from src.users.service_layer.service import UsersService
-from tests.users.fake_objects import FakeUsersUnitOfWork
+from src.users.service_layer.service import UsersService, UsersByIdFlight
+from tests.users.fake_objects import FakeUsersUnitOfWork, FakeUsersRepository
 from tests.config import FakeUserConfig
 from tests.users.utils import create_fake_users_repository_instance
 
@@ -48,6 +51,57 @@ async def test_users_service_get_user_by_id_fail() -> None:
         await users_service.get_user_by_id(id=FakeUserConfig.ID)
 
 
+@pytest.mark.anyio
+async def test_users_service_get_user_by_id_shares_concurrent_reads() -> None:
+    users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
+    flight: UsersByIdFlight = SingleFlight()
+    reads: List[int] = []
+    get = users_repository.get
+
+    async def spy_get(id: int) -> Optional[UserModel]:
+        reads.append(id)
+        return await get(id=id)
+
+    users_repository.get = spy_get  # type: ignore[method-assign]
+    users: List[UserModel] = await asyncio.gather(
+        *(
+            UsersService(uow=FakeUsersUnitOfWork(users_repository=users_repository), flight=flight).get_user_by_id(
+                id=FakeUserConfig.ID
+            ) for _ in range(3)
+        )
+    )
+
+    assert reads == [FakeUserConfig.ID]
+    assert all(user.id == FakeUserConfig.ID for user in users)
+    assert users[0] is not users[1]
+    assert len(flight) == 0
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_id_does_not_share_read_between_databases() -> None:
+    users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
+    flight: UsersByIdFlight = SingleFlight()
+    reads: List[int] = []
+    get = users_repository.get
+
+    async def spy_get(id: int) -> Optional[UserModel]:
+        reads.append(id)
+        return await get(id=id)
+
+    users_repository.get = spy_get  # type: ignore[method-assign]
+    await asyncio.gather(
+        UsersService(uow=FakeUsersUnitOfWork(users_repository=users_repository), flight=flight).get_user_by_id(
+            id=FakeUserConfig.ID
+        ),
+        UsersService(
+            uow=FakeUsersUnitOfWork(users_repository=users_repository, uses_replica=True),
+            flight=flight
+        ).get_user_by_id(id=FakeUserConfig.ID)
+    )
+
+    assert reads == [FakeUserConfig.ID, FakeUserConfig.ID]
+
+
 @pytest.mark.anyio
 async def test_users_service_get_user_by_first_name_success() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
@@ -170,3 +224,21 @@ async def test_users_service_get_all_users_without_existing_users() -> None:
 
     users: List[UserModel] = await users_service.get_all_users()
     assert len(users) == 0
+
+
+@pytest.mark.anyio
+async def test_users_service_register_user_publishes_invalidation() -> None:
+    keys: List[Optional[str]] = []
+
+    async def handler(key: Optional[str]) -> None:
+        keys.append(key)
+
+    bus: InProcessInvalidationBus = InProcessInvalidationBus()
+    bus.subscribe(topic=InvalidationTopics.USERS, handler=handler)
+    users_service: UsersService = UsersService(
+        uow=FakeUsersUnitOfWork(users_repository=FakeUsersRepository()),
+        bus=bus
+    )
+
+    await users_service.register_user(user=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+    assert keys == [str(FakeUserConfig.ID)]
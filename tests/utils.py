@@ -1,6 +1,15 @@
 import os
+from contextlib import asynccontextmanager
 from random import choice
 from string import ascii_uppercase
+from types import ModuleType
+from typing import AsyncGenerator, List, Optional, Tuple, Any
+from alembic.config import Config
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory, Script
+from sqlalchemy import event, Connection, CursorResult
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from src.core.database.config import database_config
 
@@ -10,5 +19,63 @@ def drop_test_db() -> None:
         os.remove(database_config.DATABASE_NAME)
 
 
+def get_script_directory() -> ScriptDirectory:
+    config: Config = Config()
+    config.set_main_option('script_location', 'alembic')
+    return ScriptDirectory.from_config(config)
+
+
+def get_migration(revision: str) -> ModuleType:
+    script: Optional[Script] = get_script_directory().get_revision(revision)
+    assert script is not None
+    return script.module
+
+
+def run_migrations(connection: Connection) -> None:
+    """
+    Applies all migrations to database of provided connection, without env.py of alembic, which reads database url
+    from environment files.
+    """
+
+    revisions: List[Script] = list(get_script_directory().walk_revisions(base='base', head='heads'))
+    with Operations.context(MigrationContext.configure(connection=connection)):
+        for revision in reversed(revisions):
+            revision.module.upgrade()
+
+
 def generate_random_string(length: int) -> str:
     return ''.join(choice(ascii_uppercase) for _ in range(length))
+
+
+@asynccontextmanager
+async def capture_statements(connection: AsyncConnection) -> AsyncGenerator[List[Tuple[str, Any]], None]:
+    """
+    Collects all (statement, parameters) pairs, which are sent to database through provided connection.
+    """
+
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+async def explain_query_plan(connection: AsyncConnection, statement: str, parameters: Any) -> str:
+    """
+    Returns query plan of provided statement for SQLite or PostgreSQL. For PostgreSQL sequential scans are disabled,
+    because planner prefers them to indexes on small test tables.
+    """
+
+    result: CursorResult
+    if connection.dialect.name == 'sqlite':
+        result = await connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        return '\n'.join(str(row[-1]) for row in result)
+
+    await connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    result = await connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+    return '\n'.join(str(row[0]) for row in result)